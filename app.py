@@ -1,10 +1,10 @@
 # app.py (at project root)
 
-from src.parse_resume import parse_resume
-from src.fetch_jobs import fetch_jobs
-from src.match_jobs import compute_similarity
-from src.generate_cover import generate_cover, save_cover_letter_docx
-from src.export_results import export_to_csv
+# The pipeline stages pull in pandas, PyMuPDF, requests, numpy and (later)
+# torch, so they are imported inside _run_pipeline; importing app, listing
+# resumes and prompting for a choice stays fast.
+from src.job_store import JobStore, resume_key as make_resume_key
+from src.profiling import RunProfiler, set_active_profiler
 
 # Import config with defaults for CI/testing
 try:
@@ -12,16 +12,38 @@ try:
 except ImportError:
     DEFAULT_RESUME = "data/your_resume.pdf"
 
+try:
+    from config import INCREMENTAL_RUNS
+except ImportError:
+    INCREMENTAL_RUNS = True
+
+try:
+    from config import JOB_INDEX_ENABLED
+except ImportError:
+    JOB_INDEX_ENABLED = True  # add embedded jobs to the on-disk job index (see src/vector_index.py); in hybrid mode only the shortlisted ones
+
+try:
+    from config import STREAM_PIPELINE
+except ImportError:
+    STREAM_PIPELINE = False  # stream jobs fetch -> score -> cover -> CSV instead of stage by stage
+
+try:
+    from config import PRELOAD_EMBEDDING_MODEL
+except ImportError:
+    PRELOAD_EMBEDDING_MODEL = True  # load the embedding model while the resume is parsed and jobs fetched
+
 from typing import Optional, List
 from datetime import datetime
 import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import time
 
 def send_email_alert(watchlist_matches, email_config=None):
     """
-    Send email alerts for company watchlist matches.
+    Queue email alerts for company watchlist matches (a DataFrame of exported
+    rows). The email is sent in the background over a reused SMTP connection
+    (see src/alerts.py), so the pipeline does not wait for it; matches are
+    alerted once and, with ALERT_DIGEST_INTERVAL, coalesced into digests.
+    `email_config` (a dict) overrides settings from email_config.py.
     
     To enable email alerts, create email_config.py with:
     EMAIL_ENABLED = True
@@ -31,54 +53,70 @@ def send_email_alert(watchlist_matches, email_config=None):
     SENDER_PASSWORD = "your_app_password"
     RECIPIENT_EMAIL = "your_email@gmail.com"
     """
+    from src.alerts import queue_watchlist_alert
+
     try:
-        if email_config is None:
-            try:
-                from email_config import EMAIL_ENABLED, SMTP_SERVER, SMTP_PORT, SENDER_EMAIL, SENDER_PASSWORD, RECIPIENT_EMAIL
-                if not EMAIL_ENABLED:
-                    print("   (Email alerts disabled in config)")
-                    return
-            except ImportError:
-                print("   (Email config not found - create email_config.py to enable alerts)")
-                return
-        
-        # Create email content
-        subject = f"🎯 Job Alert: {len(watchlist_matches)} Watchlist Match(es) Found!"
-        
-        body = "Hello!\n\n"
-        body += f"Your AI Job Agent found {len(watchlist_matches)} job(s) from your watchlist companies:\n\n"
-        
-        for idx, row in watchlist_matches.iterrows():
-            body += f"📌 {row['company']}\n"
-            body += f"   Position: {row['title']}\n"
-            body += f"   Location: {row['location']}\n"
-            body += f"   Match Score: {row['similarity']:.2%}\n"
-            body += f"   URL: {row['link']}\n\n"
-        
-        body += "Cover letters have been generated for all matches.\n\n"
-        body += "Best regards,\nYour AI Job Agent"
-        
-        # Send email
-        msg = MIMEMultipart()
-        msg['From'] = SENDER_EMAIL
-        msg['To'] = RECIPIENT_EMAIL
-        msg['Subject'] = subject
-        msg.attach(MIMEText(body, 'plain'))
-        
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(SENDER_EMAIL, SENDER_PASSWORD)
-            server.send_message(msg)
-        
-        print(f"   ✓ Email alert sent to {RECIPIENT_EMAIL}")
-        
+        matches = [
+            {k: row[k] for k in ("job_id", "company", "title", "location", "similarity", "link") if k in row}
+            for _, row in watchlist_matches.iterrows()
+        ]
+        return queue_watchlist_alert(matches, email_config=email_config)
     except Exception as e:
-        print(f"   ⚠ Failed to send email alert: {e}")
+        print(f"   ⚠ Failed to queue email alert: {e}")
+        return 0
+
+def run_pipeline(resume_path: Optional[str] = None, query: Optional[str] = None, location: str = "", generate_covers: bool = True, output_csv: Optional[str] = None, company_watchlist: Optional[List[str]] = None, incremental: Optional[bool] = None, profile: Optional[str] = None, stream: Optional[bool] = None):
+    """
+    Run the full pipeline for one resume.
+
+    With `incremental` (default: INCREMENTAL_RUNS) every job is recorded in the
+    persistent job store, only new or changed postings are scored and get cover
+    letters, and a run that crashed is resumed from its last completed stage.
+
+    Every stage is timed (wall, CPU, peak RSS) and a JSON/CSV run report is
+    written to REPORTS_DIR; `profile` ("cprofile" or "pyinstrument", default
+    PROFILE_MODE) additionally dumps a profile of the whole run.
+
+    With `stream` (default: STREAM_PIPELINE) jobs flow through the stages as
+    they are fetched instead of stage by stage: see _stream_pipeline. The CSV
+    is then written row by row in arrival order and (None, csv path) is
+    returned, since no DataFrame of the results is ever built.
+    """
+    profiler = RunProfiler("pipeline", mode=profile)
+    set_active_profiler(profiler)
+    profiler.start_profiling()
+    try:
+        return _run_pipeline(profiler, resume_path, query, location, generate_covers, output_csv, company_watchlist, incremental, stream)
+    finally:
+        set_active_profiler(None)
+        report_path = profiler.finish()
+        profiler.print_summary()
+        if report_path:
+            print(f"✓ Run report saved to: {report_path}")
+
+def _run_pipeline(profiler: RunProfiler, resume_path, query, location, generate_covers, output_csv, company_watchlist, incremental, stream=None):
+    from src.parse_resume import parse_resume
+    from src.fetch_jobs import fetch_jobs
+    from src.match_jobs import score_jobs, preload_model, save_job_index
+    from src.generate_cover import get_llm_stats, reset_llm_stats, unload_llm
+    from src.cover_workers import generate_covers_parallel
+    from src.export_results import export_to_csv
+    from src.watchlist import get_watchlist_matcher
 
-def run_pipeline(resume_path: Optional[str] = None, query: Optional[str] = None, location: str = "", generate_covers: bool = True, output_csv: Optional[str] = None, company_watchlist: Optional[List[str]] = None):
     resume_path = resume_path or DEFAULT_RESUME
+    incremental = INCREMENTAL_RUNS if incremental is None else incremental
+    stream = STREAM_PIPELINE if stream is None else stream
+    if stream and incremental:
+        print("(Streaming mode: the incremental job store is not used)")
+        incremental = False
+    if PRELOAD_EMBEDDING_MODEL:
+        # the model is only needed for scoring; loading it now overlaps
+        # torch's import and the weights load with parsing and fetching
+        preload_model()
     print("[1/6] Parsing resume:", resume_path)
+    profiler.begin("parse_resume")
     resume_summary = parse_resume(resume_path)
+    profiler.end()
     print("Found skills:", resume_summary.get("skills"))
     
     # Auto-detect job role from resume if no query provided
@@ -92,21 +130,77 @@ def run_pipeline(resume_path: Optional[str] = None, query: Optional[str] = None,
     # Ensure query is a string at this point
     assert query is not None, "Query must be provided or auto-detected"
     
+    # Persistent job store: resume an interrupted run or start a new one
+    store, run_id, stage, rkey = None, None, "started", None
+    if incremental:
+        store = JobStore()
+        rkey = make_resume_key(resume_summary.get("raw_text", ""))
+        run_id, stage = store.start_run(rkey, query, location)
+        if stage != "started":
+            print(f"Resuming interrupted run #{run_id} after stage '{stage}'")
+            output_csv = output_csv or store.run_output_csv(run_id)
+
     # Generate unique filename with timestamp if not provided
     if output_csv is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         job_type_clean = query.replace(" ", "_").replace("/", "-")
         output_csv = f"outputs/jobs_{job_type_clean}_{timestamp}.csv"
         os.makedirs("outputs", exist_ok=True)
+    if store:
+        store.set_stage(run_id, stage, output_csv=output_csv)
     
+    if stream:
+        return _stream_pipeline(profiler, resume_summary, query, location, generate_covers, output_csv, company_watchlist)
+
     # Initialize cover letters folder variable
     cover_letters_folder = None
     
-    print(f"[2/6] Fetching jobs for query: {query}")
-    jobs = fetch_jobs(query, location=location, page=1)
+    if store and store.stage_reached(stage, "fetch"):
+        jobs = store.run_jobs(run_id, rkey)
+        print(f"[2/6] Reusing {len(jobs)} jobs fetched before the interruption")
+    else:
+        print(f"[2/6] Fetching jobs for query: {query}")
+        profiler.begin("fetch_jobs")
+        jobs = fetch_jobs(query, location=location, page=1)
+        profiler.end()
+        if store:
+            changed = store.record_fetched(run_id, rkey, jobs)
+            store.set_stage(run_id, "fetch")
+            print(f"  {changed} new or changed posting(s), {len(jobs) - changed} already processed")
+            jobs = store.run_jobs(run_id, rkey)
     
-    print(f"Got {len(jobs)} jobs — computing similarity...")
-    enriched = compute_similarity(resume_summary.get("raw_text", ""), jobs, top_k=len(jobs))
+    if store:
+        from src.scoring import SCORING_MODE
+        if SCORING_MODE == "hybrid":
+            # hybrid scores are scaled to the set scored together (BM25 relative to
+            # the best job), so stored scores from earlier runs are not comparable:
+            # rescore the whole run (embeddings come from the cache)
+            to_score = list(jobs)
+        else:
+            # Only postings without a stored score need the embedding model
+            to_score = [job for job in jobs if job.get("similarity") is None]
+        print(f"Got {len(jobs)} jobs — computing similarity for {len(to_score)}...")
+        if to_score:
+            profiler.begin("compute_similarity")
+            scored = score_jobs(resume_summary, to_score, top_k=len(to_score), add_to_index=JOB_INDEX_ENABLED)
+            profiler.end()
+            scores = {job["id"]: job["similarity"] for job in scored}
+            store.save_scores(rkey, scores)
+            for job in jobs:
+                if job["id"] in scores:
+                    job["similarity"] = scores[job["id"]]
+        enriched = sorted(jobs, key=lambda j: j["similarity"], reverse=True)
+        store.set_stage(run_id, "score")
+    else:
+        print(f"Got {len(jobs)} jobs — computing similarity...")
+        profiler.begin("compute_similarity")
+        enriched = score_jobs(resume_summary, jobs, top_k=len(jobs), add_to_index=JOB_INDEX_ENABLED)
+        profiler.end()
+    if JOB_INDEX_ENABLED:
+        try:
+            save_job_index()
+        except Exception as e:
+            print(f"  Warning: could not save job index: {e}")
     
     if generate_covers:
         print("[3/6] Generating cover letters for top matches (this may take time if using local LLM)…")
@@ -117,45 +211,73 @@ def run_pipeline(resume_path: Optional[str] = None, query: Optional[str] = None,
         clean_name = str(resume_name).replace(" ", "_").replace("/", "-").replace("\\", "-")
         cover_letters_folder = f"cover_letters/{clean_name}_{today_date}"
         os.makedirs(cover_letters_folder, exist_ok=True)
+        reset_llm_stats()
         
-        for i, job in enumerate(enriched):
-            try:
-                print(f"  Generating cover letter {i+1}/{len(enriched)}...")
-                # Use GPT4All for cover letter generation
-                cover = generate_cover(resume_summary, job, prefer_local_llm=True)
-                job["cover_letter"] = cover
-                
-                # Save as DOCX file in timestamped folder
-                try:
-                    save_cover_letter_docx(cover, job, resume_summary, output_dir=cover_letters_folder)
-                except Exception as docx_error:
-                    print(f"  Warning: Failed to save DOCX for {job.get('title', 'Unknown')}: {docx_error}")
-                    
-            except Exception as e:
-                print(f"  Failed to generate cover letter for {job.get('title', 'Unknown')}: {e}")
-                job["cover_letter"] = "Failed to generate cover letter."
+        pending = []
+        for job in enriched:
+            if store and job.get("cover_status") == "done" and job.get("docx_path") and os.path.exists(job["docx_path"]):
+                continue
+            pending.append(job)
+        skipped = len(enriched) - len(pending)
+        print(f"  Generating {len(pending)} cover letter(s)...")
+        # Use GPT4All for cover letter generation (template fallback), in parallel
+        # one stage for generation + DOCX writing, which run together in the workers;
+        # their separate per-letter times are in the "generate" / "save_cover_letter_docx" latencies
+        profiler.begin("generate_cover")
+        results = generate_covers_parallel(resume_summary, pending, cover_letters_folder, prefer_local_llm=True)
+        profiler.end()
+        for job, result in zip(pending, results):
+            job["cover_letter"] = result["cover"]
+            job["docx_path"] = result["docx_path"]
+            if result["error"] and not result["docx_path"]:
+                print(f"  Failed to generate cover letter for {job.get('title', 'Unknown')}: {result['error']}")
+            if store:
+                status = "done" if result["docx_path"] else "failed"
+                store.save_cover(rkey, job["id"], status, job.get("cover_letter"), result["docx_path"])
+        if skipped:
+            print(f"  Skipped {skipped} job(s) with cover letters from earlier runs")
         
+        # Free the model memory now that every letter for this run is done
+        unload_llm()
+        llm_stats = get_llm_stats()
+        profiler.meta["llm"] = llm_stats
+        if llm_stats["loads"]:
+            print(f"  LLM load time: {llm_stats['load_seconds']:.1f}s | "
+                  f"generation: {llm_stats['generate_seconds']:.1f}s for {llm_stats['letters']} letter(s) "
+                  f"(avg {llm_stats['avg_generate_seconds']:.1f}s/letter)")
+            print(f"  Time to first token: {llm_stats['avg_first_token_seconds']:.2f}s avg | "
+                  f"{llm_stats['tokens_per_second']:.1f} tokens/s | "
+                  f"stopped at signature: {llm_stats['stopped_at_signature']}, at time budget: {llm_stats['stopped_at_budget']}")
+            if llm_stats["prefix_evals"]:
+                print(f"  Prompt prefix: evaluated {llm_stats['prefix_evals']}x ({llm_stats['prefix_seconds']:.1f}s), "
+                      f"reused for {llm_stats['prefix_reuses']} letter(s)")
         print(f"  ✓ Cover letters saved to: {cover_letters_folder}")
+        if store:
+            store.set_stage(run_id, "cover")
     else:
         print("[3/6] Skipping cover letter generation (disabled)")
 
     print("[5/6] Exporting results to CSV")
+    profiler.begin("export_to_csv")
     df = export_to_csv(enriched, path=output_csv)
+    profiler.end()
+    _export_dataset(profiler, enriched, query, resume_summary.get("name") or "Candidate")
+    if store:
+        store.set_stage(run_id, "export")
 
     # Check for company watchlist matches and send alerts
     if company_watchlist:
-        # Fuzzy matching: check if any watchlist company name is contained in job company name or vice versa
-        watchlist_matches = df[df['company'].apply(
-            lambda job_company: any(
-                watchlist_name.lower() in str(job_company).lower() or 
-                str(job_company).lower() in watchlist_name.lower()
-                for watchlist_name in company_watchlist
-            )
-        )]
+        # exact / prefix / fuzzy match on normalized company names (see src/watchlist.py)
+        watchlist_matches = get_watchlist_matcher(company_watchlist).filter(df)
         if len(watchlist_matches) > 0:
-            print(f"\n   🎯 Sending email alerts for {len(watchlist_matches)} watchlist match(es)...")
+            print(f"\n   🎯 Queuing email alerts for {len(watchlist_matches)} watchlist match(es)...")
+            profiler.begin("email_alert")
             send_email_alert(watchlist_matches)
+            profiler.end()
 
+    if store:
+        store.set_stage(run_id, "done")
+        store.close()
     print(f"[6/6] Done. Saved {df.shape[0]} jobs to CSV.")
     print(f"\n" + "="*70)
     print(f"✓ CSV saved to: {output_csv}")
@@ -164,6 +286,254 @@ def run_pipeline(resume_path: Optional[str] = None, query: Optional[str] = None,
     print("="*70)
     return df, output_csv
 
+def _export_dataset(profiler: RunProfiler, jobs, query, resume):
+    """Append this run's results to the partitioned dataset (EXPORT_DATASET_FORMAT), when pyarrow is installed."""
+    from src.export_results import dataset_available, export_to_dataset, EXPORT_DATASET_FORMAT
+    if not EXPORT_DATASET_FORMAT or not jobs:
+        return
+    if not dataset_available():
+        print("  (pyarrow not installed: skipping the dataset export; the CSV is complete)")
+        return
+    profiler.begin("export_dataset")
+    try:
+        paths = export_to_dataset(jobs, query, resume=str(resume))
+        print(f"  ✓ {len(jobs)} row(s) appended to the {EXPORT_DATASET_FORMAT} dataset: {os.path.dirname(paths[0])}")
+    except Exception as e:
+        print(f"  Warning: dataset export failed: {e}")
+    finally:
+        profiler.end()
+
+def _stream_pipeline(profiler: RunProfiler, resume_summary, query, location, generate_covers, output_csv, company_watchlist):
+    """
+    Streaming variant of the pipeline stages after resume parsing:
+
+        stream_jobs -> micro_batches -> stream_similarity -> stream_covers -> CSVRowWriter
+
+    Fetching, scoring and cover generation each run in their own thread(s),
+    connected by bounded queues (STREAM_QUEUE_SIZE), so memory stays bounded
+    whatever the number of results and the first rows reach the CSV while
+    later pages are still being fetched. Jobs are scored by embedding
+    similarity in micro-batches of STREAM_BATCH_SIZE; rows are written in
+    arrival order rather than sorted by score.
+    """
+    from src.fetch_jobs import stream_jobs
+    from src.match_jobs import stream_similarity, save_job_index
+    from src.generate_cover import get_llm_stats, reset_llm_stats, unload_llm
+    from src.cover_workers import stream_covers
+    from src.export_results import CSVRowWriter, DatasetWriter, dataset_available
+    from src.streaming import bounded, micro_batches
+    from src.watchlist import get_watchlist_matcher
+
+    cover_letters_folder = None
+    print(f"[2/6] Streaming jobs for query: {query} (fetch -> score -> cover letters -> CSV)")
+    jobs = micro_batches(stream_jobs(query, location=location, page=1), name="fetch-jobs")
+    scored = bounded(
+        stream_similarity(resume_summary.get("raw_text", ""), jobs, add_to_index=JOB_INDEX_ENABLED),
+        name="score-jobs",
+    )
+    if generate_covers:
+        today_date = datetime.now().strftime("%Y-%m-%d")
+        clean_name = str(resume_summary.get("name") or "Candidate").replace(" ", "_").replace("/", "-").replace("\\", "-")
+        cover_letters_folder = f"cover_letters/{clean_name}_{today_date}"
+        os.makedirs(cover_letters_folder, exist_ok=True)
+        print("[3/6] Generating cover letters as jobs are scored…")
+        reset_llm_stats()
+        results = stream_covers(resume_summary, scored, cover_letters_folder, prefer_local_llm=True)
+    else:
+        print("[3/6] Skipping cover letter generation (disabled)")
+        results = ((job, None) for job in scored)
+
+    # Only watchlist hits are kept in memory, for the alert at the end
+    watchlist = get_watchlist_matcher(company_watchlist) if company_watchlist else None
+    watchlist_rows = []
+    # rows also go to the partitioned dataset, a chunk (EXPORT_DATASET_CHUNK_ROWS) at a time
+    dataset = DatasetWriter(query, resume=resume_summary.get("name") or "Candidate") if dataset_available() else None
+    start = time.perf_counter()
+    profiler.begin("stream_pipeline")
+    with CSVRowWriter(output_csv) as writer:
+        for job, result in results:
+            if result is not None:
+                job["cover_letter"] = result["cover"]
+                job["docx_path"] = result["docx_path"]
+                if result["error"] and not result["docx_path"]:
+                    print(f"  Failed to generate cover letter for {job.get('title', 'Unknown')}: {result['error']}")
+            writer.write(job)
+            if dataset is not None:
+                dataset.write(job)
+            if writer.rows == 1:
+                profiler.meta["first_result_s"] = round(time.perf_counter() - start, 3)
+                print(f"  First result written after {profiler.meta['first_result_s']:.2f}s")
+            if watchlist is not None and watchlist.match(job.get("company")) is not None:
+                watchlist_rows.append(job)
+    profiler.end()
+    rows = writer.rows
+    if dataset is not None:
+        try:
+            dataset.close()
+            if dataset.rows:
+                print(f"  ✓ {dataset.rows} row(s) appended to the {dataset.fmt} dataset: {dataset.directory}")
+        except Exception as e:
+            print(f"  Warning: dataset export failed: {e}")
+    if generate_covers:
+        unload_llm()
+        profiler.meta["llm"] = get_llm_stats()
+        print(f"  ✓ Cover letters saved to: {cover_letters_folder}")
+    if JOB_INDEX_ENABLED:
+        try:
+            save_job_index()
+        except Exception as e:
+            print(f"  Warning: could not save job index: {e}")
+
+    if watchlist_rows:
+        import pandas as pd
+        from src.export_results import csv_row
+        watchlist_matches = pd.DataFrame([csv_row(job) for job in watchlist_rows])
+        print(f"\n   🎯 Queuing email alerts for {len(watchlist_matches)} watchlist match(es)...")
+        profiler.begin("email_alert")
+        send_email_alert(watchlist_matches)
+        profiler.end()
+
+    profiler.meta["jobs"] = rows
+    print(f"[6/6] Done. Streamed {rows} jobs to CSV.")
+    print(f"\n" + "="*70)
+    print(f"✓ CSV saved to: {output_csv}")
+    if generate_covers:
+        print(f"✓ Cover letters saved to: {cover_letters_folder}")
+    print("="*70)
+    return None, output_csv
+
+def run_batch(data_dir: str = "data", location: str = "", generate_covers: bool = True, company_watchlist: Optional[List[str]] = None, profile: Optional[str] = None):
+    """
+    Run the pipeline for every resume in `data_dir` in one pass.
+
+    Resumes are parsed in parallel, each distinct target role is fetched once,
+    every job description is encoded once and all resumes are scored against
+    all jobs with a single matrix product. Each resume then gets its own CSV
+    (the jobs fetched for its target role, best match first) and cover
+    letters; the local LLM stays loaded across resumes. Returns
+    {resume path: (DataFrame, csv path)}.
+    """
+    profiler = RunProfiler("batch", mode=profile)
+    set_active_profiler(profiler)
+    profiler.start_profiling()
+    try:
+        return _run_batch(profiler, data_dir, location, generate_covers, company_watchlist)
+    finally:
+        set_active_profiler(None)
+        report_path = profiler.finish()
+        profiler.print_summary()
+        if report_path:
+            print(f"✓ Run report saved to: {report_path}")
+
+def _run_batch(profiler: RunProfiler, data_dir, location, generate_covers, company_watchlist):
+    from concurrent.futures import ThreadPoolExecutor
+    from src.parse_resume import parse_resumes
+    from src.fetch_jobs import fetch_jobs
+    from src.match_jobs import score_matrix, rank_jobs, preload_model, save_job_index
+    from src.generate_cover import get_llm_stats, reset_llm_stats, unload_llm
+    from src.cover_workers import generate_covers_parallel
+    from src.export_results import export_to_csv
+    from src.watchlist import get_watchlist_matcher
+
+    if PRELOAD_EMBEDDING_MODEL:
+        preload_model()
+    paths = [os.path.join(data_dir, f) for f in sorted(get_resume_files(data_dir))]
+    print(f"[1/6] Parsing {len(paths)} resume(s) from {data_dir}")
+    profiler.begin("parse_resume")
+    parsed = parse_resumes(paths)
+    profiler.end()
+    resumes = [(path, r) for path, r in zip(paths, parsed) if r]
+    if not resumes:
+        print("❌ No resumes could be parsed.")
+        return {}
+    for path, r in resumes:
+        print(f"  {os.path.basename(path)}: {r.get('target_role') or 'data analyst'} ({len(r.get('skills') or [])} skills)")
+
+    # Each distinct target role is fetched once, whatever the number of resumes
+    queries = list(dict.fromkeys(str(r.get("target_role") or "data analyst") for _, r in resumes))
+    print(f"[2/6] Fetching jobs for {len(queries)} distinct role(s): {', '.join(queries)}")
+    profiler.begin("fetch_jobs")
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        fetched = dict(zip(queries, pool.map(lambda q: fetch_jobs(q, location=location, page=1), queries)))
+    profiler.end()
+    jobs, column = [], {}
+    for q in queries:
+        for job in fetched[q]:
+            key = str(job.get("id"))
+            if key not in column:
+                column[key] = len(jobs)
+                jobs.append(job)
+    print(f"  {len(jobs)} unique job(s) across all roles")
+
+    print(f"Computing a {len(resumes)} x {len(jobs)} similarity matrix...")
+    profiler.begin("compute_similarity")
+    scores = score_matrix([r for _, r in resumes], jobs, add_to_index=JOB_INDEX_ENABLED)
+    profiler.end()
+    if JOB_INDEX_ENABLED:
+        try:
+            save_job_index()
+        except Exception as e:
+            print(f"  Warning: could not save job index: {e}")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    batch_dir = f"outputs/batch_{timestamp}"
+    os.makedirs(batch_dir, exist_ok=True)
+    if generate_covers:
+        reset_llm_stats()
+    results, frames = {}, []
+    for row, (path, resume_summary) in enumerate(resumes):
+        query = str(resume_summary.get("target_role") or "data analyst")
+        own = [column[str(job.get("id"))] for job in fetched[query]]
+        # jobs of one role are shared between its resumes: rank copies, each gets its own scores and letters
+        enriched = rank_jobs([jobs[i] for i in own], scores[row, own], len(own), copy=True)
+        resume_name = str(resume_summary.get("name") or "Candidate")
+        # name outputs after the file: several resumes may belong to one person
+        file_tag = os.path.basename(path).replace(".", "_").replace(" ", "_")
+        print(f"\n[3/6] {resume_name} ({os.path.basename(path)}): {len(enriched)} job(s) for '{query}'")
+
+        if generate_covers:
+            cover_letters_folder = f"cover_letters/{file_tag}_{datetime.now().strftime('%Y-%m-%d')}"
+            os.makedirs(cover_letters_folder, exist_ok=True)
+            profiler.begin("generate_cover")
+            covers = generate_covers_parallel(resume_summary, enriched, cover_letters_folder, prefer_local_llm=True)
+            profiler.end()
+            for job, result in zip(enriched, covers):
+                job["cover_letter"] = result["cover"]
+                job["docx_path"] = result["docx_path"]
+                if result["error"] and not result["docx_path"]:
+                    print(f"  Failed to generate cover letter for {job.get('title', 'Unknown')}: {result['error']}")
+            print(f"  ✓ Cover letters saved to: {cover_letters_folder}")
+
+        output_csv = f"{batch_dir}/jobs_{file_tag}_{query.replace(' ', '_').replace('/', '-')}.csv"
+        profiler.begin("export_to_csv")
+        df = export_to_csv(enriched, path=output_csv)
+        profiler.end()
+        print(f"[5/6] ✓ CSV saved to: {output_csv}")
+        _export_dataset(profiler, enriched, query, file_tag)
+        results[path] = (df, output_csv)
+        frames.append(df)
+
+    if generate_covers:
+        # one model load served every resume; free it now
+        unload_llm()
+        profiler.meta["llm"] = get_llm_stats()
+
+    # One alert for the whole cohort, each watchlist posting listed once
+    if company_watchlist and frames:
+        import pandas as pd
+        df_all = pd.concat(frames, ignore_index=True).drop_duplicates("job_id")
+        watchlist_matches = get_watchlist_matcher(company_watchlist).filter(df_all)
+        if len(watchlist_matches) > 0:
+            print(f"\n   🎯 Queuing email alerts for {len(watchlist_matches)} watchlist match(es)...")
+            profiler.begin("email_alert")
+            send_email_alert(watchlist_matches)
+            profiler.end()
+
+    profiler.meta["resumes"] = len(resumes)
+    profiler.meta["jobs"] = len(jobs)
+    print(f"\n[6/6] Done. {len(resumes)} resume(s) x {len(jobs)} job(s); results in {batch_dir}")
+    return results
+
 def get_resume_files(data_dir="data"):
     """Get all resume files from the data directory"""
     resume_extensions = ['.pdf', '.docx', '.txt']
@@ -207,16 +577,22 @@ def select_resume(resume_files):
                 print("⚠️  Please enter a valid number")
 
 if __name__ == "__main__":
+    import sys
+    if "--batch" in sys.argv:
+        # Every resume in data/ in one pass
+        run_batch("data")
+        sys.exit(0)
+    stream = True if "--stream" in sys.argv else None
     # Check for multiple resumes and let user select if needed
     resume_files = get_resume_files("data")
     if resume_files:
         selected_resume_path = select_resume(resume_files)
         if selected_resume_path:
             print(f"\n📄 Using resume: {selected_resume_path}\n")
-            run_pipeline(resume_path=selected_resume_path)
+            run_pipeline(resume_path=selected_resume_path, stream=stream)
         else:
             print("❌ No resume selected. Exiting.")
     else:
         # Fallback to default resume from config
         print(f"📄 Using default resume from config: {DEFAULT_RESUME}\n")
-        run_pipeline()
\ No newline at end of file
+        run_pipeline(stream=stream)
\ No newline at end of file
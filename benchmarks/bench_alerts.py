@@ -0,0 +1,171 @@
+# benchmarks/bench_alerts.py
+"""
+Alert sending benchmark against a local stand-in SMTP server: one connection
+per alert (the original send_email_alert) versus the AlertDispatcher, which
+reuses one connection for everything queued.
+
+Usage: python benchmarks/bench_alerts.py [--alerts 50] [--setup-ms 150]
+
+The stand-in server accepts any mail and delays its greeting by --setup-ms to
+stand in for the TCP + STARTTLS + login round trips of a real provider. The
+same server (or aiosmtpd's) can be used to try alerts end to end: point
+email_config.py at it with SMTP_USE_TLS = False and no SENDER_PASSWORD.
+
+Afterwards the digest path is checked end to end through the stand-in
+server: one email per recipient, every match marked sent, and nothing sent
+twice when the same matches are found again. The script exits with an
+error if any of that fails.
+"""
+
+import argparse
+import os
+import shutil
+import smtplib
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.alerts import AlertDispatcher, AlertStore, build_alert_message, queue_watchlist_alert  # noqa: E402
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT."""
+
+    def _reply(self, line: str):
+        self.wfile.write((line + "\r\n").encode("ascii"))
+
+    def handle(self):
+        rcpts = []
+        time.sleep(self.server.setup_delay)
+        self._reply("220 localhost stand-in SMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            cmd = line.decode("utf-8", "replace").strip().upper()
+            if cmd.startswith("EHLO"):
+                self._reply("250-localhost")
+                self._reply("250 8BITMIME")
+            elif cmd.startswith("HELO"):
+                self._reply("250 localhost")
+            elif cmd.startswith(("MAIL", "RSET")):
+                rcpts = []
+                self._reply("250 OK")
+            elif cmd.startswith("RCPT"):
+                rcpts.append(cmd.split(":", 1)[-1].strip(" <>").lower())
+                self._reply("250 OK")
+            elif cmd.startswith("NOOP"):
+                self._reply("250 OK")
+            elif cmd == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                    pass
+                with self.server.lock:
+                    self.server.received += 1
+                    self.server.recipients.extend(rcpts)
+                self._reply("250 OK queued")
+            elif cmd == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class SinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, setup_delay: float):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.setup_delay = setup_delay
+        self.received = 0
+        self.recipients = []   # RCPT TO of every message received, in order
+        self.lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+def start_sink(setup_delay: float) -> SinkServer:
+    server = SinkServer(setup_delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def sample_matches(n: int):
+    return [{"job_id": f"job-{i}", "company": "Acme Corp", "title": "Data Analyst", "location": "Remote",
+             "similarity": 0.8, "link": f"https://example.com/jobs/{i}"} for i in range(n)]
+
+
+def check_digests(server: SinkServer) -> bool:
+    """Alert two recipients through `server` twice; True if each got exactly one digest."""
+    workdir = tempfile.mkdtemp(prefix="bench_alerts_")
+    store = AlertStore(os.path.join(workdir, "alerts.sqlite"))
+    recipients = ["a@example.com", "b@example.com"]
+    matches = sample_matches(4)
+    try:
+        before = len(server.recipients)
+        for _ in range(2):   # the second run finds the same postings again
+            for rcpt in recipients:
+                cfg = {"EMAIL_ENABLED": True, "SMTP_SERVER": "127.0.0.1", "SMTP_PORT": server.port,
+                       "SMTP_USE_TLS": False, "SENDER_EMAIL": "agent@example.com", "RECIPIENT_EMAIL": rcpt}
+                dispatcher = AlertDispatcher(cfg, max_retries=0, batch_window=0.1, verbose=False)
+                queue_watchlist_alert(matches, cfg, store=store, dispatcher=dispatcher)
+                dispatcher.close(10)
+        got = server.recipients[before:]
+        statuses = dict(store._conn.execute("SELECT status, COUNT(*) FROM matches GROUP BY status").fetchall())
+    finally:
+        store.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+    ok = sorted(got) == recipients and statuses == {"sent": len(matches) * len(recipients)}
+    print(f"\ndigest check: {'ok' if ok else 'FAILED'} (emails to {sorted(got)}, match statuses {statuses})")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alerts", type=int, default=50)
+    parser.add_argument("--setup-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    server = start_sink(args.setup_ms / 1000)
+    cfg = {"SMTP_SERVER": "127.0.0.1", "SMTP_PORT": server.port, "SMTP_USE_TLS": False,
+           "SENDER_EMAIL": "agent@example.com", "RECIPIENT_EMAIL": "me@example.com"}
+    messages = [build_alert_message(sample_matches(3), cfg) for _ in range(args.alerts)]
+
+    start = time.perf_counter()
+    for msg in messages:
+        with smtplib.SMTP(cfg["SMTP_SERVER"], cfg["SMTP_PORT"]) as smtp:
+            smtp.send_message(msg)
+    per_alert = time.perf_counter() - start
+
+    dispatcher = AlertDispatcher(cfg, batch_window=0.5, verbose=False)
+    start = time.perf_counter()
+    for msg in messages:
+        dispatcher.submit(msg)
+    submit = time.perf_counter() - start
+    dispatcher.flush()
+    reused = time.perf_counter() - start
+    dispatcher.close()
+
+    print(f"{args.alerts} alerts, {args.setup_ms:g} ms connection setup, {server.received} received")
+    print(f"  connection per alert : {per_alert:7.2f}s")
+    print(f"  dispatcher           : {reused:7.2f}s over {dispatcher.stats['connections']} connection(s) "
+          f"({reused / per_alert:.1%} of the time)")
+    print(f"  caller blocked for   : {submit * 1000:7.2f} ms in submit()")
+
+    server.setup_delay = 0
+    ok = check_digests(server)
+    server.shutdown()
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
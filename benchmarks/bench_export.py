@@ -0,0 +1,85 @@
+# benchmarks/bench_export.py
+"""
+Export history benchmark: many runs kept as timestamped CSVs with inline cover
+letters (export_to_csv) versus the partitioned dataset (export_to_dataset),
+then reading two columns of every run back, as a historical analysis would.
+
+Usage: python benchmarks/bench_export.py [--runs 200] [--jobs 50] [--format parquet]
+
+Needs pyarrow. Files are written to a temporary directory that is removed
+afterwards.
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from benchmarks.corpus import job_corpus  # noqa: E402
+from src.export_results import export_to_csv, export_to_dataset, read_dataset  # noqa: E402
+
+_QUERIES = ["data analyst", "data scientist", "software engineer", "ml engineer"]
+_LETTER = ("Dear Hiring Manager,\n\n" + "I am excited to apply for this role. " * 40 + "\n\nSincerely,\nJane Doe")
+
+
+def _size(root: str) -> int:
+    return sum(os.path.getsize(p) for p in glob.glob(os.path.join(root, "**", "*"), recursive=True) if os.path.isfile(p))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=50, help="jobs per run")
+    parser.add_argument("--format", default="parquet", choices=["parquet", "arrow"])
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_export_")
+    csv_dir, dataset_dir = os.path.join(workdir, "csv"), os.path.join(workdir, "dataset")
+    os.makedirs(csv_dir)
+    runs = []
+    for r in range(args.runs):
+        jobs = job_corpus(args.jobs, query=_QUERIES[r % len(_QUERIES)], seed=r)
+        for i, job in enumerate(jobs):
+            job["similarity"] = 1.0 - i / args.jobs
+            job["cover_letter"] = _LETTER
+            job["docx_path"] = f"cover_letters/Jane_Doe/{job['id']}.docx"
+        runs.append((_QUERIES[r % len(_QUERIES)], jobs))
+
+    try:
+        start = time.perf_counter()
+        for r, (query, jobs) in enumerate(runs):
+            export_to_csv(jobs, path=os.path.join(csv_dir, f"jobs_{r:05d}.csv"))
+        csv_write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for query, jobs in runs:
+            export_to_dataset(jobs, query, resume="Jane Doe", root=dataset_dir, fmt=args.format)
+        dataset_write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        csv_df = pd.concat([pd.read_csv(p) for p in sorted(glob.glob(os.path.join(csv_dir, "*.csv")))],
+                           ignore_index=True)[["company", "similarity"]]
+        csv_read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        dataset_df = read_dataset(["company", "similarity"], root=dataset_dir, fmt=args.format)
+        dataset_read = time.perf_counter() - start
+
+        print(f"{args.runs} runs x {args.jobs} jobs ({len(csv_df)} / {len(dataset_df)} rows read back)")
+        print(f"{'':>22} {'write s':>8} {'read 2 cols s':>14} {'on disk MB':>11}")
+        print(f"{'CSV per run':>22} {csv_write:8.2f} {csv_read:14.3f} {_size(csv_dir) / 1e6:11.1f}")
+        print(f"{args.format + ' dataset':>22} {dataset_write:8.2f} {dataset_read:14.3f} {_size(dataset_dir) / 1e6:11.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
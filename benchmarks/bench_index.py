@@ -0,0 +1,86 @@
+# benchmarks/bench_index.py
+"""
+Job index benchmark: build time, query latency and recall versus exact search.
+
+Usage: python benchmarks/bench_index.py [--size 100000] [--queries 50] [--nprobe 1,4,8,16,32]
+
+Vectors are synthetic topic clusters (embeddings of real postings cluster by
+role and domain in the same way), so no model is needed. Recall@k is the
+share of the exact top-k ids that the index returns for the same query.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.vector_index import VectorIndex  # noqa: E402
+
+
+def clustered_vectors(n: int, dim: int, topics: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((topics, dim)).astype(np.float32)
+    # each posting blends two topics (e.g. "data analyst" + "healthcare") plus noise
+    w = rng.random((n, 1), dtype=np.float32)
+    x = w * centers[rng.integers(0, topics, n)] + (1 - w) * centers[rng.integers(0, topics, n)]
+    x += 0.5 * rng.standard_normal((n, dim)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--nprobe", default="1,4,8,16,32")
+    args = parser.parse_args()
+
+    vectors = clustered_vectors(args.size + args.queries, args.dim, args.topics)
+    corpus, queries = vectors[:args.size], vectors[args.size:]
+    ids = [f"job{i}" for i in range(args.size)]
+
+    index = VectorIndex()
+    start = time.perf_counter()
+    index.add(ids, corpus)
+    print(f"build: {args.size} vectors, {index.nlist} lists in {time.perf_counter() - start:.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.npz")
+        start = time.perf_counter()
+        index.save(path)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        index = VectorIndex.load(path)
+        print(f"save {saved:.2f}s, load {time.perf_counter() - start:.2f}s, {os.path.getsize(path) / 1e6:.0f} MB")
+
+    start = time.perf_counter()
+    exact = index.search(queries, args.top_k, nprobe=index.nlist)
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    print(f"\n{'nprobe':>8} {'ms/query':>10} {'recall@' + str(args.top_k):>10}")
+    print(f"{'exact':>8} {exact_ms:10.2f} {1.0:10.3f}")
+    for nprobe in [int(p) for p in args.nprobe.split(",") if p.strip()]:
+        start = time.perf_counter()
+        approx = index.search(queries, args.top_k, nprobe=nprobe)
+        ms = (time.perf_counter() - start) * 1000 / len(queries)
+        recall = np.mean([
+            len({i for i, _ in a} & {i for i, _ in e}) / max(1, len(e)) for a, e in zip(approx, exact)
+        ])
+        print(f"{nprobe:>8} {ms:10.2f} {recall:10.3f}")
+
+    # incremental updates on the trained index
+    start = time.perf_counter()
+    index.remove(ids[:1000])
+    index.add([f"new{i}" for i in range(1000)], clustered_vectors(1000, args.dim, args.topics, seed=1))
+    print(f"\nremove + insert 1000: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/bench_keywords.py
+"""
+Skill extraction benchmark: per-skill substring scans versus the keyword
+automaton, as the skill vocabulary grows.
+
+Usage: python benchmarks/bench_keywords.py [--vocab 15,1000,5000] [--texts 200]
+
+The vocabulary is the default skills plus generated multi-word terms; texts
+are synthetic job descriptions. Afterwards the compiled taxonomy is checked
+against the automaton on skills written together ("Python/SQL/Tableau",
+"Python-based"); the script exits with an error if it misses any.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import job_corpus  # noqa: E402
+from src.keyword_matcher import KeywordMatcher  # noqa: E402
+from src.parse_resume import DEFAULT_SKILLS  # noqa: E402
+from src.taxonomy import get_taxonomy  # noqa: E402
+
+_WORDS = ["cloud", "data", "graph", "stream", "vector", "query", "model", "web", "mobile", "secure",
+          "batch", "edge", "micro", "search", "insight", "metric", "signal", "event", "pixel", "quantum"]
+
+
+def vocabulary(size: int):
+    terms = list(DEFAULT_SKILLS)
+    i = 0
+    while len(terms) < size:
+        a, b = _WORDS[i % len(_WORDS)], _WORDS[(i // len(_WORDS)) % len(_WORDS)]
+        terms.append(f"{a} {b} {i}")
+        i += 1
+    return terms[:size]
+
+
+def substring_scan(text: str, vocab):
+    """The original simple_skill_extractor."""
+    text_low = text.lower()
+    return sorted({skill for skill in vocab if skill.lower() in text_low})
+
+
+# Skills joined by "/" or "-", as resumes and postings often write them
+_JOINED_TEXTS = [
+    "Python/SQL/Tableau",
+    "Python-based ETL, Excel/VBA",
+    "Built Power BI/Tableau dashboards; machine-learning models in PyTorch/TensorFlow",
+    "Git-based workflows on Linux, Pandas/Scikit-learn for data-analysis",
+]
+
+
+def check_taxonomy(texts=_JOINED_TEXTS) -> bool:
+    """Does the taxonomy find every default skill the automaton finds in `texts`?"""
+    taxonomy = get_taxonomy()
+    if taxonomy is None:
+        print("\nno taxonomy sources found; taxonomy check skipped")
+        return True
+    matcher = KeywordMatcher(DEFAULT_SKILLS)
+    ok = True
+    print("\ntaxonomy vs automaton on joined skills:")
+    for text in texts:
+        expected = {taxonomy.canonical(k, "skill") or k for k in matcher.find_all(text)}
+        missing = sorted(expected - set(taxonomy.find(text, "skill")))
+        ok = ok and not missing
+        print(f"  {'ok' if not missing else 'MISSING ' + ', '.join(missing):<30} {text}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vocab", default="15,1000,5000")
+    parser.add_argument("--texts", type=int, default=200)
+    args = parser.parse_args()
+
+    texts = [j["description"] for j in job_corpus(args.texts)]
+    chars = sum(len(t) for t in texts)
+    print(f"{args.texts} descriptions, {chars / len(texts):.0f} chars on average")
+    print(f"\n{'vocab':>7} {'build ms':>9} {'scan ms/text':>13} {'automaton ms/text':>18} {'speedup':>8}")
+    for size in [int(v) for v in args.vocab.split(",") if v.strip()]:
+        vocab = vocabulary(size)
+        start = time.perf_counter()
+        matcher = KeywordMatcher(vocab)
+        build = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for t in texts:
+            substring_scan(t, vocab)
+        scan = (time.perf_counter() - start) * 1000 / len(texts)
+
+        start = time.perf_counter()
+        for t in texts:
+            matcher.find_all(t)
+        auto = (time.perf_counter() - start) * 1000 / len(texts)
+        print(f"{size:>7} {build:9.1f} {scan:13.3f} {auto:18.3f} {scan / auto:7.1f}x")
+    print(f"\nbackend: {matcher.backend}")
+    if not check_taxonomy():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_llm.py
+"""
+Local LLM cover letter latency: full prompt per letter versus the cached
+resume prefix (LLM_PREFIX_CACHE), with the streaming metrics of each.
+
+Usage: python benchmarks/bench_llm.py [--letters 5] [--max-tokens 400] [--budget 120] [--model PATH]
+
+Needs gpt4all and a model file (LOCAL_LLM_MODEL_PATH by default); there is
+nothing to measure without them. One model instance serves both passes, and
+each pass writes letters for the sample resume against the same jobs.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import job_corpus  # noqa: E402
+from src import generate_cover as gc  # noqa: E402
+
+
+def sample_resume():
+    return {
+        "name": "Jane Doe",
+        "email": "jane.doe@example.com",
+        "phone": "+14155550100",
+        "skills": ["Python", "SQL", "Pandas", "Excel", "Power BI", "Tableau", "Machine Learning",
+                   "Scikit-learn", "Git", "Linux"],
+        "experience_snippets": [
+            "Senior Data Analyst, Acme Corp (2021 - present)",
+            "Built self-service dashboards in Power BI and Tableau used by 300 staff.",
+            "Automated weekly KPI reporting with Python, Pandas and SQL, saving 10 hours a week.",
+            "Data Analyst, Globex Inc. (2019 - 2021)",
+            "Analysed churn with Scikit-learn models and presented findings to leadership.",
+        ],
+        "education_snippets": ["BSc Statistics, State University, 2019"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--letters", type=int, default=5)
+    parser.add_argument("--max-tokens", type=int, default=400)
+    parser.add_argument("--budget", type=float, default=120.0, help="seconds per letter; 0 = no limit")
+    parser.add_argument("--model", default=None)
+    args = parser.parse_args()
+
+    model_path = args.model or gc.LOCAL_LLM_MODEL_PATH
+    if not gc.llm_available(model_path):
+        print(f"gpt4all or the model ({model_path}) is not available; nothing to benchmark")
+        return
+    gc.LOCAL_LLM_MODEL_PATH = model_path
+    resume, jobs = sample_resume(), job_corpus(args.letters)
+    llm = gc.load_llm_instance(model_path)
+
+    print(f"\n{'':>14} {'s/letter':>9} {'1st token s':>12} {'tok/s':>7} {'tokens':>7} "
+          f"{'signature':>10} {'budget':>7} {'prefix s':>9}")
+    try:
+        for cached in (False, True):
+            gc.LLM_PREFIX_CACHE = cached
+            gc.reset_llm_stats()
+            start = time.perf_counter()
+            for job in jobs:
+                gc.generate_cover_gpt4all(resume, job, n_tokens=args.max_tokens, llm=llm, time_budget=args.budget)
+            wall = (time.perf_counter() - start) / len(jobs)
+            s = gc.get_llm_stats()
+            print(f"{'prefix cache' if cached else 'full prompt':>14} {wall:9.2f} {s['avg_first_token_seconds']:12.2f} "
+                  f"{s['tokens_per_second']:7.1f} {s['tokens']:7d} {s['stopped_at_signature']:10d} "
+                  f"{s['stopped_at_budget']:7d} {s['prefix_seconds']:9.2f}")
+    finally:
+        gc.close_llm_instance(llm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_memory.py
+"""
+Memory held by a job corpus: plain dicts enriched by copying (the original
+rank_jobs) versus JobRecords enriched in place.
+
+Usage: python benchmarks/bench_memory.py [--jobs 100000]
+
+Jobs are synthetic postings decoded from JSON, so every string is its own
+object, as it is after parsing pages or loading the parse cache. Sizes are
+what tracemalloc sees retained after each step; "text" is the UTF-8 size of
+the field values themselves.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+from benchmarks.corpus import job_corpus  # noqa: E402
+from src.job_record import JobRecord  # noqa: E402
+from src.match_jobs import rank_jobs  # noqa: E402
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, retained, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    jobs = job_corpus(args.jobs)
+    for i, job in enumerate(jobs):
+        job["source"] = "indeed"
+    raw = json.dumps(jobs)
+    del jobs
+    text = sum(len(str(v).encode("utf-8")) for job in json.loads(raw) for v in job.values())
+    scores = np.random.default_rng(0).random(args.jobs).astype(np.float32)
+
+    rows = []
+    # dicts: the corpus as parsed, then a scored copy of every job
+    dicts, held, t_load = _measure(lambda: json.loads(raw))
+    _, extra, t_rank = _measure(lambda: [dict(job, similarity=float(s)) for job, s in zip(dicts, scores)])
+    rows.append(("dicts + copies", held, held + extra, t_load, t_rank))
+    del dicts, _
+
+    records, held, t_load = _measure(lambda: [JobRecord(job) for job in json.loads(raw)])
+    _, extra, t_rank = _measure(lambda: rank_jobs(records, scores, len(records)))
+    rows.append(("JobRecord in place", held, held + extra, t_load, t_rank))
+
+    mb = 1024 * 1024
+    print(f"{args.jobs} jobs, {text / mb:.1f} MB of field text")
+    print(f"{'':>20} {'loaded MB':>10} {'scored MB':>10} {'x text':>7} {'load s':>7} {'score s':>8}")
+    for name, loaded, scored, t_load, t_rank in rows:
+        print(f"{name:>20} {loaded / mb:10.1f} {scored / mb:10.1f} {scored / text:7.1f} {t_load:7.2f} {t_rank:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
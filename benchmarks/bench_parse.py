@@ -0,0 +1,156 @@
+# benchmarks/bench_parse.py
+"""
+Parse-throughput benchmark for job result pages over saved HTML fixtures.
+
+Usage: python benchmarks/bench_parse.py [--repeat 20] [--check-only]
+
+Compares the original per-card select_one fallback chains on html.parser
+("baseline") with the precompiled SelectorPlan on every available backend.
+Before timing, every backend must extract the same title, company, location,
+link and snippet as the baseline from each fixture (legacy and modern card
+markup); the script exits with an error naming the first difference.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import urllib.parse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup  # noqa: E402
+from src import html_parsing  # noqa: E402
+from src.fetch_jobs import INDEED_BASE, INDEED_PLAN, parse_indeed_html, _clean, _get_text, _hash_id  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def baseline_parse(html: str, query: str, location: str = "", base: str = INDEED_BASE):
+    """The pre-SelectorPlan implementation, kept here as the reference."""
+    q = urllib.parse.quote(query)
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    job_cards = soup.select("div.job_seen_beacon") or soup.select("div.jobsearch-SerpJobCard") or soup.select("div[class*='job_']") or soup.select("a[id^='job_']")
+    for card in job_cards:
+        title_el = card.select_one("h2.jobTitle span") or card.select_one("a.jcs-JobTitle") or card.select_one("h2 a")
+        title = _clean(_get_text(title_el))
+        company_el = card.select_one("span.companyName") or card.select_one("span[data-testid='company-name']")
+        company = _clean(_get_text(company_el))
+        loc_el = card.select_one("div.companyLocation") or card.select_one("div[data-testid='text-location']")
+        loc = _clean(_get_text(loc_el)) or location or "Remote"
+        desc_el = card.select_one("div.job-snippet") or card.select_one("div.jobCardShelfContainer")
+        description = _clean(_get_text(desc_el)) or "No description available"
+        link_el = card.select_one("a[id^='job_']") or card.select_one("a.jcs-JobTitle") or card.select_one("h2 a")
+        href = link_el["href"] if link_el and link_el.has_attr("href") else None
+        job_url = f"{base}{href}" if href and href.startswith("/") else (href or f"{base}/jobs?q={q}")
+        if not title:
+            continue
+        jobs.append({
+            "id": _hash_id(job_url + title + company),
+            "title": title,
+            "company": company or "Unknown",
+            "location": loc,
+            "description": description,
+            "redirect_url": job_url
+        })
+    return jobs
+
+
+def plan_parse(backend: str):
+    def run(html: str, query: str, location: str = ""):
+        html_parsing.PARSER_BACKEND = backend
+        return parse_indeed_html(html, query, location)
+    return run
+
+
+def available_backends():
+    backends = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        backends.append("lxml")
+    except ImportError:
+        pass
+    return backends
+
+
+_FIELDS = ("title", "company", "location", "redirect_url", "description", "id")
+
+
+def first_difference(reference, got) -> str:
+    """Where `got` first differs from the baseline jobs, or "" if it does not."""
+    if len(got) != len(reference):
+        return f"{len(got)} jobs instead of {len(reference)}"
+    for n, (want, job) in enumerate(zip(reference, got)):
+        for field in _FIELDS:
+            if job.get(field) != want.get(field):
+                return f"card {n} {field}: {job.get(field)!r} instead of {want.get(field)!r}"
+    return ""
+
+
+def check_equivalence(paths, pages) -> bool:
+    """Does every backend's SelectorPlan extract exactly the baseline's jobs from every fixture?"""
+    ok = True
+    for path, html in zip(paths, pages):
+        reference = baseline_parse(html, "data analyst")
+        if not reference:
+            print(f"  {os.path.basename(path)}: the baseline finds no job cards")
+            ok = False
+            continue
+        for backend in available_backends():
+            INDEED_PLAN.reset()
+            diff = first_difference(reference, plan_parse(backend)(html, "data analyst"))
+            ok = ok and not diff
+            print(f"  {os.path.basename(path):<22} {backend:<12} {len(reference):3d} cards  {diff or 'same as baseline'}")
+    if "lxml" not in available_backends():
+        print("  lxml is not installed; only html.parser was checked")
+    return ok
+
+
+def time_parser(fn, pages, repeat: int) -> float:
+    """Seconds per page, best of 3 rounds of `repeat` passes over all pages."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for html in pages:
+                fn(html, "data analyst")
+        best = min(best, (time.perf_counter() - start) / (repeat * len(pages)))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the fixtures per round")
+    parser.add_argument("--check-only", action="store_true", help="only check the backends against the baseline")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(FIXTURES, "*.html")))
+    pages = [open(p, encoding="utf-8").read() for p in paths]
+    if not pages:
+        sys.exit(f"No fixtures found in {FIXTURES}")
+
+    variants = [("baseline (html.parser)", baseline_parse)]
+    variants += [(f"selector plan ({b})", plan_parse(b)) for b in available_backends()]
+
+    # correctness: every backend must extract the same jobs as the baseline
+    print("equivalence with the baseline:")
+    if not check_equivalence(paths, pages):
+        sys.exit("selector plan output differs from the baseline")
+    if args.check_only:
+        return
+
+    cards = sum(len(baseline_parse(html, "data analyst")) for html in pages)
+    print(f"{len(pages)} fixture page(s), {cards} job cards, repeat={args.repeat}")
+    base_time = None
+    for name, fn in variants:
+        INDEED_PLAN.reset()
+        per_page = time_parser(fn, pages, args.repeat)
+        base_time = base_time or per_page
+        print(f"  {name:<28} {per_page * 1000:8.2f} ms/page  {1 / per_page:8.1f} pages/s  x{base_time / per_page:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# benchmarks/bench_pipeline.py
+"""
+Offline benchmark of each pipeline stage on synthetic corpora.
+
+Usage:
+    python benchmarks/bench_pipeline.py                      # compare with baseline
+    python benchmarks/bench_pipeline.py --save-baseline      # record a new baseline
+    python benchmarks/bench_pipeline.py --sizes 100,1000,10000,100000
+
+Times parse_resume (txt/docx/pdf, and a cache hit), job card parsing (saved HTML fixtures),
+compute_similarity and compute_hybrid_similarity (stub embedding model, no
+cache), template cover letter generation, DOCX writing and CSV export. No network or model downloads are
+needed. Results are compared with benchmarks/baseline.json; any metric slower
+than the baseline by more than --tolerance is reported as a regression and
+the script exits with status 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import StubEmbeddingModel, html_fixtures, job_corpus, write_sample_resumes  # noqa: E402
+from src import match_jobs  # noqa: E402
+from src import parse_resume as parse_resume_module  # noqa: E402
+from src.export_results import export_to_csv  # noqa: E402
+from src.fetch_jobs import parse_indeed_html  # noqa: E402
+from src.generate_cover import generate_cover_with_template, save_cover_letter_docx  # noqa: E402
+from src.parse_resume import parse_resume  # noqa: E402
+from src.resume_cache import ResumeCache  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def best_of(fn: Callable[[], object], rounds: int) -> float:
+    """Fastest wall time of `rounds` calls, in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(sizes, rounds: int, cover_sample: int, workdir: str) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+
+    # parse_resume, per format (seconds per resume)
+    resumes = write_sample_resumes(os.path.join(workdir, "resumes"))
+    for ext, path in resumes.items():
+        results[f"parse_resume[{ext}]"] = best_of(lambda: parse_resume(path, use_cache=False), rounds)
+    resume = parse_resume(resumes["txt"], use_cache=False)
+    # unchanged resume served from the parsed-resume cache (kept in the temp dir)
+    parse_resume_module._resume_cache = ResumeCache(os.path.join(workdir, "resumes.sqlite"))
+    parse_resume(resumes["pdf"])
+    results["parse_resume[pdf,cached]"] = best_of(lambda: parse_resume(resumes["pdf"]), rounds)
+
+    # card parsing (seconds per page)
+    pages = html_fixtures()
+    if pages:
+        t = best_of(lambda: [parse_indeed_html(html, "data analyst") for html in pages], rounds)
+        results["parse_cards[per_page]"] = t / len(pages)
+
+    match_jobs.set_model(StubEmbeddingModel())
+    cover_dir = os.path.join(workdir, "covers")
+    for n in sizes:
+        jobs = job_corpus(n)
+
+        results[f"compute_similarity@{n}"] = best_of(
+            lambda: match_jobs.compute_similarity(resume["raw_text"], jobs, top_k=20, use_cache=False), rounds
+        )
+        results[f"compute_hybrid_similarity@{n}"] = best_of(
+            lambda: match_jobs.compute_hybrid_similarity(
+                resume["raw_text"], jobs, top_k=20, resume_skills=resume["skills"], use_cache=False
+            ), rounds
+        )
+
+        sample = jobs[:min(n, cover_sample)]
+        covers = []
+        t = best_of(lambda: covers.__setitem__(slice(None), [generate_cover_with_template(resume, j) for j in sample]), rounds)
+        results[f"cover_template[per_letter]@{n}"] = t / len(sample)
+
+        t = best_of(lambda: [save_cover_letter_docx(c, j, resume, output_dir=cover_dir) for c, j in zip(covers, sample)], 1)
+        results[f"save_docx[per_letter]@{n}"] = t / len(sample)
+
+        enriched = [dict(j, similarity=0.5) for j in jobs]
+        for j, c in zip(enriched, covers):
+            j["cover_letter"] = c
+        csv_path = os.path.join(workdir, f"export_{n}.csv")
+        results[f"export_csv@{n}"] = best_of(lambda: export_to_csv(enriched, path=csv_path), rounds)
+
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> int:
+    regressions = 0
+    print(f"\n{'metric':<40} {'seconds':>12} {'baseline':>12} {'ratio':>7}")
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base:
+            ratio = value / base
+            flag = "  REGRESSION" if ratio > 1 + tolerance else ""
+            regressions += bool(flag)
+            print(f"{name:<40} {value:12.6f} {base:12.6f} {ratio:7.2f}{flag}")
+        else:
+            print(f"{name:<40} {value:12.6f} {'-':>12} {'-':>7}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000", help="comma-separated corpus sizes")
+    parser.add_argument("--rounds", type=int, default=3, help="repetitions per metric (best is kept)")
+    parser.add_argument("--cover-sample", type=int, default=100, help="jobs per size used for cover/DOCX timings")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before flagging (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    # keep benchmark output quiet: cover/DOCX helpers print per letter
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, "w") as devnull:
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            results = run_benchmarks(sizes, args.rounds, args.cover_sample, workdir)
+        finally:
+            sys.stdout = stdout
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"machine": platform.platform(), "python": platform.python_version(), "results": results}, f, indent=2)
+        compare(results, {}, args.tolerance)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+    else:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{regressions} metric(s) regressed by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_startup.py
+"""
+Startup time of the command-line entry points.
+
+Usage:
+    python benchmarks/bench_startup.py              # median of 5 fresh interpreters
+    python benchmarks/bench_startup.py --runs 10 --top 25
+
+Each measurement imports a module in a new Python process, so nothing is
+shared between runs. "eager" also imports every pipeline module up front, as
+a run does once it starts. The slowest imports of `app` are listed from
+`python -X importtime`.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    "app": "import app",
+    "run_automation": "import run_automation",
+    "eager": "import app, src.parse_resume, src.fetch_jobs, src.match_jobs, src.cover_workers, src.export_results",
+}
+
+
+def time_import(code: str, runs: int) -> float:
+    """Median wall time of `python -c code` in seconds, interpreter start included."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def slowest_imports(code: str, top: int):
+    """(cumulative seconds, module) for the `top` slowest imports, from -X importtime."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1e6, name.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per target (median is reported)")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports of app to list")
+    args = parser.parse_args()
+
+    baseline = time_import("pass", args.runs)
+    print(f"{'target':<16} {'seconds':>9} {'imports':>9}")
+    print(f"{'(interpreter)':<16} {baseline:9.3f} {'-':>9}")
+    for name, code in TARGETS.items():
+        t = time_import(code, args.runs)
+        print(f"{name:<16} {t:9.3f} {t - baseline:9.3f}")
+
+    print(f"\nSlowest imports of app (cumulative):")
+    for seconds, module in slowest_imports(TARGETS["app"], args.top):
+        print(f"  {seconds:7.3f}s  {module}")
+
+
+if __name__ == "__main__":
+    main()
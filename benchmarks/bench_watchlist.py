@@ -0,0 +1,91 @@
+# benchmarks/bench_watchlist.py
+"""
+Watchlist matching benchmark: the original pairwise substring scan
+(df['company'].apply(any(...))) versus the indexed WatchlistMatcher.
+
+Usage: python benchmarks/bench_watchlist.py [--watchlist 100,1000,5000] [--jobs 10000]
+
+Company names are two or three made-up words with random legal suffixes; jobs
+are drawn from a pool of distinct companies, a few of them on the watchlist.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from src.watchlist import WatchlistMatcher  # noqa: E402
+
+_SYLLABLES = ["ac", "me", "glo", "bal", "da", "ta", "nor", "blu", "ri", "ver", "quan", "tum", "a", "pex",
+              "sum", "mit", "ver", "tex", "har", "bor", "ce", "dar", "or", "bit", "at", "las", "no", "va"]
+_WORDS = sorted({a + b for a in _SYLLABLES for b in _SYLLABLES})
+_SUFFIXES = ["", " Inc.", " Ltd", " Corp.", " LLC", " Group", " GmbH"]
+
+
+def company_names(n: int, seed: int):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < n:
+        words = rng.sample(_WORDS, rng.choice((2, 3)))
+        names.add(" ".join(w.capitalize() for w in words) + rng.choice(_SUFFIXES))
+    return sorted(names)
+
+
+def base_name(name: str) -> str:
+    for suffix in _SUFFIXES[1:]:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def pairwise_scan(df, watchlist):
+    """The original matching in app.py / run_automation.py."""
+    return df[df['company'].apply(
+        lambda job_company: any(
+            watchlist_name.lower() in str(job_company).lower() or
+            str(job_company).lower() in watchlist_name.lower()
+            for watchlist_name in watchlist
+        )
+    )]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--watchlist", default="100,1000,5000")
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--companies", type=int, default=2_000, help="distinct companies among the jobs")
+    args = parser.parse_args()
+
+    pool = company_names(args.companies, seed=1)
+    rng = random.Random(2)
+    print(f"{args.jobs} jobs from {args.companies} distinct companies")
+    print(f"\n{'watchlist':>10} {'build ms':>9} {'scan s':>8} {'matcher ms':>11} {'speedup':>8} {'rows matched':>14}")
+    for size in [int(v) for v in args.watchlist.split(",") if v.strip()]:
+        watchlist = company_names(size, seed=3)
+        # put some watched companies among the jobs, with a different suffix
+        jobs_pool = pool + [base_name(name) + " Inc." for name in watchlist[:50]]
+        df = pd.DataFrame({"company": [rng.choice(jobs_pool) for _ in range(args.jobs)]})
+
+        start = time.perf_counter()
+        matcher = WatchlistMatcher(watchlist)
+        build = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        old = pairwise_scan(df, watchlist)
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        new = matcher.filter(df)
+        indexed = (time.perf_counter() - start) * 1000
+        print(f"{size:>10} {build:9.1f} {scan:8.2f} {indexed:11.2f} {scan * 1000 / indexed:7.0f}x "
+              f"{len(old):>6} / {len(new):<6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/corpus.py
+"""
+Synthetic inputs for the offline benchmarks: job corpora, sample resumes in
+every supported format, and a stub embedding model that needs no downloads.
+"""
+
+import hashlib
+import os
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.fetch_jobs import generate_synthetic_jobs
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+SAMPLE_RESUME_LINES = [
+    "Jane Doe",
+    "jane.doe@example.com",
+    "+14155550100",
+    "Summary",
+    "Data analyst with five years of experience turning messy data into decisions.",
+    "Work Experience",
+    "Senior Data Analyst, Acme Corp (2021 - present)",
+    "Built self-service dashboards in Power BI and Tableau used by 300 staff.",
+    "Automated weekly KPI reporting with Python, Pandas and SQL, saving 10 hours a week.",
+    "Data Analyst, Globex Inc. (2019 - 2021)",
+    "Analysed churn with Scikit-learn models and presented findings to leadership.",
+    "Maintained ETL jobs on Linux and versioned analysis code in Git.",
+    "Education",
+    "BSc Statistics, State University, 2019",
+    "Skills",
+    "Python, SQL, Pandas, Excel, Power BI, Tableau, Machine Learning, Scikit-learn, Git, Linux",
+]
+
+
+def job_corpus(n: int, query: str = "data analyst", seed: int = 0) -> List[Dict]:
+    """`n` synthetic postings (see fetch_jobs.generate_synthetic_jobs)."""
+    return generate_synthetic_jobs(query, n, seed=seed)
+
+
+def html_fixtures() -> List[str]:
+    """Saved job search result pages."""
+    paths = sorted(p for p in os.listdir(FIXTURES) if p.endswith(".html"))
+    return [open(os.path.join(FIXTURES, p), encoding="utf-8").read() for p in paths]
+
+
+def write_sample_resumes(directory: str, lines: Optional[List[str]] = None) -> Dict[str, str]:
+    """Write the sample resume as .txt, .docx and .pdf; returns {extension: path}."""
+    from docx import Document
+    import fitz
+
+    lines = lines or SAMPLE_RESUME_LINES
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+
+    paths["txt"] = os.path.join(directory, "sample_resume.txt")
+    with open(paths["txt"], "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+    paths["docx"] = os.path.join(directory, "sample_resume.docx")
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    doc.save(paths["docx"])
+
+    paths["pdf"] = os.path.join(directory, "sample_resume.pdf")
+    pdf = fitz.open()
+    page = pdf.new_page()
+    y = 72
+    for line in lines:
+        page.insert_text((72, y), line, fontsize=10)
+        y += 14
+    pdf.save(paths["pdf"])
+    pdf.close()
+    return paths
+
+
+class StubEmbeddingModel:
+    """
+    Deterministic stand-in for SentenceTransformer: hashes word unigrams into a
+    fixed-size vector. Costs roughly O(text length), like the real model, so
+    relative timings of the surrounding code stay meaningful.
+    """
+
+    _token = re.compile(r"[a-z0-9+#.]+")
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def _embed(self, text: str) -> np.ndarray:
+        v = np.zeros(self.dim, dtype=np.float32)
+        for tok in self._token.findall((text or "").lower()):
+            h = int.from_bytes(hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest(), "little")
+            v[h % self.dim] += 1.0 if (h >> 32) & 1 else -1.0
+        return v
+
+    def encode(self, texts, batch_size: int = 32, convert_to_numpy: bool = True, normalize_embeddings: bool = False, show_progress_bar: bool = False, **kwargs):
+        single = isinstance(texts, str)
+        items = [texts] if single else list(texts)
+        out = np.stack([self._embed(t) for t in items]) if items else np.zeros((0, self.dim), dtype=np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(out, axis=1, keepdims=True)
+            out = out / np.where(norms == 0, 1, norms)
+        return out[0] if single else out
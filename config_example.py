@@ -15,18 +15,115 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 # SEARCH SETTINGS
 # ============================================================================
 SCRAPE_RESULTS_LIMIT = 20
+# Result pages are fetched concurrently; stop after this many pages
+SCRAPE_MAX_PAGES = 5
+# Maximum simultaneous requests to any one job site
+SCRAPE_MAX_CONCURRENCY_PER_HOST = 4
+# Job sources queried in parallel (see src/fetch_jobs.py); demo data is used if all return nothing
+ENABLED_JOB_SOURCES = ["indeed"]
+# Seconds to wait for each source before merging whatever has arrived
+SOURCE_TIMEOUT = 30
+# Scraped pages are cached locally; entries older than the TTL are revalidated with the site
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_PATH = "outputs/.cache/http_cache.sqlite"
+HTTP_CACHE_TTL = 3600  # seconds
+HTTP_CACHE_MAX_MB = 100
+
+# ============================================================================
+# MATCHING SETTINGS
+# ============================================================================
+# Number of job descriptions encoded per batch by the embedding model
+EMBED_BATCH_SIZE = 64
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+# Job description embeddings are cached on disk; changing the model clears the cache
+EMBED_CACHE_ENABLED = True
+EMBED_CACHE_PATH = "outputs/.cache/embeddings.sqlite"
+EMBED_CACHE_MAX_ENTRIES = 200000
+# Every embedded job is added to an on-disk vector index of the historical corpus;
+# searches scan only the nearest JOB_INDEX_NPROBE clusters (higher = better recall, slower).
+# In hybrid scoring mode only the jobs the cascade shortlists are embedded, so only
+# those are indexed (HYBRID_SHORTLIST = 0 or SCORING_MODE = "embedding" indexes every job)
+JOB_INDEX_ENABLED = True
+JOB_INDEX_PATH = "outputs/.cache/job_index.npz"
+JOB_INDEX_NPROBE = 8
+JOB_INDEX_MIN_TRAIN = 2048  # smaller indexes are searched exactly
+# Skills / role taxonomy: CSV (name,aliases,category) or JSON sources, compiled once into a
+# memory-mapped file that is rebuilt automatically when a source changes (relative paths are
+# relative to the project root, whatever the working directory)
+TAXONOMY_SOURCES = ["taxonomy/skills.csv", "taxonomy/roles.json"]
+TAXONOMY_PATH = "outputs/.cache/taxonomy.bin"
+# Skill / role keyword matching: "auto" uses pyahocorasick (C) when installed, else pure Python
+KEYWORD_MATCHER_BACKEND = "auto"
+# Job scoring: "hybrid" ranks every job by BM25 keyword relevance and skill overlap,
+# embeds only the top HYBRID_SHORTLIST per resume and blends the three scores with
+# SCORE_WEIGHTS; "embedding" embeds every job (the original behaviour)
+SCORING_MODE = "hybrid"
+SCORE_WEIGHTS = {"embedding": 0.6, "lexical": 0.25, "skills": 0.15}
+HYBRID_SHORTLIST = 200  # 0 = embed every job
+# Parsed resumes and their embeddings are cached by file content + parser version
+RESUME_CACHE_ENABLED = True
+RESUME_CACHE_PATH = "outputs/.cache/resumes.sqlite"
+RESUME_CACHE_MAX_ENTRIES = 1000
+# Start loading the embedding model in the background as soon as a run starts
+PRELOAD_EMBEDDING_MODEL = True
 
 # ============================================================================
 # LOCAL LLM CONFIGURATION (OPTIONAL)
 # ============================================================================
 # Leave as-is to use template mode, or set path to GPT4All model
 LOCAL_LLM_MODEL_PATH = "models/orca-mini-3b-gguf2-q4_0.gguf"
+# The model is loaded once per run and unloaded after this many idle seconds (0 = never)
+LLM_IDLE_TIMEOUT = 300
+# Letters are streamed token by token and stop at the "Sincerely, <name>" signature,
+# at LLM_MAX_TOKENS or after LLM_TIME_BUDGET seconds (0 = no limit), whichever is first
+LLM_MAX_TOKENS = 400
+LLM_TIME_BUDGET = 120
+# The resume + instructions part of the prompt is evaluated once per resume and model
+# instance; each letter then only processes its job posting
+LLM_PREFIX_CACHE = True
+# Cover letters are generated in parallel: template letters use one process per core
+# (0 = auto), local LLM letters use a pool of model instances sized to RAM/cores (0 = auto)
+COVER_WORKERS = 0
+LLM_POOL_SIZE = 0
+COVER_JOB_TIMEOUT = 300  # seconds per cover letter; a local LLM letter past it gets the template letter
 
 # ============================================================================
 # OUTPUT DIRECTORIES
 # ============================================================================
 OUTPUT_CSV = "outputs/jobs.csv"
+# Every run is also appended to a columnar dataset partitioned by date and query
+# (date=YYYY-MM-DD/query=<query>/part-*.parquet); cover letters are referenced by
+# DOCX path. "parquet", "arrow" (Arrow IPC) or "" to disable; needs `pip install pyarrow`
+EXPORT_DATASET_FORMAT = "parquet"
+EXPORT_DATASET_DIR = "outputs/dataset"
+EXPORT_DATASET_CHUNK_ROWS = 10000  # rows per part file
+# Jobs already scored / written in earlier runs are tracked here and skipped;
+# an interrupted run resumes from its last completed stage
+INCREMENTAL_RUNS = True
+JOB_STORE_PATH = "outputs/job_store.sqlite"
+# Per-stage timing / memory report (JSON + CSV) written after every run
+PROFILE_REPORTS = True
+REPORTS_DIR = "outputs/reports"
+# "" (off), "cprofile" (.prof dump) or "pyinstrument" (HTML, needs `pip install pyinstrument`)
+PROFILE_MODE = ""
 COVER_LETTERS_DIR = "cover_letters"
+# Watchlist companies match job companies after normalization ("Acme, Inc." = "ACME Corp"),
+# by prefix ("Google" ~ "Google Cloud") or by word overlap of at least this much (0 = off)
+WATCHLIST_FUZZY_THRESHOLD = 0.6
+# Watchlist alerts are sent in the background over one reused SMTP connection. Each
+# posting is alerted once; matches found between digests are coalesced into one email
+ALERT_STORE_PATH = "outputs/alerts.sqlite"
+ALERT_DIGEST_INTERVAL = 0  # seconds between digest emails; 0 = send after every run
+ALERT_MAX_RETRIES = 3
+ALERT_RETRY_BACKOFF = 2.0  # seconds before the first retry, doubled for each further one
+ALERT_BATCH_WINDOW = 2.0   # seconds the connection stays open for further queued alerts
+ALERT_QUEUED_LEASE = 600.0  # seconds before alerts left queued by a run that exited mid-send are sent again
+# Streaming mode (python run_automation.py --stream): jobs flow fetch -> score -> cover
+# letter -> CSV row through bounded queues instead of stage by stage
+STREAM_PIPELINE = False
+STREAM_QUEUE_SIZE = 64   # items a stage may run ahead of the next one
+STREAM_BATCH_SIZE = 32   # jobs per embedding micro-batch
+STREAM_MAX_WAIT = 0.5    # seconds to wait for a micro-batch to fill
 
 # ============================================================================
 # RESUME PATH (REQUIRED)
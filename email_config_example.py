@@ -21,6 +21,10 @@ SENDER_PASSWORD = "your_app_password_here"  # Gmail App Password (16 characters,
 # Where to send alerts
 RECIPIENT_EMAIL = "your_email@gmail.com"  # Can be same as sender
 
+# STARTTLS before logging in (set False, with an empty password, for a local test
+# server such as `python -m aiosmtpd -n -l localhost:8025`)
+SMTP_USE_TLS = True
+
 # For other email providers, update SMTP settings:
 # Outlook: smtp-mail.outlook.com, port 587
 # Yahoo: smtp.mail.yahoo.com, port 587
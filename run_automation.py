@@ -1,7 +1,7 @@
 # run_automation.py
 # Fully automated job search with resume analysis and optional company alerts
 
-from app import run_pipeline
+from app import run_pipeline, run_batch
 import sys
 import os
 from datetime import datetime
@@ -108,9 +108,15 @@ def main():
             query=query,
             location=location,
             generate_covers=True,  # Always generate cover letters using GPT4All
-            company_watchlist=watchlist
+            company_watchlist=watchlist,
+            stream=True if "--stream" in sys.argv else None
         )
         
+        if df is None:
+            # streaming mode writes the CSV row by row and builds no DataFrame
+            import pandas as pd
+            df = pd.read_csv(csv_path, usecols=["company", "title"])
+
         print("\n" + "=" * 80)
         print("AUTOMATION COMPLETED SUCCESSFULLY!")
         print("=" * 80)
@@ -121,14 +127,9 @@ def main():
         
         # Show watchlist matches if any
         if watchlist:
-            # Fuzzy matching: check if any watchlist company name is contained in job company name or vice versa
-            watchlist_matches = df[df['company'].apply(
-                lambda job_company: any(
-                    watchlist_name.lower() in str(job_company).lower() or 
-                    str(job_company).lower() in watchlist_name.lower()
-                    for watchlist_name in watchlist
-                )
-            )]
+            # same matcher (and cached lookups) as the pipeline's alert check
+            from src.watchlist import get_watchlist_matcher
+            watchlist_matches = get_watchlist_matcher(watchlist).filter(df)
             if len(watchlist_matches) > 0:
                 print(f"\n🎯 WATCHLIST MATCHES FOUND: {len(watchlist_matches)}")
                 for idx, row in watchlist_matches.iterrows():
@@ -149,7 +150,36 @@ def main():
         traceback.print_exc()
         sys.exit(1)
 
+def main_batch():
+    """Batch mode: every resume in data/ matched against one shared fetch (python run_automation.py --batch)."""
+    print("=" * 80)
+    print("AI JOB AGENT - BATCH MODE (all resumes in data/)")
+    print("=" * 80)
+    print(f"Run started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print()
+    watchlist = load_company_watchlist()
+    if watchlist:
+        print(f"📋 Company Watchlist Loaded: {len(watchlist)} companies\n")
+    try:
+        results = run_batch("data", generate_covers=True, company_watchlist=watchlist)
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    if not results:
+        sys.exit(1)
+    print("\n" + "=" * 80)
+    print("BATCH COMPLETED SUCCESSFULLY!")
+    print("=" * 80)
+    for resume_path, (df, csv_path) in results.items():
+        print(f"   ✓ {os.path.basename(resume_path)}: {len(df)} jobs -> {csv_path}")
+    print(f"\n⏰ Run completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
 if __name__ == "__main__":
+    if "--batch" in sys.argv:
+        main_batch()
+        sys.exit(0)
     print("\n💡 TIP: Create 'companies.txt' in the project root to monitor specific companies!")
     print("   Example companies.txt:")
     print("   # One company per line")
@@ -0,0 +1,368 @@
+# src/alerts.py
+import os
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from email.message import EmailMessage
+from typing import Callable, Dict, List, Optional
+
+# Import config with defaults for CI/testing
+try:
+    from config import ALERT_STORE_PATH, ALERT_DIGEST_INTERVAL
+except ImportError:
+    ALERT_STORE_PATH = "outputs/alerts.sqlite"
+    ALERT_DIGEST_INTERVAL = 0  # seconds between digest emails; 0 = send after every run
+
+try:
+    from config import ALERT_MAX_RETRIES, ALERT_RETRY_BACKOFF, ALERT_BATCH_WINDOW
+except ImportError:
+    ALERT_MAX_RETRIES = 3      # attempts per email after the first
+    ALERT_RETRY_BACKOFF = 2.0  # seconds before the first retry, doubled for each further one
+    ALERT_BATCH_WINDOW = 2.0   # seconds a connection stays open waiting for the next queued email
+
+try:
+    from config import ALERT_QUEUED_LEASE
+except ImportError:
+    ALERT_QUEUED_LEASE = 600.0  # seconds after which matches still queued by a process that never finished are sent again
+
+_EMAIL_KEYS = ("EMAIL_ENABLED", "SMTP_SERVER", "SMTP_PORT", "SENDER_EMAIL", "SENDER_PASSWORD", "RECIPIENT_EMAIL", "SMTP_USE_TLS")
+
+
+def load_email_config(overrides: Optional[Dict] = None) -> Optional[Dict]:
+    """
+    Settings from email_config.py (see email_config_example.py) updated with
+    `overrides`, or None when alerts are disabled or not configured.
+    SMTP_USE_TLS (default True) runs STARTTLS; without SENDER_PASSWORD no
+    login is attempted, e.g. for a local test server.
+    """
+    cfg: Dict = {"SMTP_USE_TLS": True}
+    try:
+        import email_config
+        cfg.update({k: getattr(email_config, k) for k in _EMAIL_KEYS if hasattr(email_config, k)})
+    except ImportError:
+        if not overrides:
+            print("   (Email config not found - create email_config.py to enable alerts)")
+            return None
+    cfg.update(overrides or {})
+    if not cfg.get("EMAIL_ENABLED", True):
+        print("   (Email alerts disabled in config)")
+        return None
+    return cfg
+
+
+# -----------------------------
+# Pending matches, across runs
+# -----------------------------
+class AlertStore:
+    """
+    Watchlist matches waiting to be emailed (SQLite).
+
+    Every match is recorded once per recipient, so a posting found again by a
+    later run is not alerted twice, and matches from runs in between two
+    digests (ALERT_DIGEST_INTERVAL) are coalesced into one email. Matches move
+    from pending to queued while their email is being sent, then to sent, or
+    back to pending if sending failed. A process that exits before its email
+    goes out (AlertDispatcher.close timed out, or it was killed) leaves its
+    matches queued; claim_pending takes them again once they have been queued
+    for longer than ALERT_QUEUED_LEASE, so another process that is still
+    sending its own digest is not duplicated.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or ALERT_STORE_PATH
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS matches (
+                recipient TEXT NOT NULL,
+                job_key TEXT NOT NULL,
+                company TEXT, title TEXT, location TEXT, similarity REAL, link TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                added REAL NOT NULL,
+                sent REAL,
+                queued_at REAL,
+                PRIMARY KEY (recipient, job_key)
+            );
+            CREATE TABLE IF NOT EXISTS digests (
+                recipient TEXT PRIMARY KEY, last_sent REAL NOT NULL
+            );
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(matches)")}
+        if "queued_at" not in columns:
+            # stores created before leases: their queued rows count as expired
+            self._conn.execute("ALTER TABLE matches ADD COLUMN queued_at REAL")
+        self._conn.commit()
+
+    def add(self, recipient: str, matches: List[Dict]) -> int:
+        """Record matches (dicts with job_id, company, title, location, similarity, link); returns how many are new."""
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO matches (recipient, job_key, company, title, location, similarity, link, added) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (recipient, str(m.get("job_id") or m.get("link") or ""), m.get("company"), m.get("title"),
+                     m.get("location"), m.get("similarity"), m.get("link"), now)
+                    for m in matches
+                ],
+            )
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def digest_due(self, recipient: str, interval: Optional[float] = None) -> bool:
+        interval = ALERT_DIGEST_INTERVAL if interval is None else interval
+        with self._lock:
+            row = self._conn.execute("SELECT last_sent FROM digests WHERE recipient = ?", (recipient,)).fetchone()
+        return row is None or time.time() - row[0] >= interval
+
+    def claim_pending(self, recipient: str, lease: Optional[float] = None) -> List[Dict]:
+        """
+        Pending matches for `recipient`, grouped by company and best first,
+        marked as queued; matches queued more than `lease` seconds ago
+        (default ALERT_QUEUED_LEASE) are taken again.
+        """
+        lease = ALERT_QUEUED_LEASE if lease is None else lease
+        now = time.time()
+        with self._lock:
+            # one write transaction, so two processes cannot claim the same rows
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT job_key, company, title, location, similarity, link FROM matches "
+                    "WHERE recipient = ? AND (status = 'pending' OR "
+                    "(status = 'queued' AND (queued_at IS NULL OR queued_at < ?))) "
+                    "ORDER BY company, similarity DESC",
+                    (recipient, now - lease),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE matches SET status = 'queued', queued_at = ? WHERE recipient = ? AND job_key = ?",
+                    [(now, recipient, r[0]) for r in rows],
+                )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        keys = ("job_id", "company", "title", "location", "similarity", "link")
+        return [dict(zip(keys, r)) for r in rows]
+
+    def mark(self, recipient: str, job_keys: List[str], sent: bool):
+        with self._lock:
+            if sent:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE matches SET status = 'sent', sent = ? WHERE recipient = ? AND job_key = ?",
+                    [(now, recipient, k) for k in job_keys],
+                )
+                self._conn.execute("INSERT OR REPLACE INTO digests (recipient, last_sent) VALUES (?, ?)", (recipient, now))
+            else:
+                self._conn.executemany(
+                    "UPDATE matches SET status = 'pending' WHERE recipient = ? AND job_key = ?",
+                    [(recipient, k) for k in job_keys],
+                )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def build_alert_message(matches: List[Dict], cfg: Dict) -> EmailMessage:
+    """One email listing every match, grouped by company."""
+    subject = f"🎯 Job Alert: {len(matches)} Watchlist Match(es) Found!"
+    body = "Hello!\n\n"
+    body += f"Your AI Job Agent found {len(matches)} job(s) from your watchlist companies:\n\n"
+    for m in matches:
+        body += f"📌 {m.get('company')}\n"
+        body += f"   Position: {m.get('title')}\n"
+        body += f"   Location: {m.get('location')}\n"
+        if m.get("similarity") is not None:
+            body += f"   Match Score: {float(m['similarity']):.2%}\n"
+        body += f"   URL: {m.get('link')}\n\n"
+    body += "Cover letters have been generated for all matches.\n\n"
+    body += "Best regards,\nYour AI Job Agent"
+
+    msg = EmailMessage()
+    msg["From"] = cfg["SENDER_EMAIL"]
+    msg["To"] = cfg["RECIPIENT_EMAIL"]
+    msg["Subject"] = subject
+    msg.set_content(body)
+    return msg
+
+
+# -----------------------------
+# Background sender
+# -----------------------------
+class AlertDispatcher:
+    """
+    Sends queued emails from a background thread over one reused SMTP
+    connection.
+
+    submit() returns immediately. The worker connects (STARTTLS + login)
+    when the first email arrives, sends everything that is queued, and keeps
+    the connection open for ALERT_BATCH_WINDOW seconds in case more emails
+    follow. A failed send reconnects and is retried up to ALERT_MAX_RETRIES
+    times with exponential backoff. `smtp_factory` (default smtplib.SMTP)
+    can be replaced for tests.
+    """
+
+    def __init__(self, email_config: Dict, max_retries: Optional[int] = None, backoff: Optional[float] = None,
+                 batch_window: Optional[float] = None, smtp_factory: Optional[Callable] = None, verbose: bool = True):
+        self.cfg = email_config
+        self.verbose = verbose
+        self.max_retries = ALERT_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff = ALERT_RETRY_BACKOFF if backoff is None else backoff
+        self.batch_window = ALERT_BATCH_WINDOW if batch_window is None else batch_window
+        self._smtp_factory = smtp_factory
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self.stats = {"sent": 0, "failed": 0, "connections": 0, "retries": 0}
+        self._thread = threading.Thread(target=self._run, name="alert-dispatcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, msg: EmailMessage, on_done: Optional[Callable[[bool], None]] = None):
+        """Queue `msg`; on_done(success) is called from the worker once it is sent or given up on."""
+        if self._closed:
+            raise RuntimeError("AlertDispatcher is closed")
+        self._queue.put((msg, on_done))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued email is sent or failed; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Send what is queued, then stop the worker."""
+        done = self.flush(timeout)
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=1)
+        return done
+
+    # ---- worker ----
+    def _connect(self):
+        import smtplib
+        factory = self._smtp_factory or smtplib.SMTP
+        server = factory(self.cfg["SMTP_SERVER"], int(self.cfg["SMTP_PORT"]), timeout=30)
+        if self.cfg.get("SMTP_USE_TLS", True):
+            server.starttls()
+        if self.cfg.get("SENDER_PASSWORD"):
+            server.login(self.cfg["SENDER_EMAIL"], self.cfg["SENDER_PASSWORD"])
+        self.stats["connections"] += 1
+        return server
+
+    @staticmethod
+    def _disconnect(server):
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    def _send(self, server, msg: EmailMessage):
+        """Send with retries; returns (server, success). The server is replaced after a failure."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                if server is None:
+                    server = self._connect()
+                server.send_message(msg)
+                return server, True
+            except Exception as e:
+                self._disconnect(server)
+                server = None
+                if attempt == self.max_retries:
+                    print(f"   ⚠ Failed to send email alert after {attempt + 1} attempt(s): {e}")
+                    return None, False
+                self.stats["retries"] += 1
+                time.sleep(self.backoff * (2 ** attempt))
+        return server, False
+
+    def _run(self):
+        server = None
+        while True:
+            try:
+                item = self._queue.get(timeout=self.batch_window if server is not None else None)
+            except queue.Empty:
+                # nothing more for this batch: hang up until the next email
+                self._disconnect(server)
+                server = None
+                continue
+            if item is None:
+                self._disconnect(server)
+                self._queue.task_done()
+                return
+            msg, on_done = item
+            server, ok = self._send(server, msg)
+            self.stats["sent" if ok else "failed"] += 1
+            if ok and self.verbose:
+                print(f"   ✓ Email alert sent to {msg['To']}")
+            try:
+                if on_done:
+                    on_done(ok)
+            finally:
+                self._queue.task_done()
+
+
+_dispatcher: Optional[AlertDispatcher] = None
+_store: Optional[AlertStore] = None
+_lock = threading.Lock()
+
+def get_alert_dispatcher(email_config: Dict) -> AlertDispatcher:
+    """Process-wide dispatcher; queued emails are flushed when the interpreter exits."""
+    global _dispatcher
+    with _lock:
+        if _dispatcher is None or _dispatcher.cfg != email_config:
+            if _dispatcher is not None:
+                _dispatcher.close()
+            _dispatcher = AlertDispatcher(email_config)
+            atexit.register(_dispatcher.close, 60)
+    return _dispatcher
+
+def get_alert_store() -> AlertStore:
+    global _store
+    with _lock:
+        if _store is None:
+            _store = AlertStore()
+    return _store
+
+def queue_watchlist_alert(matches: List[Dict], email_config: Optional[Dict] = None,
+                          store: Optional[AlertStore] = None, dispatcher: Optional[AlertDispatcher] = None) -> int:
+    """
+    Record watchlist matches and, when a digest is due, queue one email with
+    every pending match for the recipient. Returns the number of matches
+    queued for sending (0 if they wait for the next digest or were already
+    alerted). Sending happens in the background; see AlertDispatcher.
+    """
+    cfg = load_email_config(email_config)
+    if cfg is None:
+        return 0
+    store = store or get_alert_store()
+    recipient = cfg["RECIPIENT_EMAIL"]
+    new = store.add(recipient, matches)
+    if not store.digest_due(recipient):
+        print(f"   {new} new watchlist match(es) saved for the next digest email")
+        return 0
+    pending = store.claim_pending(recipient)
+    if not pending:
+        print("   (All watchlist matches were already alerted)")
+        return 0
+    keys = [m["job_id"] for m in pending]
+    dispatcher = dispatcher or get_alert_dispatcher(cfg)
+    dispatcher.submit(build_alert_message(pending, cfg), on_done=lambda ok: store.mark(recipient, keys, ok))
+    print(f"   Queued an email alert for {len(pending)} watchlist match(es) to {recipient}")
+    return len(pending)
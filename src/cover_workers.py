@@ -0,0 +1,327 @@
+# src/cover_workers.py
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import generate_cover as _gc
+from .generate_cover import (
+    close_llm_instance,
+    generate_cover,
+    llm_available,
+    load_llm_instance,
+    save_cover_letter_docx,
+)
+from .profiling import record_latency
+
+# Import config with defaults for CI/testing
+try:
+    from config import COVER_WORKERS, COVER_JOB_TIMEOUT, LLM_POOL_SIZE
+except ImportError:
+    COVER_WORKERS = 0         # template workers; 0 = one per CPU core
+    COVER_JOB_TIMEOUT = 300   # seconds a single cover letter may take once started
+    LLM_POOL_SIZE = 0         # GPT4All instances; 0 = size to available RAM and cores
+
+FAILED_COVER = "Failed to generate cover letter."
+
+# A loaded GGUF model needs roughly its file size in RAM plus context buffers
+_LLM_MEMORY_OVERHEAD = 1.3
+_MIN_THREADS_PER_LLM = 4
+
+
+# -----------------------------
+# Per-job work
+# -----------------------------
+def _write_cover(resume_summary: Dict, job: Dict, output_dir: str, prefer_local_llm: bool, llm=None) -> Dict:
+    start = time.perf_counter()
+    cover = generate_cover(resume_summary, job, prefer_local_llm=prefer_local_llm, llm=llm)
+    result = {"cover": cover, "docx_path": None, "error": None, "generate_s": time.perf_counter() - start}
+    start = time.perf_counter()
+    try:
+        result["docx_path"] = save_cover_letter_docx(cover, job, resume_summary, output_dir=output_dir)
+    except Exception as e:
+        print(f"  Warning: Failed to save DOCX for {job.get('title', 'Unknown')}: {e}")
+        result["error"] = f"DOCX: {e}"
+    result["docx_s"] = time.perf_counter() - start
+    return result
+
+def _record_latencies(results: List[Dict]) -> List[Dict]:
+    # timings are measured inside the workers and recorded here, in the parent
+    for r in results:
+        if "generate_s" in r:
+            record_latency("generate", r["generate_s"])
+        if "docx_s" in r:
+            record_latency("save_cover_letter_docx", r["docx_s"])
+    return results
+
+def _template_worker(resume_summary: Dict, job: Dict, output_dir: str) -> Dict:
+    """Runs in a worker process: template letter + DOCX file."""
+    return _write_cover(resume_summary, job, output_dir, prefer_local_llm=False)
+
+def _template_after_timeout(resume_summary: Dict, job: Dict, output_dir: str, timeout: float) -> Dict:
+    """Result for a local-LLM letter that ran past `timeout`: the template letter, written here instead."""
+    print(f"  Cover letter for {job.get('title', 'Unknown')} timed out after {timeout:g}s; using the template letter")
+    try:
+        result = _write_cover(resume_summary, job, output_dir, prefer_local_llm=False)
+    except Exception as e:
+        return {"cover": FAILED_COVER, "docx_path": None, "error": f"timed out after {timeout:g}s, then {e}", "timed_out": True}
+    result["error"] = result["error"] or f"timed out after {timeout:g}s; template letter used"
+    result["timed_out"] = True
+    return result
+
+
+# -----------------------------
+# GPT4All instance pool
+# -----------------------------
+def _available_memory_bytes() -> Optional[int]:
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def llm_pool_size(model_path: Optional[str] = None) -> Tuple[int, int]:
+    """
+    (number of GPT4All instances, threads per instance). LLM_POOL_SIZE wins if
+    set; otherwise as many instances as fit in available RAM while leaving each
+    at least _MIN_THREADS_PER_LLM cores.
+    """
+    cores = os.cpu_count() or 1
+    if LLM_POOL_SIZE and LLM_POOL_SIZE > 0:
+        size = LLM_POOL_SIZE
+    else:
+        by_cores = max(1, cores // _MIN_THREADS_PER_LLM)
+        size = by_cores
+        available = _available_memory_bytes()
+        model_path = model_path or _gc.LOCAL_LLM_MODEL_PATH
+        if available and os.path.exists(model_path):
+            per_model = os.path.getsize(model_path) * _LLM_MEMORY_OVERHEAD
+            size = max(1, min(by_cores, int(available // per_model)))
+    return size, max(1, cores // size)
+
+class LLMPool:
+    """
+    A bounded set of GPT4All instances shared by worker threads. The first slot
+    is the process-wide shared model (see generate_cover.get_llm, represented
+    here by None so every use goes through its lock and idle timer); the other
+    slots get their own instances, loaded on demand and released by close().
+    """
+
+    def __init__(self, size: int, n_threads: Optional[int] = None, model_path: Optional[str] = None):
+        self.size = max(1, size)
+        self.n_threads = n_threads
+        self.model_path = model_path
+        self._idle: "queue.Queue" = queue.Queue()
+        self._extra = []
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                if self._created == 1:
+                    return None  # the shared instance
+                try:
+                    llm = load_llm_instance(self.model_path, n_threads=self.n_threads)
+                except Exception:
+                    self._created -= 1
+                    raise
+                self._extra.append(llm)
+                return llm
+        return self._idle.get()
+
+    def release(self, llm):
+        self._idle.put(llm)
+
+    def close(self):
+        """Close the extra instances that are idle; one still held by a timed-out job is left alone."""
+        while True:
+            try:
+                llm = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if llm is not None:
+                close_llm_instance(llm)
+                self._extra.remove(llm)
+
+    def run(self, resume_summary: Dict, job: Dict, output_dir: str) -> Dict:
+        llm = self.acquire()
+        try:
+            return _write_cover(resume_summary, job, output_dir, prefer_local_llm=True, llm=llm)
+        finally:
+            self.release(llm)
+
+
+# -----------------------------
+# Ordered collection
+# -----------------------------
+def _collect_in_order(futures: List, timeout: Optional[float], on_timeout: Optional[Callable[[int], Dict]] = None) -> List[Dict]:
+    """
+    Wait for every future, returning results in submission order. A job that
+    raises gets a failure result instead of stopping the batch; one that runs
+    longer than `timeout` seconds (from when it started, not while it was
+    queued) gets on_timeout(index), or a failure result, and is no longer
+    waited for. Its task keeps running: the caller stops it (see
+    _shutdown_executor) or lets it finish. Timed-out results have "timed_out".
+    """
+    results: List[Optional[Dict]] = [None] * len(futures)
+    started: Dict[int, float] = {}
+    pending = set(range(len(futures)))
+    while pending:
+        wait([futures[i] for i in pending], timeout=0.5, return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        for i in sorted(pending):
+            fut = futures[i]
+            if fut.done():
+                pending.discard(i)
+                try:
+                    results[i] = fut.result()
+                except Exception as e:
+                    results[i] = {"cover": FAILED_COVER, "docx_path": None, "error": str(e)}
+            elif fut.running():
+                started.setdefault(i, now)
+                if timeout and now - started[i] > timeout:
+                    pending.discard(i)
+                    if on_timeout is not None:
+                        results[i] = on_timeout(i)
+                    else:
+                        results[i] = {"cover": FAILED_COVER, "docx_path": None,
+                                      "error": f"timed out after {timeout:g}s", "timed_out": True}
+    return results
+
+def _shutdown_executor(executor, terminate: bool = False):
+    """
+    Stop `executor` without waiting. With `terminate`, the worker processes of
+    a ProcessPoolExecutor are killed, so a task that timed out does not keep
+    running after the batch; threads cannot be killed and are left to finish.
+    """
+    if terminate and hasattr(executor, "terminate_workers"):   # Python 3.14+
+        executor.terminate_workers()
+        return
+    processes = list((getattr(executor, "_processes", None) or {}).values()) if terminate else []
+    executor.shutdown(wait=False, cancel_futures=True)
+    for proc in processes:
+        if proc.is_alive():
+            proc.terminate()
+
+def generate_covers_parallel(resume_summary: Dict, jobs: List[Dict], output_dir: str, prefer_local_llm: bool = True, workers: Optional[int] = None, timeout: Optional[float] = None) -> List[Dict]:
+    """
+    Generate and save cover letters for `jobs` in parallel.
+
+    Template letters and DOCX files are produced in a process pool (one worker
+    per core by default); local-LLM letters use a thread pool over an LLMPool of
+    model instances sized to RAM and cores. Returns one dict per job, in order,
+    with keys cover, docx_path and error (None on success).
+
+    `timeout` (COVER_JOB_TIMEOUT) bounds each letter from when it starts. A
+    template worker that exceeds it gets a failed result and the worker
+    processes are terminated once the batch is done. A local-LLM letter that
+    exceeds it gets the template letter instead; its thread cannot be stopped
+    and finishes in the background, which LLM_TIME_BUDGET keeps short.
+    """
+    if not jobs:
+        return []
+    timeout = COVER_JOB_TIMEOUT if timeout is None else timeout
+    use_llm = prefer_local_llm and llm_available()
+
+    if use_llm:
+        size, _ = llm_pool_size()
+        size = min(size, len(jobs))
+        n_threads = max(1, (os.cpu_count() or 1) // size)
+        print(f"  Using {size} local LLM instance(s), {n_threads} thread(s) each")
+        pool = LLMPool(size, n_threads=n_threads if size > 1 else None)
+        executor = ThreadPoolExecutor(max_workers=size)
+        try:
+            futures = [executor.submit(pool.run, resume_summary, job, output_dir) for job in jobs]
+            fallback = lambda i: _template_after_timeout(resume_summary, jobs[i], output_dir, timeout)
+            return _record_latencies(_collect_in_order(futures, timeout, fallback))
+        finally:
+            _shutdown_executor(executor)
+            pool.close()
+
+    workers = workers or COVER_WORKERS or os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        # not worth starting processes for a single job
+        results = []
+        for job in jobs:
+            try:
+                results.append(_template_worker(resume_summary, job, output_dir))
+            except Exception as e:
+                results.append({"cover": FAILED_COVER, "docx_path": None, "error": str(e)})
+        return _record_latencies(results)
+
+    print(f"  Using {workers} worker processes for template cover letters")
+    executor = ProcessPoolExecutor(max_workers=workers)
+    results: List[Dict] = []
+    try:
+        futures = [executor.submit(_template_worker, resume_summary, job, output_dir) for job in jobs]
+        results = _collect_in_order(futures, timeout)
+        return _record_latencies(results)
+    finally:
+        _shutdown_executor(executor, terminate=any(r.get("timed_out") for r in results))
+
+def _finish_cover(job: Dict, future, timeout: Optional[float], on_timeout: Optional[Callable[[int], Dict]] = None) -> Tuple[Dict, Dict]:
+    return job, _record_latencies(_collect_in_order([future], timeout, on_timeout))[0]
+
+def stream_covers(resume_summary: Dict, jobs: Iterable[Dict], output_dir: str, prefer_local_llm: bool = True, workers: Optional[int] = None, timeout: Optional[float] = None, max_pending: Optional[int] = None) -> Iterator[Tuple[Dict, Dict]]:
+    """
+    Streaming generate_covers_parallel: jobs are submitted to the worker pool
+    as they arrive from `jobs` and (job, result) pairs are yielded in input
+    order as soon as each letter is done. At most `max_pending` jobs (default
+    twice the pool size) are in flight, so a long stream never queues up in
+    memory. Results have the same keys as generate_covers_parallel's, and
+    timeouts are handled the same way; a timed-out template worker keeps its
+    slot until the stream ends.
+    """
+    timeout = COVER_JOB_TIMEOUT if timeout is None else timeout
+    use_llm = prefer_local_llm and llm_available()
+    pool = None
+    if use_llm:
+        size, _ = llm_pool_size()
+        n_threads = max(1, (os.cpu_count() or 1) // size)
+        print(f"  Using {size} local LLM instance(s), {n_threads} thread(s) each")
+        pool = LLMPool(size, n_threads=n_threads if size > 1 else None)
+        executor = ThreadPoolExecutor(max_workers=size)
+        submit = lambda job: executor.submit(pool.run, resume_summary, job, output_dir)
+    else:
+        size = workers or COVER_WORKERS or os.cpu_count() or 1
+        print(f"  Using {size} worker process(es) for template cover letters")
+        executor = ProcessPoolExecutor(max_workers=size)
+        submit = lambda job: executor.submit(_template_worker, resume_summary, job, output_dir)
+    max_pending = max(1, max_pending or 2 * size)
+
+    in_flight: "deque[Tuple[Dict, object]]" = deque()
+    timed_out = False
+
+    def finish():
+        nonlocal timed_out
+        job, future = in_flight.popleft()
+        fallback = (lambda _: _template_after_timeout(resume_summary, job, output_dir, timeout)) if use_llm else None
+        job, result = _finish_cover(job, future, timeout, fallback)
+        timed_out = timed_out or bool(result.get("timed_out"))
+        return job, result
+
+    try:
+        for job in jobs:
+            in_flight.append((job, submit(job)))
+            while in_flight and (len(in_flight) >= max_pending or in_flight[0][1].done()):
+                yield finish()
+        while in_flight:
+            yield finish()
+    finally:
+        _shutdown_executor(executor, terminate=timed_out and not use_llm)
+        if pool is not None:
+            pool.close()
@@ -0,0 +1,128 @@
+# src/embedding_cache.py
+import os
+import sqlite3
+import hashlib
+import threading
+import time
+from typing import Dict, List, Optional
+import numpy as np
+
+# Import config with defaults for CI/testing
+try:
+    from config import EMBED_CACHE_PATH, EMBED_CACHE_MAX_ENTRIES
+except ImportError:
+    EMBED_CACHE_PATH = "outputs/.cache/embeddings.sqlite"
+    EMBED_CACHE_MAX_ENTRIES = 200_000
+
+_SQL_CHUNK = 500  # stay well below SQLite's bound-parameter limit
+
+
+def embedding_key(model_name: str, text: str) -> str:
+    """Stable cache key for a (model, text) pair."""
+    h = hashlib.sha1(model_name.encode("utf-8"))
+    h.update(b"\0")
+    h.update((text or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Persistent store of text embeddings backed by SQLite (float32 blobs).
+
+    Entries are keyed by a hash of (model name, text). The cache is bound to a
+    single model: opening it with a different model name drops every stored
+    vector. When more than max_entries vectors are stored, the least recently
+    used ones are evicted.
+    """
+
+    def __init__(self, model_name: str, path: Optional[str] = None, max_entries: Optional[int] = None):
+        self.model_name = model_name
+        self.path = path or EMBED_CACHE_PATH
+        self.max_entries = max_entries if max_entries is not None else EMBED_CACHE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY, dim INTEGER NOT NULL, vec BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)")
+        self._check_model()
+        self._conn.commit()
+
+    def _check_model(self):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'model_name'").fetchone()
+        if row and row[0] == self.model_name:
+            return
+        if row:
+            print(f"  Embedding model changed ({row[0]} -> {self.model_name}); clearing embedding cache")
+        self._conn.execute("DELETE FROM embeddings")
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('model_name', ?)", (self.model_name,))
+
+    def key(self, text: str) -> str:
+        return embedding_key(self.model_name, text)
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Return {key: vector} for every key present in the cache."""
+        found: Dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(keys))
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(unique), _SQL_CHUNK):
+                chunk = unique[i:i + _SQL_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, dim, vec FROM embeddings WHERE key IN ({marks})", chunk
+                ).fetchall()
+                for k, dim, blob in rows:
+                    found[k] = np.frombuffer(blob, dtype=np.float32, count=dim)
+            if found:
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, k) for k in found]
+                )
+                self._conn.commit()
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        """Store vectors and evict least recently used entries beyond max_entries."""
+        if not items:
+            return
+        now = time.time()
+        rows = []
+        for k, vec in items.items():
+            v = np.ascontiguousarray(vec, dtype=np.float32).ravel()
+            rows.append((k, int(v.shape[0]), v.tobytes(), now))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dim, vec, last_used) VALUES (?, ?, ?, ?)", rows
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        if not self.max_entries or self.max_entries <= 0:
+            return
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE key IN "
+                "(SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?)", (excess,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,6 +1,9 @@
 # src/export_results.py
-import pandas as pd
-from typing import List, Dict
+import os
+import urllib.parse
+import uuid
+from datetime import datetime
+from typing import List, Dict, Optional
 
 # Import config with defaults for CI/testing
 try:
@@ -8,23 +11,217 @@ try:
 except ImportError:
     OUTPUT_CSV = "outputs/jobs.csv"
 
+try:
+    from config import EXPORT_DATASET_FORMAT, EXPORT_DATASET_DIR, EXPORT_DATASET_CHUNK_ROWS
+except ImportError:
+    EXPORT_DATASET_FORMAT = "parquet"   # "parquet", "arrow" (Arrow IPC) or "" to disable; needs pyarrow
+    EXPORT_DATASET_DIR = "outputs/dataset"
+    EXPORT_DATASET_CHUNK_ROWS = 10_000  # rows per part file
+
+# CSV column -> (job key, value when missing)
+_CSV_FIELDS = {
+    "job_id": ("id", None),
+    "title": ("title", None),
+    "company": ("company", None),
+    "location": ("location", None),
+    "similarity": ("similarity", None),
+    "link": ("redirect_url", None),
+    "cover_letter": ("cover_letter", ""),
+}
+CSV_COLUMNS = list(_CSV_FIELDS)
+
+def csv_row(job: Dict) -> Dict:
+    return {column: job.get(key, default) for column, (key, default) in _CSV_FIELDS.items()}
+
 def export_to_csv(enriched_jobs: List[Dict], path: str = None):
+    import pandas as pd  # heavy; only needed once results are exported
     if path is None:
         path = OUTPUT_CSV
-    rows = []
-    for j in enriched_jobs:
-        rows.append({
-            "job_id": j.get("id"),
-            "title": j.get("title"),
-            "company": j.get("company"),
-            "location": j.get("location"),
-            "similarity": j.get("similarity"),
-            "link": j.get("redirect_url"),
-            "cover_letter": j.get("cover_letter", "")
-        })
-    df = pd.DataFrame(rows)
+    # built column by column: no intermediate dict per row
+    df = pd.DataFrame(
+        {column: [job.get(key, default) for job in enriched_jobs] for column, (key, default) in _CSV_FIELDS.items()},
+        columns=CSV_COLUMNS,
+    )
     df.to_csv(path, index=False)
     return df
 
+class CSVRowWriter:
+    """
+    Appends jobs to a CSV one row at a time, in the same format as
+    export_to_csv, for the streaming pipeline. Each row is flushed as it is
+    written, so the file can be read while the run is still going and
+    nothing is held in memory.
+    """
+
+    def __init__(self, path: str = None):
+        import csv
+        self.path = path or OUTPUT_CSV
+        self.rows = 0
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_COLUMNS)
+        self._writer.writeheader()
+        self._file.flush()
+
+    def write(self, job: Dict):
+        self._writer.writerow(csv_row(job))
+        self._file.flush()
+        self.rows += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# -----------------------------
+# Partitioned dataset (Parquet / Arrow IPC)
+# -----------------------------
+_EXTENSIONS = {"parquet": "parquet", "arrow": "arrow"}
+
+def _dataset_schema():
+    import pyarrow as pa
+    text = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("run_id", text),
+        ("run_at", pa.timestamp("s")),
+        ("resume", text),
+        ("job_id", pa.string()),
+        ("title", text),
+        ("company", text),
+        ("location", text),
+        ("source", text),
+        ("similarity", pa.float32()),
+        ("link", pa.string()),
+        ("cover_letter_path", pa.string()),
+    ])
+
+def dataset_available(fmt: Optional[str] = None) -> bool:
+    """True when the dataset export is enabled and pyarrow is installed."""
+    fmt = EXPORT_DATASET_FORMAT if fmt is None else fmt
+    if not fmt:
+        return False
+    if fmt not in _EXTENSIONS:
+        raise ValueError(f"Unknown dataset format {fmt!r}; use 'parquet' or 'arrow'")
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class DatasetWriter:
+    """
+    Appends one run's results to a dataset partitioned by date and query:
+
+        <root>/date=YYYY-MM-DD/query=<query>/part-<run id>-<n>.parquet
+
+    Every run adds new part files and never rewrites old ones. Repeated
+    strings (run, resume, title, company, location, source) are dictionary
+    encoded; cover letters are stored by reference (the DOCX path), not
+    inline. Rows are buffered and written EXPORT_DATASET_CHUNK_ROWS at a time,
+    so the streaming pipeline can use write() row by row. `fmt` is "parquet"
+    or "arrow" (Arrow IPC files, uncompressed and fastest to memory-map).
+    """
+
+    def __init__(self, query: str, resume: str = "", root: Optional[str] = None, fmt: Optional[str] = None,
+                 chunk_rows: Optional[int] = None, run_at: Optional[datetime] = None):
+        self.fmt = fmt or EXPORT_DATASET_FORMAT or "parquet"
+        if self.fmt not in _EXTENSIONS:
+            raise ValueError(f"Unknown dataset format {self.fmt!r}; use 'parquet' or 'arrow'")
+        self.run_at = (run_at or datetime.now()).replace(microsecond=0)
+        self.run_id = f"{self.run_at:%Y%m%d_%H%M%S}-{uuid.uuid4().hex[:8]}"
+        self.resume = resume or ""
+        self.chunk_rows = chunk_rows or EXPORT_DATASET_CHUNK_ROWS
+        # hive-style partition directories; the query is URI-encoded, as pyarrow expects
+        self.directory = os.path.join(
+            root or EXPORT_DATASET_DIR,
+            f"date={self.run_at:%Y-%m-%d}",
+            f"query={urllib.parse.quote(query or '', safe='')}",
+        )
+        self.paths: List[str] = []
+        self.rows = 0
+        self._buffer: List[Dict] = []
+
+    def write(self, job: Dict):
+        self._buffer.append(job)
+        if len(self._buffer) >= self.chunk_rows:
+            self.flush()
+
+    def write_many(self, jobs: List[Dict]):
+        for job in jobs:
+            self.write(job)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        import pyarrow as pa
+        jobs, self._buffer = self._buffer, []
+        n = len(jobs)
+        columns = {
+            "run_id": [self.run_id] * n,
+            "run_at": [self.run_at] * n,
+            "resume": [self.resume] * n,
+            "job_id": [None if j.get("id") is None else str(j.get("id")) for j in jobs],
+            "title": [j.get("title") for j in jobs],
+            "company": [j.get("company") for j in jobs],
+            "location": [j.get("location") for j in jobs],
+            "source": [j.get("source") for j in jobs],
+            "similarity": [j.get("similarity") for j in jobs],
+            "link": [j.get("redirect_url") for j in jobs],
+            "cover_letter_path": [j.get("docx_path") for j in jobs],
+        }
+        schema = _dataset_schema()
+        table = pa.table(
+            {name: pa.array(values, type=schema.field(name).type) for name, values in columns.items()},
+            schema=schema,
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"part-{self.run_id}-{len(self.paths):04d}.{_EXTENSIONS[self.fmt]}")
+        tmp = path + ".tmp"
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, tmp, compression="zstd")
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(table, tmp, compression="uncompressed")
+        # readers never see a half-written part file
+        os.replace(tmp, path)
+        self.paths.append(path)
+        self.rows += n
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def export_to_dataset(enriched_jobs: List[Dict], query: str, resume: str = "", root: Optional[str] = None, fmt: Optional[str] = None) -> List[str]:
+    """Append `enriched_jobs` to the partitioned dataset (see DatasetWriter); returns the part files written."""
+    with DatasetWriter(query, resume=resume, root=root, fmt=fmt) as writer:
+        writer.write_many(enriched_jobs)
+    return writer.paths
+
+def read_dataset(columns: Optional[List[str]] = None, filter=None, root: Optional[str] = None, fmt: Optional[str] = None):
+    """
+    Load the exported dataset as a DataFrame, reading only `columns` (the
+    partition columns date and query can be selected too) and, with a
+    pyarrow.dataset `filter` such as ds.field("query") == "data analyst",
+    only the matching partitions.
+    """
+    import pyarrow.dataset as ds
+    fmt = fmt or EXPORT_DATASET_FORMAT or "parquet"
+    dataset = ds.dataset(
+        root or EXPORT_DATASET_DIR,
+        format="parquet" if fmt == "parquet" else "ipc",
+        partitioning="hive",
+        exclude_invalid_files=True,
+    )
+    return dataset.to_table(columns=columns, filter=filter).to_pandas()
+
 if __name__ == "__main__":
     print("Example export")
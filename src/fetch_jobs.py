@@ -1,8 +1,18 @@
 # src/fetch_jobs.py
 import requests
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+import requests.adapters
+from typing import Iterator, List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import hashlib
+import queue
+import threading
+import time
+import urllib.parse
+from .http_cache import CachedResponse
+from .html_parsing import SelectorPlan, make_soup
+from .job_record import JobRecord
+from .profiling import record_latency
+from .streaming import STREAM_QUEUE_SIZE, put_until_stopped
 
 # Optional config overrides
 try:
@@ -11,6 +21,23 @@ except Exception:
     SCRAPE_RESULTS_LIMIT = 20
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
 
+try:
+    from config import SCRAPE_MAX_PAGES, SCRAPE_MAX_CONCURRENCY_PER_HOST
+except Exception:
+    SCRAPE_MAX_PAGES = 5
+    SCRAPE_MAX_CONCURRENCY_PER_HOST = 4
+
+try:
+    from config import ENABLED_JOB_SOURCES, SOURCE_TIMEOUT
+except Exception:
+    ENABLED_JOB_SOURCES = ["indeed"]
+    SOURCE_TIMEOUT = 30
+
+try:
+    from config import HTTP_CACHE_ENABLED
+except Exception:
+    HTTP_CACHE_ENABLED = True
+
 def _hash_id(s: str) -> str:
     return hashlib.sha1(s.encode("utf-8")).hexdigest()[:12]
 
@@ -23,132 +50,631 @@ def _clean(t: str) -> str:
 def _get_text(el) -> str:
     return el.get_text(" ", strip=True) if el else ""
 
-def fetch_jobs(query: str, location: str = "", page: int = 1, results_per_page: Optional[int] = None) -> List[Dict]:
+# -----------------------------
+# Pooled HTTP session
+# -----------------------------
+_session = None
+_session_lock = threading.Lock()
+_http_cache = None
+_host_semaphores: Dict[str, threading.Semaphore] = {}
+
+def get_session() -> requests.Session:
+    """Shared, connection-pooled session so page requests reuse TCP/TLS connections."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=8, pool_maxsize=max(SCRAPE_MAX_CONCURRENCY_PER_HOST, 1)
+            )
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            s.headers.update(_headers())
+            s.headers["Accept-Language"] = "en-US,en;q=0.9"
+            _session = s
+        return _session
+
+def _host_semaphore(url: str) -> threading.Semaphore:
+    host = urllib.parse.urlsplit(url).netloc
+    with _session_lock:
+        sem = _host_semaphores.get(host)
+        if sem is None:
+            sem = threading.Semaphore(max(SCRAPE_MAX_CONCURRENCY_PER_HOST, 1))
+            _host_semaphores[host] = sem
+        return sem
+
+def get_http_cache():
+    """Process-wide HTTP response cache, or None if disabled/unavailable."""
+    global _http_cache
+    with _session_lock:
+        if _http_cache is None and HTTP_CACHE_ENABLED:
+            try:
+                from .http_cache import HTTPCache
+                _http_cache = HTTPCache()
+            except Exception as e:
+                print(f"  Warning: HTTP cache unavailable: {e}")
+                return None
+        return _http_cache
+
+def _network_get(url: str, timeout: float, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    with _host_semaphore(url):
+        return get_session().get(url, timeout=timeout, headers=headers)
+
+def http_get(url: str, timeout: float = 10, use_cache: bool = True):
     """
-    Scrape jobs using HTML parsing (BeautifulSoup). Current sources:
-    - Indeed (primary source)
-    - FallbackSimulator (demo data for testing when scraping fails)
+    GET through the pooled session, capped at SCRAPE_MAX_CONCURRENCY_PER_HOST per host.
+
+    With the HTTP cache enabled, responses younger than HTTP_CACHE_TTL are served
+    from disk and older ones are revalidated with ETag / Last-Modified, so the
+    returned object may be a CachedResponse; both expose .text and .status_code.
     """
-    limit = results_per_page or SCRAPE_RESULTS_LIMIT
-    query_slug = "-".join(query.lower().split())
+    cache = get_http_cache() if use_cache else None
+    if cache is None:
+        resp = _network_get(url, timeout)
+        resp.raise_for_status()
+        return resp
+
+    entry = cache.lookup(url)
+    if entry and entry["fresh"]:
+        cache.touch(url)
+        return CachedResponse(url, entry["text"], from_cache=True)
+
+    headers = {}
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+    resp = _network_get(url, timeout, headers=headers or None)
+    if entry and resp.status_code == 304:
+        cache.touch(url, revalidated=True)
+        return CachedResponse(url, entry["text"], from_cache=True, revalidated=True)
+    resp.raise_for_status()
+    cache.store(url, resp.text, etag=resp.headers.get("ETag"), last_modified=resp.headers.get("Last-Modified"))
+    return resp
+
+# -----------------------------
+# Indeed
+# -----------------------------
+INDEED_BASE = "https://www.indeed.com"
+INDEED_PAGE_SIZE = 10  # Indeed paginates with start=0,10,20,...
+
+def _indeed_url(query: str, location: str, page: int, base: str = INDEED_BASE) -> str:
+    q = urllib.parse.quote(query)
+    l = urllib.parse.quote(location or "")
+    url = f"{base}/jobs?q={q}&l={l}"
+    if page > 1:
+        url += f"&start={(page - 1) * INDEED_PAGE_SIZE}"
+    return url
+
+# Indeed uses multiple possible selectors; see SelectorPlan for how the chains are applied
+INDEED_PLAN = SelectorPlan(
+    cards=["div.job_seen_beacon", "div.jobsearch-SerpJobCard", "div[class*='job_']", "a[id^='job_']"],
+    fields={
+        "title": ["h2.jobTitle span", "a.jcs-JobTitle", "h2 a"],
+        "company": ["span.companyName", "span[data-testid='company-name']"],
+        "location": ["div.companyLocation", "div[data-testid='text-location']"],
+        "description": ["div.job-snippet", "div.jobCardShelfContainer"],
+        "link": ["a[id^='job_']", "a.jcs-JobTitle", "h2 a"],
+    },
+)
+
+def parse_indeed_html(html: str, query: str, location: str = "", base: str = INDEED_BASE) -> List[Dict]:
+    """Parse an Indeed search results page into job dicts."""
+    q = urllib.parse.quote(query)
+    soup = make_soup(html)
     jobs: List[Dict] = []
 
-    # Indeed scraping (most reliable)
-    print(f"  Attempting Indeed scraping for '{query}'...")
-    try:
-        import urllib.parse
-        q = urllib.parse.quote(query)
-        l = urllib.parse.quote(location or "")
-        base = "https://www.indeed.com"
-        url = f"{base}/jobs?q={q}&l={l}"
+    layout, job_cards = INDEED_PLAN.select_cards(soup)
+
+    for card in job_cards:
+        try:
+            title = _clean(_get_text(INDEED_PLAN.select_field(card, "title", layout)))
+            if not title:
+                continue
+            company = _clean(_get_text(INDEED_PLAN.select_field(card, "company", layout)))
+            loc = _clean(_get_text(INDEED_PLAN.select_field(card, "location", layout))) or location or "Remote"
+            description = _clean(_get_text(INDEED_PLAN.select_field(card, "description", layout))) or "No description available"
+
+            # Extract job URL
+            link_el = INDEED_PLAN.select_field(card, "link", layout)
+            href = link_el["href"] if link_el and link_el.has_attr("href") else None
+            job_url = f"{base}{href}" if href and href.startswith("/") else (href or f"{base}/jobs?q={q}")
+
+            jobs.append({
+                "id": _hash_id(job_url + title + company),
+                "title": title,
+                "company": company or "Unknown",
+                "location": loc,
+                "description": description,
+                "redirect_url": job_url
+            })
+        except Exception as e:
+            print(f"    Warning: Failed to parse job card: {e}")
+            continue
+    return jobs
+
+# -----------------------------
+# Demo data
+# -----------------------------
+_DEMO_COMPANIES = [
+    "Tech Innovations Inc.", "Global Solutions Ltd.", "StartUp Ventures", 
+    "Enterprise Corp", "Consulting Partners", "DataTech Systems",
+    "CloudFirst Solutions", "InnovateX", "FutureLabs", "DigitalTransform",
+    "AI Pioneers", "QuantumLeap", "NextGen Systems", "Visionary Labs",
+    "Strategic Insights", "Growth Partners", "Market Leaders", 
+    "Industry Experts", "Professional Services", "Career Advancers"
+]
+_DEMO_TITLE_PATTERNS = [
+    "Senior {q}", "{q} - Remote", "Junior {q}", "Lead {q}",
+    "{q} Consultant", "Principal {q}", "{q} Specialist", "Staff {q}",
+    "{q} Analyst", "{q} Engineer", "{q} Architect", "{q} Manager",
+    "Director of {q}", "VP of {q}", "{q} Associate", "{q} Coordinator",
+    "{q} Intern", "Entry Level {q}", "Experienced {q}", "{q} Expert"
+]
+_DEMO_LOCATIONS = [
+    "Remote", "San Francisco, CA", "New York, NY",
+    "Chicago, IL", "Austin, TX", "Seattle, WA", "Boston, MA",
+    "Los Angeles, CA", "Washington, DC", "Denver, CO", "Atlanta, GA",
+    "Miami, FL", "Dallas, TX", "Philadelphia, PA", "Phoenix, AZ",
+    "Portland, OR", "Minneapolis, MN", "Charlotte, NC", "Houston, TX"
+]
+
+def generate_demo_jobs(query: str, location: str = "", limit: int = 20) -> List[Dict]:
+    """Generate up to 20 diverse demo jobs (used when scraping returns nothing)."""
+    titles = [t.format(q=query.title()) for t in _DEMO_TITLE_PATTERNS]
+    locations = [location or "Remote"] + _DEMO_LOCATIONS
+    
+    demo_jobs = []
+    for i in range(min(limit, 20)):  # Generate up to limit or 20 jobs
+        demo_jobs.append({
+            "id": _hash_id(f"demo-{query}-{i}"),
+            "title": titles[i % len(titles)],
+            "company": _DEMO_COMPANIES[i % len(_DEMO_COMPANIES)],
+            "location": locations[i % len(locations)],
+            "description": f"We are seeking a skilled {query} with strong problem-solving abilities and relevant experience. This position offers excellent growth opportunities and a competitive compensation package. The ideal candidate will have experience with industry-standard tools and technologies.",
+            "redirect_url": f"https://example.com/jobs/demo-{i}"
+        })
+    return demo_jobs
+
+_SYNTHETIC_SKILLS = [
+    "Python", "SQL", "Pandas", "Excel", "Power BI", "Tableau", "Machine Learning",
+    "Scikit-learn", "TensorFlow", "PyTorch", "NLP", "Deep Learning", "Linux", "Git",
+    "Java", "JavaScript", "React", "Docker", "Kubernetes", "AWS", "Airflow", "Spark",
+]
+_SYNTHETIC_DUTIES = [
+    "build and maintain dashboards for business stakeholders",
+    "design data pipelines that feed our analytics warehouse",
+    "train, evaluate and deploy predictive models",
+    "analyse product usage to guide roadmap decisions",
+    "automate weekly reporting and KPI tracking",
+    "partner with engineering to ship data-driven features",
+    "run A/B tests and communicate results to leadership",
+    "clean, validate and document large datasets",
+]
+
+def generate_synthetic_jobs(query: str, n: int, location: str = "", seed: int = 0) -> List[Dict]:
+    """
+    Generate `n` varied demo-style jobs for benchmarks and load tests. Unlike
+    generate_demo_jobs, descriptions differ per job (skills and duties are mixed
+    deterministically from `seed`), so matching and caching see realistic input.
+    """
+    import random
+    rng = random.Random(seed)
+    titles = [t.format(q=query.title()) for t in _DEMO_TITLE_PATTERNS]
+    locations = [location or "Remote"] + _DEMO_LOCATIONS
+    jobs = []
+    for i in range(n):
+        skills = rng.sample(_SYNTHETIC_SKILLS, 4)
+        duties = rng.sample(_SYNTHETIC_DUTIES, 2)
+        company = _DEMO_COMPANIES[rng.randrange(len(_DEMO_COMPANIES))]
+        jobs.append({
+            "id": _hash_id(f"synthetic-{seed}-{query}-{i}"),
+            "title": titles[rng.randrange(len(titles))],
+            "company": company,
+            "location": locations[rng.randrange(len(locations))],
+            "description": (
+                f"{company} is hiring a {query} to {duties[0]} and {duties[1]}. "
+                f"Required: {', '.join(skills[:3])}. Nice to have: {skills[3]}. "
+                f"Posting #{i}."
+            ),
+            "redirect_url": f"https://example.com/jobs/synthetic-{seed}-{i}"
+        })
+    return jobs
+
+# -----------------------------
+# Job sources
+# -----------------------------
+class JobSource:
+    """
+    A job board the pipeline can query.
+
+    Subclasses implement fetch() (download one raw result page) and parse()
+    (raw page -> list of job dicts). normalize() maps each parsed item onto the
+    common JobRecord shape: id, title, company, location, description,
+    redirect_url and source. iter_pages() ties the three together, yielding
+    jobs page by page; search() collects them and is what fetch_jobs() calls,
+    one source per thread (stream_jobs() consumes iter_pages() directly).
+    """
+    name = "base"
+    timeout: float = 30.0   # seconds fetch_jobs waits for this source
+    fallback = False        # fallback sources only run when no other source returned jobs
+    parser_version = 1      # bump when parse() output changes to invalidate cached parses
+
+    def fetch(self, query: str, location: str = "", page: int = 1) -> Optional[str]:
+        """Return the raw result page, or None when there are no more pages."""
+        raise NotImplementedError
+
+    def parse(self, raw: str, query: str, location: str = "") -> List[Dict]:
+        raise NotImplementedError
+
+    def normalize(self, item: Dict, location: str = "") -> JobRecord:
+        title = _clean(item.get("title"))
+        company = _clean(item.get("company")) or "Unknown"
+        url = item.get("redirect_url") or ""
+        return JobRecord(
+            id=item.get("id") or _hash_id(url + title + company),
+            title=title,
+            company=company,
+            location=_clean(item.get("location")) or location or "Remote",
+            description=_clean(item.get("description")) or "No description available",
+            redirect_url=url,
+            source=self.name,
+        )
+
+    def page_jobs(self, query: str, location: str = "", page: int = 1) -> Optional[List[JobRecord]]:
+        """
+        fetch() + parse() + normalize() for one page, or None past the last page.
+        Parsed results are cached by a hash of the page body, so a page that has
+        not changed since the last run is not parsed again.
+        """
+        start = time.perf_counter()
+        raw = self.fetch(query, location, page)
+        if raw is None:
+            return None
+        record_latency("fetch", time.perf_counter() - start)
+        cache = get_http_cache()
+        key = None
+        if cache is not None:
+            key = hashlib.sha1(
+                f"{self.name}\0{self.parser_version}\0{query}\0{location}\0".encode("utf-8") + raw.encode("utf-8")
+            ).hexdigest()
+            cached = cache.get_parsed(key)
+            if cached is not None:
+                return [JobRecord(job) for job in cached]
+        jobs = [self.normalize(item, location) for item in self.parse(raw, query, location)]
+        if cache is not None:
+            cache.put_parsed(key, jobs)
+        return jobs
+
+    def iter_pages(self, query: str, location: str = "", page: int = 1, limit: int = 20) -> Iterator[List[Dict]]:
+        """
+        Fetch pages sequentially from `page` until `limit` jobs or an empty
+        page, yielding each page's new jobs as soon as it is parsed.
+        """
+        seen = set()
+        while len(seen) < limit:
+            parsed = self.page_jobs(query, location, page)
+            if not parsed:
+                break
+            fresh = []
+            for job in parsed:
+                if job["title"] and job["id"] not in seen and len(seen) < limit:
+                    seen.add(job["id"])
+                    fresh.append(job)
+            yield fresh
+            page += 1
+
+    def search(self, query: str, location: str = "", page: int = 1, limit: int = 20) -> List[Dict]:
+        """Up to `limit` jobs from iter_pages(), as one list."""
+        return [job for jobs in self.iter_pages(query, location, page, limit) for job in jobs]
+
+
+class IndeedSource(JobSource):
+    """Indeed search results; pages are fetched concurrently (see iter_pages())."""
+    name = "indeed"
+    parser_version = 2
+
+    def __init__(self, base_url: str = INDEED_BASE, timeout: Optional[float] = None):
+        self.base_url = base_url
+        if timeout is not None:
+            self.timeout = timeout
+
+    def fetch(self, query: str, location: str = "", page: int = 1) -> Optional[str]:
+        url = _indeed_url(query, location, page, base=self.base_url)
         print(f"  Fetching: {url}")
-        
-        headers = _headers()
-        headers["Accept-Language"] = "en-US,en;q=0.9"
-        
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        
-        # Indeed uses multiple possible selectors
-        job_cards = soup.select("div.job_seen_beacon") or soup.select("div.jobsearch-SerpJobCard") or soup.select("div[class*='job_']") or soup.select("a[id^='job_']")
-        print(f"  Found {len(job_cards)} job cards")
-        
-        for card in job_cards:
-            try:
-                # Extract title
-                title_el = card.select_one("h2.jobTitle span") or card.select_one("a.jcs-JobTitle") or card.select_one("h2 a")
-                title = _clean(_get_text(title_el))
-                
-                # Extract company
-                company_el = card.select_one("span.companyName") or card.select_one("span[data-testid='company-name']")
-                company = _clean(_get_text(company_el))
-                
-                # Extract location
-                loc_el = card.select_one("div.companyLocation") or card.select_one("div[data-testid='text-location']")
-                loc = _clean(_get_text(loc_el)) or location or "Remote"
-                
-                # Extract description snippet
-                desc_el = card.select_one("div.job-snippet") or card.select_one("div.jobCardShelfContainer")
-                description = _clean(_get_text(desc_el)) or "No description available"
-                
-                # Extract job URL
-                link_el = card.select_one("a[id^='job_']") or card.select_one("a.jcs-JobTitle") or card.select_one("h2 a")
-                href = link_el["href"] if link_el and link_el.has_attr("href") else None
-                job_url = f"{base}{href}" if href and href.startswith("/") else (href or f"{base}/jobs?q={q}")
-                
-                if not title:
-                    continue
-                
-                jobs.append({
-                    "id": _hash_id(job_url + title + company),
-                    "title": title,
-                    "company": company or "Unknown",
-                    "location": loc,
-                    "description": description,
-                    "redirect_url": job_url
-                })
-                
-                if len(jobs) >= limit:
+        return http_get(url, timeout=10).text
+
+    def parse(self, raw: str, query: str, location: str = "") -> List[Dict]:
+        return parse_indeed_html(raw, query, location, base=self.base_url)
+
+    def _fetch_page(self, query: str, location: str, page: int) -> List[Dict]:
+        jobs = self.page_jobs(query, location, page) or []
+        print(f"  Page {page}: found {len(jobs)} job cards")
+        return jobs
+
+    def iter_pages(self, query: str, location: str = "", page: int = 1, limit: int = 20, max_pages: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Fetch up to `limit` jobs, requesting up to `max_pages` result pages
+        concurrently. Jobs are deduplicated by id across pages and pages are
+        yielded in page order; outstanding pages are cancelled once the limit
+        is met, a page comes back empty or the caller stops iterating.
+        """
+        if max_pages is None:
+            max_pages = max(1, min(SCRAPE_MAX_PAGES, -(-limit // INDEED_PAGE_SIZE)))
+        pages = list(range(page, page + max_pages))
+        results: Dict[int, List[Dict]] = {}
+        seen = set()
+        next_page = page
+        done = False
+
+        pool = ThreadPoolExecutor(max_workers=max(1, min(SCRAPE_MAX_CONCURRENCY_PER_HOST, len(pages))))
+        futures = {pool.submit(self._fetch_page, query, location, p): p for p in pages}
+        try:
+            for fut in as_completed(futures):
+                p = futures[fut]
+                try:
+                    results[p] = fut.result()
+                except Exception as e:
+                    print(f"  Page {p} failed: {e}")
+                    results[p] = []
+                # merge completed pages in order so results don't depend on timing
+                while next_page in results and not done:
+                    page_jobs = results.pop(next_page)
+                    if not page_jobs:
+                        done = True  # ran past the last page of results
+                    fresh = []
+                    for job in page_jobs:
+                        if job["id"] in seen:
+                            continue
+                        seen.add(job["id"])
+                        fresh.append(job)
+                        if len(seen) >= limit:
+                            done = True
+                            break
+                    if fresh:
+                        yield fresh
+                    next_page += 1
+                if done:
                     break
-            except Exception as e:
-                print(f"    Warning: Failed to parse job card: {e}")
+        finally:
+            for f in futures:
+                f.cancel()
+            pool.shutdown(wait=True)
+
+    def search(self, query: str, location: str = "", page: int = 1, limit: int = 20, max_pages: Optional[int] = None) -> List[Dict]:
+        return [job for jobs in self.iter_pages(query, location, page, limit, max_pages) for job in jobs]
+
+
+class DemoSource(JobSource):
+    """Demo data for testing when every real source comes back empty."""
+    name = "demo"
+    fallback = True
+
+    def iter_pages(self, query: str, location: str = "", page: int = 1, limit: int = 20) -> Iterator[List[Dict]]:
+        print(f"  Generating demo job data for testing purposes...")
+        yield [self.normalize(item, location) for item in generate_demo_jobs(query, location, limit)]
+
+
+class HTMLFixtureSource(JobSource):
+    """
+    Serves saved result pages from disk through another source's parser, e.g.
+    HTMLFixtureSource(["page1.html", "page2.html"], IndeedSource()). Used to
+    exercise parsing and fan-out offline.
+    """
+
+    def __init__(self, paths: List[str], parser: JobSource, name: Optional[str] = None):
+        self.paths = list(paths)
+        self.parser = parser
+        self.name = name or f"{parser.name}-fixture"
+
+    def fetch(self, query: str, location: str = "", page: int = 1) -> Optional[str]:
+        if not 1 <= page <= len(self.paths):
+            return None
+        with open(self.paths[page - 1], "r", encoding="utf-8") as f:
+            return f.read()
+
+    def parse(self, raw: str, query: str, location: str = "") -> List[Dict]:
+        return self.parser.parse(raw, query, location)
+
+
+_SOURCES: Dict[str, JobSource] = {}
+
+def register_source(source: JobSource):
+    """Add (or replace) a source in the registry under source.name."""
+    _SOURCES[source.name] = source
+    return source
+
+def get_source(name: str) -> JobSource:
+    return _SOURCES[name]
+
+def enabled_sources() -> List[JobSource]:
+    """Registered sources listed in ENABLED_JOB_SOURCES, plus any fallback sources."""
+    return [src for name, src in _SOURCES.items() if name in ENABLED_JOB_SOURCES or src.fallback]
+
+register_source(IndeedSource(timeout=SOURCE_TIMEOUT))
+register_source(DemoSource())
+
+def _dedup_key(job: Dict):
+    return tuple(_clean(job.get(k)).lower() for k in ("title", "company", "location"))
+
+def _fan_out(sources: List[JobSource], query: str, location: str, page: int, limit: int) -> Dict[str, List[Dict]]:
+    """Run every source's search() in parallel; keep whatever finished within its timeout."""
+    results: Dict[str, List[Dict]] = {}
+    if not sources:
+        return results
+    start = time.monotonic()
+    pool = ThreadPoolExecutor(max_workers=len(sources))
+    futures = {pool.submit(src.search, query, location, page, limit): src for src in sources}
+    pending = set(futures)
+    try:
+        while pending:
+            # drop sources whose own deadline has passed, then wait for the next one
+            now = time.monotonic() - start
+            late = {f for f in pending if now >= futures[f].timeout}
+            for f in late:
+                print(f"  {futures[f].name}: no response within {futures[f].timeout:g}s, skipping")
+            pending -= late
+            if not pending:
+                break
+            next_deadline = min(futures[f].timeout for f in pending)
+            done, _ = wait(pending, timeout=next_deadline - now, return_when=FIRST_COMPLETED)
+            for fut in done:
+                pending.discard(fut)
+                src = futures[fut]
+                try:
+                    results[src.name] = fut.result()
+                    print(f"  {src.name}: Collected {len(results[src.name])} jobs")
+                except Exception as e:
+                    print(f"  {src.name} scraping failed: {e}")
+    finally:
+        # don't block on slow sources; their threads finish in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
+
+def merge_source_results(results: Dict[str, List[Dict]], order: List[str], limit: int) -> List[Dict]:
+    """Interleave per-source results round-robin, dropping cross-source duplicates."""
+    merged: List[Dict] = []
+    seen = set()
+    lists = [results.get(name, []) for name in order]
+    for i in range(max((len(l) for l in lists), default=0)):
+        for lst in lists:
+            if i >= len(lst):
                 continue
-        
-        print(f"  Indeed: Collected {len(jobs)} jobs")
-    except Exception as e:
-        print(f"  Indeed scraping failed: {e}")
+            key = _dedup_key(lst[i])
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(lst[i])
+            if len(merged) >= limit:
+                return merged
+    return merged
+
+def fetch_jobs(query: str, location: str = "", page: int = 1, results_per_page: Optional[int] = None, sources: Optional[List] = None) -> List[Dict]:
+    """
+    Scrape jobs from every enabled source in parallel (see ENABLED_JOB_SOURCES).
+    Built-in sources:
+    - indeed (primary source, multiple pages fetched concurrently)
+    - demo (fallback demo data for testing when scraping fails)
+
+    `sources` overrides the registry with source names or JobSource instances.
+    Results are merged with duplicates on (title, company, location) removed.
+    """
+    limit = results_per_page or SCRAPE_RESULTS_LIMIT
+    if sources is None:
+        selected = enabled_sources()
+    else:
+        selected = [get_source(s) if isinstance(s, str) else s for s in sources]
+    primary = [src for src in selected if not src.fallback]
+    fallbacks = [src for src in selected if src.fallback]
+
+    print(f"  Querying {len(primary)} job source(s) for '{query}': {', '.join(src.name for src in primary)}")
+    results = _fan_out(primary, query, location, page, limit)
+    jobs = merge_source_results(results, [src.name for src in primary], limit)
 
     # Fallback: Generate demo data if no jobs found (for testing)
-    if len(jobs) == 0:
-        print(f"  Generating demo job data for testing purposes...")
-        # Generate 20 diverse demo jobs
-        companies = [
-            "Tech Innovations Inc.", "Global Solutions Ltd.", "StartUp Ventures", 
-            "Enterprise Corp", "Consulting Partners", "DataTech Systems",
-            "CloudFirst Solutions", "InnovateX", "FutureLabs", "DigitalTransform",
-            "AI Pioneers", "QuantumLeap", "NextGen Systems", "Visionary Labs",
-            "Strategic Insights", "Growth Partners", "Market Leaders", 
-            "Industry Experts", "Professional Services", "Career Advancers"
-        ]
-        titles = [
-            f"Senior {query.title()}", f"{query.title()} - Remote", 
-            f"Junior {query.title()}", f"Lead {query.title()}",
-            f"{query.title()} Consultant", f"Principal {query.title()}",
-            f"{query.title()} Specialist", f"Staff {query.title()}",
-            f"{query.title()} Analyst", f"{query.title()} Engineer",
-            f"{query.title()} Architect", f"{query.title()} Manager",
-            f"Director of {query.title()}", f"VP of {query.title()}",
-            f"{query.title()} Associate", f"{query.title()} Coordinator",
-            f"{query.title()} Intern", f"Entry Level {query.title()}",
-            f"Experienced {query.title()}", f"{query.title()} Expert"
-        ]
-        locations = [
-            location or "Remote", "Remote", "San Francisco, CA", "New York, NY",
-            "Chicago, IL", "Austin, TX", "Seattle, WA", "Boston, MA",
-            "Los Angeles, CA", "Washington, DC", "Denver, CO", "Atlanta, GA",
-            "Miami, FL", "Dallas, TX", "Philadelphia, PA", "Phoenix, AZ",
-            "Portland, OR", "Minneapolis, MN", "Charlotte, NC", "Houston, TX"
-        ]
-        
-        demo_jobs = []
-        for i in range(min(limit, 20)):  # Generate up to limit or 20 jobs
-            demo_jobs.append({
-                "id": _hash_id(f"demo-{query}-{i}"),
-                "title": titles[i % len(titles)],
-                "company": companies[i % len(companies)],
-                "location": locations[i % len(locations)],
-                "description": f"We are seeking a skilled {query} with strong problem-solving abilities and relevant experience. This position offers excellent growth opportunities and a competitive compensation package. The ideal candidate will have experience with industry-standard tools and technologies.",
-                "redirect_url": f"https://example.com/jobs/demo-{i}"
-            })
-        jobs = demo_jobs
+    if len(jobs) == 0 and fallbacks:
+        results = _fan_out(fallbacks, query, location, page, limit)
+        jobs = merge_source_results(results, [src.name for src in fallbacks], limit)
         print(f"  Generated {len(jobs)} demo jobs")
 
     print(f"\n  Total jobs scraped: {len(jobs)}")
     return jobs
 
+def _stream_sources(sources: List[JobSource], query: str, location: str, page: int, limit: int, seen: set) -> Iterator[Dict]:
+    """Jobs from every source's iter_pages(), in arrival order, until `limit` or every source is done or late."""
+    if not sources:
+        return
+    q: "queue.Queue" = queue.Queue(maxsize=max(1, STREAM_QUEUE_SIZE))
+    stop = threading.Event()
+
+    def produce(src: JobSource):
+        try:
+            for jobs in src.iter_pages(query, location, page, limit):
+                if not put_until_stopped(q, (src, jobs), stop):
+                    return
+            put_until_stopped(q, (src, None), stop)
+        except Exception as e:
+            put_until_stopped(q, (src, e), stop)
+
+    start = time.monotonic()
+    counts = {src.name: 0 for src in sources}
+    active = set(sources)
+    for src in sources:
+        threading.Thread(target=produce, args=(src,), name=f"stream-{src.name}", daemon=True).start()
+    n = 0
+    try:
+        while active and n < limit:
+            now = time.monotonic() - start
+            late = {src for src in active if now >= src.timeout}
+            for src in late:
+                print(f"  {src.name}: no response within {src.timeout:g}s, skipping")
+            active -= late
+            if not active:
+                break
+            try:
+                src, jobs = q.get(timeout=min(src.timeout for src in active) - now)
+            except queue.Empty:
+                continue
+            if src not in active:
+                continue
+            if jobs is None or isinstance(jobs, Exception):
+                active.discard(src)
+                if isinstance(jobs, Exception):
+                    print(f"  {src.name} scraping failed: {jobs}")
+                else:
+                    print(f"  {src.name}: Collected {counts[src.name]} jobs")
+                continue
+            for job in jobs:
+                key = _dedup_key(job)
+                if key in seen:
+                    continue
+                seen.add(key)
+                counts[src.name] += 1
+                n += 1
+                yield job
+                if n >= limit:
+                    break
+        for src in active:
+            print(f"  {src.name}: Collected {counts[src.name]} jobs")
+    finally:
+        stop.set()
+
+def stream_jobs(query: str, location: str = "", page: int = 1, results_per_page: Optional[int] = None, sources: Optional[List] = None) -> Iterator[Dict]:
+    """
+    Generator version of fetch_jobs(): every source runs in its own thread and
+    jobs are yielded as soon as their result page is parsed, so scoring can
+    start while later pages are still downloading. Jobs arrive in arrival
+    order rather than fetch_jobs()' round-robin order; duplicates on (title,
+    company, location) are dropped the same way. Sources stop early when the
+    caller stops iterating.
+    """
+    limit = results_per_page or SCRAPE_RESULTS_LIMIT
+    if sources is None:
+        selected = enabled_sources()
+    else:
+        selected = [get_source(s) if isinstance(s, str) else s for s in sources]
+    primary = [src for src in selected if not src.fallback]
+    fallbacks = [src for src in selected if src.fallback]
+
+    print(f"  Streaming {len(primary)} job source(s) for '{query}': {', '.join(src.name for src in primary)}")
+    seen: set = set()
+    n = 0
+    for job in _stream_sources(primary, query, location, page, limit, seen):
+        n += 1
+        yield job
+
+    # Fallback: Generate demo data if no jobs found (for testing)
+    if n == 0 and fallbacks:
+        for job in _stream_sources(fallbacks, query, location, page, limit, seen):
+            n += 1
+            yield job
+        print(f"  Generated {n} demo jobs")
+
+    print(f"\n  Total jobs scraped: {n}")
+
 if __name__ == "__main__":
     jobs = fetch_jobs("data analyst", "remote", page=1)
     print(len(jobs))
     for j in jobs[:3]:
-        print(j.get("title"), "-", j.get("company"))
\ No newline at end of file
+        print(j.get("title"), "-", j.get("company"))
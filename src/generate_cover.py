@@ -1,11 +1,15 @@
 # src/generate_cover.py
 from typing import Dict, Optional
 import os
+import re
 import json
+import hashlib
+import threading
+import time
+import weakref
 from datetime import datetime
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+from .profiling import record_latency
 
 # Import config with defaults for CI/testing
 try:
@@ -14,6 +18,119 @@ except ImportError:
     LOCAL_LLM_MODEL_PATH = "models/orca-mini-3b-gguf2-q4_0.gguf"
     COVER_LETTERS_DIR = "cover_letters"
 
+try:
+    from config import LLM_IDLE_TIMEOUT
+except ImportError:
+    LLM_IDLE_TIMEOUT = 300  # seconds; 0 disables idle unloading
+
+try:
+    from config import LLM_MAX_TOKENS, LLM_TIME_BUDGET
+except ImportError:
+    LLM_MAX_TOKENS = 400    # tokens per cover letter
+    LLM_TIME_BUDGET = 120   # seconds of generation per letter; 0 = no limit
+
+try:
+    from config import LLM_PREFIX_CACHE
+except ImportError:
+    LLM_PREFIX_CACHE = True  # evaluate the resume + instructions part of the prompt once per resume
+
+# -----------------------------
+# Shared GPT4All model
+# -----------------------------
+# Loading a GGUF model takes far longer than generating one letter, so the
+# model is loaded once per process and reused until the run ends or it has
+# been idle for LLM_IDLE_TIMEOUT seconds.
+_llm = None
+_llm_lock = threading.RLock()
+_llm_idle_timer = None
+_llm_stats = {"loads": 0, "load_seconds": 0.0, "letters": 0, "generate_seconds": 0.0,
+              "tokens": 0, "first_token_seconds": 0.0, "stopped_at_signature": 0, "stopped_at_budget": 0,
+              "prefix_evals": 0, "prefix_seconds": 0.0, "prefix_reuses": 0}
+_stats_lock = threading.Lock()
+
+def llm_available(model_path: Optional[str] = None) -> bool:
+    """True when gpt4all is installed and the model file exists."""
+    try:
+        import gpt4all  # noqa: F401
+    except Exception:
+        return False
+    return os.path.exists(model_path or LOCAL_LLM_MODEL_PATH)
+
+def load_llm_instance(model_path: Optional[str] = None, n_threads: Optional[int] = None):
+    """Load a new GPT4All instance, recording the load time in the LLM stats."""
+    from gpt4all import GPT4All
+    model_path = model_path or LOCAL_LLM_MODEL_PATH
+    print(f"  Loading local LLM: {model_path}")
+    start = time.perf_counter()
+    llm = GPT4All(model_path, n_threads=n_threads) if n_threads else GPT4All(model_path)
+    elapsed = time.perf_counter() - start
+    with _stats_lock:
+        _llm_stats["loads"] += 1
+        _llm_stats["load_seconds"] += elapsed
+    print(f"  Model loaded in {elapsed:.1f}s")
+    return llm
+
+def close_llm_instance(llm):
+    close = getattr(llm, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception as e:
+            print("  Warning: failed to close local LLM:", e)
+
+def _schedule_idle_unload():
+    global _llm_idle_timer
+    if _llm_idle_timer is not None:
+        _llm_idle_timer.cancel()
+        _llm_idle_timer = None
+    if LLM_IDLE_TIMEOUT and LLM_IDLE_TIMEOUT > 0:
+        _llm_idle_timer = threading.Timer(LLM_IDLE_TIMEOUT, unload_llm)
+        _llm_idle_timer.daemon = True
+        _llm_idle_timer.start()
+
+def get_llm(model_path: Optional[str] = None):
+    """Return the process-wide GPT4All instance, loading it on first use."""
+    global _llm
+    with _llm_lock:
+        if _llm is None:
+            _llm = load_llm_instance(model_path)
+        _schedule_idle_unload()
+        return _llm
+
+def unload_llm():
+    """Release the shared GPT4All instance (safe to call when nothing is loaded)."""
+    global _llm, _llm_idle_timer
+    with _llm_lock:
+        if _llm_idle_timer is not None:
+            _llm_idle_timer.cancel()
+            _llm_idle_timer = None
+        if _llm is None:
+            return
+        close_llm_instance(_llm)
+        _llm = None
+
+def get_llm_stats() -> Dict:
+    """
+    Model load time vs. per-letter generation time for the current process,
+    plus streaming throughput: time to first token (prompt processing) and
+    tokens/sec after it, how many letters stopped early, and how often the
+    shared prompt prefix was evaluated vs. reused (prefix time is not part of
+    any letter's generation time).
+    """
+    with _stats_lock:
+        stats = dict(_llm_stats)
+    letters = stats["letters"]
+    stats["avg_generate_seconds"] = stats["generate_seconds"] / letters if letters else 0.0
+    stats["avg_first_token_seconds"] = stats["first_token_seconds"] / letters if letters else 0.0
+    decode_seconds = stats["generate_seconds"] - stats["first_token_seconds"]
+    stats["tokens_per_second"] = stats["tokens"] / decode_seconds if decode_seconds > 0 else 0.0
+    return stats
+
+def reset_llm_stats():
+    with _stats_lock:
+        for key, value in _llm_stats.items():
+            _llm_stats[key] = 0 if isinstance(value, int) else 0.0
+
 # Try to use GPT4All if available, otherwise use a template fallback
 def generate_cover_with_template(resume_summary: Dict, job: Dict) -> str:
     """Generate a formal, personalized cover letter using template - STRICTLY based on exact resume details"""
@@ -112,10 +229,19 @@ def generate_cover_with_template(resume_summary: Dict, job: Dict) -> str:
     
     return date_str + "\n\n" + intro + body1 + body2 + closing
 
-def generate_cover_gpt4all(resume_summary: Dict, job: Dict, n_tokens: int = 400) -> str:
+def generate_cover_gpt4all(resume_summary: Dict, job: Dict, n_tokens: Optional[int] = None, llm=None, time_budget: Optional[float] = None) -> str:
+    """
+    Generate a cover letter with the local LLM. Uses the shared model instance
+    unless `llm` is given (e.g. one checked out of a cover_workers.LLMPool).
+
+    Tokens are streamed (see _stream_generate): generation stops as soon as the
+    "Sincerely, <name>" signature is written, after `n_tokens`
+    (LLM_MAX_TOKENS) or after `time_budget` seconds (LLM_TIME_BUDGET),
+    whichever comes first. A letter cut short is closed with the signature.
+    """
     # lazy import to avoid making it required
     try:
-        from gpt4all import GPT4All
+        import gpt4all  # noqa: F401
     except Exception as e:
         print("gpt4all not available:", e)
         return generate_cover_with_template(resume_summary, job)
@@ -125,20 +251,204 @@ def generate_cover_gpt4all(resume_summary: Dict, job: Dict, n_tokens: int = 400)
         print("Local LLM model file not found at", model_path)
         return generate_cover_with_template(resume_summary, job)
 
+    n_tokens = n_tokens or LLM_MAX_TOKENS
+    time_budget = LLM_TIME_BUDGET if time_budget is None else time_budget
     try:
-        prompt = build_prompt(resume_summary, job)
-        gptj = GPT4All(model_path)
-        # Using .generate; API depends on model type/version. This is a simple example.
-        reply = gptj.generate(prompt, max_tokens=n_tokens)
-        if isinstance(reply, (list, tuple)):
-            reply = reply[0]
-        # Ensure we return a string
-        return str(reply) if reply else generate_cover_with_template(resume_summary, job)
+        prefix, suffix = build_prompt_prefix(resume_summary), build_prompt_suffix(job)
+        signature = _signature_pattern(resume_summary.get("name"))
+        if llm is None:
+            with _llm_lock:
+                run = _stream_generate(get_llm(model_path), suffix, n_tokens, signature, time_budget, prefix=prefix)
+                _schedule_idle_unload()
+        else:
+            run = _stream_generate(llm, suffix, n_tokens, signature, time_budget, prefix=prefix)
+        with _stats_lock:
+            if run["prefix"] == "evaluated":
+                _llm_stats["prefix_evals"] += 1
+                _llm_stats["prefix_seconds"] += run["prefix_s"]
+            elif run["prefix"] == "reused":
+                _llm_stats["prefix_reuses"] += 1
+            _llm_stats["letters"] += 1
+            _llm_stats["generate_seconds"] += run["elapsed"]
+            _llm_stats["tokens"] += run["tokens"]
+            _llm_stats["first_token_seconds"] += run["first_token_s"]
+            if run["stop"] in ("signature", "budget"):
+                _llm_stats[f"stopped_at_{run['stop']}"] += 1
+        record_latency("llm_first_token", run["first_token_s"])
+        if run["stop"] == "budget":
+            print(f"  LLM time budget ({time_budget:g}s) reached for {job.get('title', 'Unknown')}; closing the letter")
+        reply = _finish_letter(run["text"], run["stop"], resume_summary)
+        return reply if reply.strip() else generate_cover_with_template(resume_summary, job)
     except Exception as e:
         print("LLM generation failed:", e)
         return generate_cover_with_template(resume_summary, job)
 
+# -----------------------------
+# Streaming generation
+# -----------------------------
+def _signature_pattern(name) -> Optional["re.Pattern"]:
+    """Matches the letter's sign-off, "Sincerely," then the candidate's name on the same or next line."""
+    name = str(name or "").strip()
+    if not name:
+        return None
+    return re.compile(r"sincerely,?[ \t]*(?:\r?\n[ \t]*)?" + r"\s+".join(map(re.escape, name.split())), re.IGNORECASE)
+
+def _stream_generate(gptj, prompt: str, n_tokens: int, signature=None, time_budget: float = 0, prefix: str = "") -> Dict:
+    """
+    Generate up to `n_tokens` for `prefix` + `prompt`, receiving each token
+    through GPT4All's callback, which ends generation early by returning
+    False: once `signature` matches the text so far, or once `time_budget`
+    seconds (if > 0) have passed. With LLM_PREFIX_CACHE the prefix is
+    evaluated once per model instance and only `prompt` is processed per call
+    (see _load_prefix); if that private gpt4all API does not behave as
+    expected, the full prompt is generated instead and the cache is turned
+    off for the instance. Returns the text, token count, time to first token,
+    total time, why it stopped ("signature", "budget" or "length") and whether
+    the prefix was "evaluated", "reused" or neither (None).
+    """
+    run = {"text": "", "tokens": 0, "first_token_s": 0.0, "elapsed": 0.0, "stop": "length",
+           "prefix": None, "prefix_s": 0.0}
+    state = _load_prefix(gptj, prefix, run) if prefix and LLM_PREFIX_CACHE else None
+    start = time.perf_counter()
+    deadline = start + time_budget if time_budget and time_budget > 0 else None
+    # the signature is searched for in the tail only, where it can first appear
+    window = (len(signature.pattern) + 16) if signature is not None else 0
+
+    def on_token(token_id, piece) -> bool:
+        now = time.perf_counter()
+        if not run["tokens"]:
+            run["first_token_s"] = now - start
+        run["tokens"] += 1
+        run["text"] += piece
+        if signature is not None:
+            match = signature.search(run["text"], max(0, len(run["text"]) - len(piece) - window))
+            if match:
+                run["text"] = run["text"][:match.end()]
+                run["stop"] = "signature"
+                return False
+        if deadline is not None and now >= deadline:
+            run["stop"] = "budget"
+            return False
+        return True
+
+    if state is not None:
+        model = gptj.model
+        try:
+            model.prompt_model(prompt, prompt_template="%1", callback=on_token, n_predict=n_tokens,
+                               reset_context=False, **_SAMPLING)
+            # a context shift (prefix + prompt + letter longer than the context
+            # window) evicts the start of the prefix: evaluate it again next time
+            if model.context.n_past < state[1] + run["tokens"]:
+                _forget_prefix(gptj)
+        except (TypeError, AttributeError) as e:
+            # private gpt4all API with another signature or internals in this version
+            _prefix_unsupported(gptj, e)
+            if not run["tokens"]:
+                state, run["prefix"], run["prefix_s"] = None, None, 0.0
+    if state is None:
+        try:
+            gptj.generate(prefix + prompt, max_tokens=n_tokens, callback=on_token)
+        except TypeError:
+            # bindings without the callback argument: one blocking call, nothing to stop early
+            reply = gptj.generate(prefix + prompt, max_tokens=n_tokens)
+            run["text"] = str(reply[0] if isinstance(reply, (list, tuple)) else reply or "")
+    run["elapsed"] = time.perf_counter() - start
+    if not run["tokens"]:
+        run["first_token_s"] = run["elapsed"]
+    return run
+
+# -----------------------------
+# Prompt prefix cache
+# -----------------------------
+# GPT4All.generate() resets the model context for every prompt, so the long
+# resume + instructions prefix used to be re-evaluated for every letter. Here
+# the prefix is evaluated once per model instance and the context position
+# (n_past) just after it is remembered; each letter rewinds to that position
+# and evaluates only its job suffix, reusing the prefix's KV cache. A chat
+# session is not used because it would keep every earlier letter in context.
+# Instances are keyed weakly, so closed models drop out on their own.
+_prefix_states = weakref.WeakKeyDictionary()   # GPT4All instance -> (prefix hash, n_past) or None
+_prefix_lock = threading.Lock()
+_prefix_warned = False
+# GPT4All.generate()'s defaults, which prompt_model() does not share
+_SAMPLING = {"temp": 0.7, "top_k": 40, "top_p": 0.4, "repeat_penalty": 1.18, "repeat_last_n": 64, "n_batch": 8}
+
+def _load_prefix(gptj, prefix: str, run: Dict):
+    """
+    Make `prefix` the evaluated start of gptj's context, reusing it when it is
+    already there. Returns its (hash, n_past) state, or None when these
+    bindings do not expose the low-level model (generate the full prompt then).
+    """
+    model = getattr(gptj, "model", None)
+    if model is None or not hasattr(model, "prompt_model"):
+        return None
+    key = hashlib.sha1(prefix.encode("utf-8")).hexdigest()
+    with _prefix_lock:
+        state = _prefix_states.get(gptj, ())
+    if state is None:
+        return None   # unsupported by this instance, found out earlier
+    if state and state[0] == key and getattr(model, "context", None) is not None:
+        model.context.n_past = state[1]
+        run["prefix"] = "reused"
+        return state
+    start = time.perf_counter()
+    try:
+        # "%1%2" with n_predict=0, as GPT4All ingests a chat session's system prompt
+        model.prompt_model(prefix, prompt_template="%1%2", callback=lambda token_id, piece: True,
+                           n_predict=0, reset_context=True, n_batch=_SAMPLING["n_batch"])
+        state = (key, int(model.context.n_past))
+    except (TypeError, AttributeError) as e:
+        _prefix_unsupported(gptj, e)
+        return None
+    with _prefix_lock:
+        _prefix_states[gptj] = state
+    run["prefix"] = "evaluated"
+    run["prefix_s"] = time.perf_counter() - start
+    return state
+
+def _forget_prefix(gptj):
+    with _prefix_lock:
+        _prefix_states.pop(gptj, None)
+
+def _prefix_unsupported(gptj, error: Exception):
+    """Use full prompts with `gptj` from now on; the first time in this process, say why."""
+    global _prefix_warned
+    with _prefix_lock:
+        _prefix_states[gptj] = None
+        warn, _prefix_warned = not _prefix_warned, True
+    if warn:
+        print(f"  Prompt prefix caching unavailable with these gpt4all bindings ({error}); using full prompts")
+
+def _finish_letter(text: str, stop: str, resume_summary: Dict) -> str:
+    """
+    Complete a generated letter: contact lines are added after a signature the
+    model wrote (generation stopped there), and a letter cut off before any
+    sign-off is trimmed to its last full paragraph and signed.
+    """
+    text = text.strip()
+    if not text:
+        return text
+    contact = "".join(f"\n{v}" for v in (resume_summary.get("email"), resume_summary.get("phone")) if v)
+    if stop == "signature":
+        return text + contact
+    if "sincerely" in text.lower():
+        return text
+    cut = text.rfind("\n\n")
+    if cut > 0:
+        text = text[:cut].rstrip()
+    return f"{text}\n\nSincerely,\n{str(resume_summary.get('name') or '').strip()}{contact}"
+
 def build_prompt(resume_summary: Dict, job: Dict) -> str:
+    """The full prompt for one letter: the resume's shared prefix followed by the job's suffix."""
+    return build_prompt_prefix(resume_summary) + build_prompt_suffix(job)
+
+def build_prompt_prefix(resume_summary: Dict) -> str:
+    """
+    The part of the prompt that is the same for every job: the resume and the
+    writing instructions. It is evaluated once per resume and model instance
+    (see _load_prefix and _stream_generate); only build_prompt_suffix() differs
+    per job.
+    """
     # STRICTLY use exact resume data - no placeholders
     if isinstance(resume_summary, str):
         raise ValueError("resume_summary must be a dictionary with parsed resume data")
@@ -163,41 +473,35 @@ def build_prompt(resume_summary: Dict, job: Dict) -> str:
     email = resume_summary.get("email") or ""
     phone = resume_summary.get("phone") or ""
     
-    job_title = job.get("title", "")
-    company = job.get("company", "")
-    job_desc = job.get("description", "")[:600]  # Reduced job description - focus on resume
-    
     contact_info = ""
     if email:
         contact_info += f"\nEmail: {email}"
     if phone:
         contact_info += f"\nPhone: {phone}"
     
+    # The company and position only appear in the job posting (the suffix), so
+    # the instructions refer to them instead of repeating them
     prompt = (
-        f"You are a professional career advisor writing a personalized cover letter for {company} that STRICTLY uses ONLY the candidate's resume information.\n\n"
+        f"You are a professional career advisor writing a personalized cover letter for the company in the JOB POSTING below that STRICTLY uses ONLY the candidate's resume information.\n\n"
         f"CANDIDATE'S RESUME - USE EXACT INFORMATION ONLY (DO NOT INVENT ANYTHING):\n"
         f"Name: {name}{contact_info}\n"
         f"Skills (use exact skills listed): {skills}\n\n"
         f"Professional Experience (use exact experience details):\n{experience}\n\n"
         f"Education (use if available):\n{education}\n\n"
-        f"JOB POSTING (for context only - mention company name naturally):\n"
-        f"Position: {job_title}\n"
-        f"Company: {company}\n"
-        f"Brief Description: {job_desc[:400]}\n\n"
         f"INSTRUCTIONS FOR WRITING THE COVER LETTER:\n"
         f"1. DATE: Start with today's date ({datetime.now().strftime('%B %d, %Y')})\n"
-        f"2. GREETING: 'Dear Hiring Manager at {company},' (Always include the specific company name)\n"
-        f"3. OPENING (2-3 sentences): Express genuine interest in the {job_title} position at {company}. " 
+        f"2. GREETING: 'Dear Hiring Manager at <company>,' (Always include the specific company name from the job posting)\n"
+        f"3. OPENING (2-3 sentences): Express genuine interest in the position at the company. " 
         f"Immediately mention 3-4 EXACT SKILLS from the candidate's resume (use the exact skill names listed above). " 
-        f"Personalize the opening for {company} specifically.\n"
+        f"Personalize the opening for the company specifically.\n"
         f"4. BODY PARAGRAPH 1 (4-5 sentences): Describe the candidate's ACTUAL EXPERIENCE from their resume above. " 
         f"Use the EXACT experience details provided. Paraphrase the experience naturally but use only the facts from their resume. " 
-        f"Connect how this experience would benefit {company} specifically. Mention {company} by name at least once in this paragraph.\n"
+        f"Connect how this experience would benefit the company specifically. Mention the company by name at least once in this paragraph.\n"
         f"5. BODY PARAGRAPH 2 (3-4 sentences): Showcase MORE EXACT SKILLS from the candidate's resume. " 
         f"List specific technical competencies mentioned in their skills section. " 
         f"If education is provided, mention it naturally. " 
-        f"Explain how these qualifications align with the needs at {company}. Personalize for {company}.\n"
-        f"6. CLOSING (2-3 sentences): Express enthusiasm for contributing to {company} specifically. " 
+        f"Explain how these qualifications align with the needs at the company. Personalize for the company.\n"
+        f"6. CLOSING (2-3 sentences): Express enthusiasm for contributing to the company specifically. " 
         f"Mention the company name naturally. Thank them and express availability for an interview.\n"
         f"7. SIGNATURE: 'Sincerely,' followed by the candidate's exact name: {name}\n"
         f"8. CONTACT INFO: If email and phone are provided, include them after the signature\n\n"
@@ -206,20 +510,34 @@ def build_prompt(resume_summary: Dict, job: Dict) -> str:
         f"- Use the candidate's EXACT name: {name} (never use placeholders)\n"
         f"- Use the EXACT skills listed in the skills section above\n"
         f"- Use the EXACT experience details provided in the experience section\n"
-        f"- Personalize each cover letter specifically for {company} - mention the company name 3-4 times naturally\n"
+        f"- Personalize each cover letter specifically for the company - mention the company name 3-4 times naturally\n"
         f"- The cover letter should be 85-95% about the CANDIDATE'S resume content\n"
         f"- Only 5-15% should reference the job description for context\n"
         f"- Do NOT make up any experience, skills, achievements, or education not in the resume\n"
         f"- Professional, confident tone grounded in actual resume facts\n"
         f"- Length: 350-450 words\n"
-        f"- Each cover letter should be unique and personalized for {company}, but based entirely on the resume\n"
+        f"- Each cover letter should be unique and personalized for the company, but based entirely on the resume\n\n"
     )
     return prompt
 
-def generate_cover(resume_summary: Dict, job: Dict, prefer_local_llm: bool = True) -> str:
+def build_prompt_suffix(job: Dict) -> str:
+    """The per-job part of the prompt: the job posting and the request to write the letter."""
+    job_title = job.get("title", "")
+    company = job.get("company", "")
+    job_desc = job.get("description", "")[:600]  # Reduced job description - focus on resume
+    return (
+        f"JOB POSTING (for context only - mention company name naturally):\n"
+        f"Position: {job_title}\n"
+        f"Company: {company}\n"
+        f"Brief Description: {job_desc[:400]}\n\n"
+        f"Now write the cover letter for the {job_title} position at {company}, "
+        f"starting with the date and 'Dear Hiring Manager at {company},':\n"
+    )
+
+def generate_cover(resume_summary: Dict, job: Dict, prefer_local_llm: bool = True, llm=None) -> str:
     try:
         if prefer_local_llm:
-            return generate_cover_gpt4all(resume_summary, job)
+            return generate_cover_gpt4all(resume_summary, job, llm=llm)
         else:
             return generate_cover_with_template(resume_summary, job)
     except Exception as e:
@@ -233,6 +551,11 @@ def generate_cover(resume_summary: Dict, job: Dict, prefer_local_llm: bool = Tru
 
 def save_cover_letter_docx(cover_text: str, job: Dict, resume_summary: Dict, output_dir: Optional[str] = None) -> str:
     """Save cover letter as a formatted DOCX file"""
+    # python-docx is only needed here, so import it lazily to keep startup fast
+    from docx import Document
+    from docx.shared import Pt
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
     if output_dir is None:
         output_dir = COVER_LETTERS_DIR
     
@@ -0,0 +1,81 @@
+# src/html_parsing.py
+import threading
+from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup
+import soupsieve as sv
+
+# Use lxml when it is installed - it builds the tree several times faster than
+# the pure-Python html.parser. Falls back silently otherwise.
+try:
+    import lxml  # noqa: F401
+    PARSER_BACKEND = "lxml"
+except ImportError:
+    PARSER_BACKEND = "html.parser"
+
+
+def make_soup(html: str, backend: Optional[str] = None) -> BeautifulSoup:
+    """Build a BeautifulSoup tree with the fastest available backend."""
+    return BeautifulSoup(html, backend or PARSER_BACKEND)
+
+
+class SelectorPlan:
+    """
+    Precompiled selector fallback chains for a job-card layout.
+
+    `cards` is the chain of selectors that locate job cards in a page, and
+    `fields` maps each field name to the chain of selectors tried, in order,
+    inside a card. Selectors are compiled once with soupsieve.
+
+    Job boards serve a handful of page layouts, and within one layout every card
+    matches the same selector of each chain. The plan therefore learns, per
+    layout (identified by the card selector that matched), which selector in
+    each field chain hits, and applies only that one to the remaining cards. If
+    the learned selector misses for some card, the full chain is tried again and
+    the plan re-learns from that card.
+    """
+
+    def __init__(self, cards: List[str], fields: Dict[str, List[str]]):
+        self.card_chain: List[Tuple[str, sv.SoupSieve]] = [(s, sv.compile(s)) for s in cards]
+        self.field_chains: Dict[str, List[Tuple[str, sv.SoupSieve]]] = {
+            name: [(s, sv.compile(s)) for s in chain] for name, chain in fields.items()
+        }
+        # layout key -> {field name -> index of the winning selector}
+        self._learned: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def select_cards(self, soup) -> Tuple[Optional[str], list]:
+        """Return (layout key, cards) for the first card selector that matches."""
+        for sel, compiled in self.card_chain:
+            cards = compiled.select(soup)
+            if cards:
+                return sel, cards
+        return None, []
+
+    def select_field(self, card, field: str, layout: Optional[str] = None):
+        """Find `field` in `card`, trying the selector learned for `layout` first."""
+        chain = self.field_chains[field]
+        learned = self._learned.get(layout) if layout else None
+        idx = learned.get(field) if learned else None
+        if idx is not None:
+            el = chain[idx][1].select_one(card)
+            if el is not None:
+                return el
+        for i, (_, compiled) in enumerate(chain):
+            if i == idx:
+                continue
+            el = compiled.select_one(card)
+            if el is not None:
+                if layout:
+                    with self._lock:
+                        self._learned.setdefault(layout, {})[field] = i
+                return el
+        return None
+
+    def learned_selectors(self, layout: str) -> Dict[str, str]:
+        """Human-readable view of what the plan has learned for a layout."""
+        learned = self._learned.get(layout, {})
+        return {field: self.field_chains[field][i][0] for field, i in learned.items()}
+
+    def reset(self):
+        with self._lock:
+            self._learned.clear()
@@ -0,0 +1,169 @@
+# src/http_cache.py
+import os
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+# Import config with defaults for CI/testing
+try:
+    from config import HTTP_CACHE_PATH, HTTP_CACHE_TTL, HTTP_CACHE_MAX_MB
+except ImportError:
+    HTTP_CACHE_PATH = "outputs/.cache/http_cache.sqlite"
+    HTTP_CACHE_TTL = 3600  # seconds a response is served without revalidation
+    HTTP_CACHE_MAX_MB = 100
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response served from (or stored in) the cache."""
+
+    def __init__(self, url: str, text: str, status_code: int = 200, from_cache: bool = False, revalidated: bool = False):
+        self.url = url
+        self.text = text
+        self.status_code = status_code
+        self.from_cache = from_cache      # body came from disk, not the network
+        self.revalidated = revalidated    # server answered 304 Not Modified
+
+    def raise_for_status(self):
+        pass
+
+
+class HTTPCache:
+    """
+    Local cache of GET responses keyed by URL, stored zlib-compressed in SQLite.
+
+    Entries younger than `ttl` seconds are served without touching the network;
+    older ones are revalidated with If-None-Match / If-Modified-Since. The cache
+    also stores parsed job lists keyed by a hash of the page body, so an
+    unchanged page is not parsed again. Once the stored (compressed) bytes exceed
+    max_mb, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None, max_mb: Optional[float] = None):
+        self.path = path or HTTP_CACHE_PATH
+        self.ttl = HTTP_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = int((HTTP_CACHE_MAX_MB if max_mb is None else max_mb) * 1024 * 1024)
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT,"
+            " fetched_at REAL NOT NULL, last_used REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS parsed ("
+            " key TEXT PRIMARY KEY, jobs BLOB NOT NULL, last_used REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_parsed_last_used ON parsed(last_used)")
+        self._conn.commit()
+
+    # -----------------------------
+    # Raw responses
+    # -----------------------------
+    def lookup(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return None
+        body, etag, last_modified, fetched_at = row
+        return {
+            "text": zlib.decompress(body).decode("utf-8"),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at,
+            "fresh": (time.time() - fetched_at) < self.ttl,
+        }
+
+    def store(self, url: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        body = zlib.compress(text.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched_at, last_used, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now, now, len(body)),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url: str, revalidated: bool = False):
+        """Mark an entry as used; a successful revalidation also restarts its TTL."""
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._conn.execute("UPDATE responses SET last_used = ?, fetched_at = ? WHERE url = ?", (now, now, url))
+            else:
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE url = ?", (now, url))
+            self._conn.commit()
+
+    # -----------------------------
+    # Parsed results
+    # -----------------------------
+    def get_parsed(self, key: str) -> Optional[List[Dict]]:
+        with self._lock:
+            row = self._conn.execute("SELECT jobs FROM parsed WHERE key = ?", (key,)).fetchone()
+            if not row:
+                return None
+            self._conn.execute("UPDATE parsed SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def put_parsed(self, key: str, jobs: List[Dict]):
+        blob = zlib.compress(json.dumps([dict(job) for job in jobs]).encode("utf-8"), 6)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parsed (key, jobs, last_used, size) VALUES (?, ?, ?, ?)",
+                (key, blob, time.time(), len(blob)),
+            )
+            self._evict()
+            self._conn.commit()
+
+    # -----------------------------
+    # Housekeeping
+    # -----------------------------
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        (a,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        (b,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM parsed").fetchone()
+        return a + b
+
+    def _evict(self):
+        if self.max_bytes <= 0:
+            return
+        excess = self._total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        # oldest entries first across both tables
+        rows = self._conn.execute(
+            "SELECT 'responses', url, size, last_used FROM responses"
+            " UNION ALL SELECT 'parsed', key, size, last_used FROM parsed"
+            " ORDER BY last_used ASC"
+        ).fetchall()
+        for table, key, size, _ in rows:
+            if excess <= 0:
+                break
+            col = "url" if table == "responses" else "key"
+            self._conn.execute(f"DELETE FROM {table} WHERE {col} = ?", (key,))
+            excess -= size
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM parsed")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
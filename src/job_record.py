@@ -0,0 +1,127 @@
+# src/job_record.py
+import sys
+from collections.abc import MutableMapping
+from typing import Dict, Iterator
+
+# Fields describing the posting itself (what sources produce and the job store keeps)
+POSTING_FIELDS = ("id", "title", "company", "location", "description", "redirect_url", "source")
+# Fields the pipeline fills in per run
+ENRICHMENT_FIELDS = ("similarity", "lexical_score", "skill_score", "embedding_score",
+                     "cover_letter", "cover_status", "docx_path")
+_ORDER = POSTING_FIELDS + ENRICHMENT_FIELDS
+_FIELDS = frozenset(_ORDER)
+_MISSING = object()
+# Few distinct values across a corpus: one shared string object each
+_INTERNED = frozenset(("title", "company", "location", "source"))
+
+
+class JobRecord(MutableMapping):
+    """
+    A job posting as it moves from fetch_jobs to export.
+
+    Behaves like the job dicts the pipeline has always used (job["title"],
+    job.get("similarity"), "cover_letter" in job, dict(job)), but keeps the
+    known fields in __slots__ instead of a per-job hash table, and interns
+    title, company, location and source so repeated values are stored once.
+    A field that was never set is missing, as with a dict, and costs nothing
+    beyond its slot. Keys outside POSTING_FIELDS / ENRICHMENT_FIELDS go to a
+    small dict that is only created when one is set.
+    """
+    __slots__ = _ORDER + ("_extra",)
+
+    def __init__(self, fields=(), **kwargs):
+        if hasattr(fields, "items"):
+            fields = fields.items()
+        for items in (fields, kwargs.items()):
+            # __setitem__ inlined: records are built by the hundred thousand
+            for key, value in items:
+                if key in _FIELDS:
+                    setattr(self, key, sys.intern(value) if key in _INTERNED and type(value) is str else value)
+                else:
+                    self[key] = value
+
+    def __getitem__(self, key):
+        if key in _FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        try:
+            return self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key in _FIELDS:
+            if key in _INTERNED and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+            return
+        try:
+            self._extra[key] = value
+        except AttributeError:
+            self._extra = {key: value}
+
+    def __delitem__(self, key):
+        if key in _FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        try:
+            del self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        for key in _ORDER:
+            if getattr(self, key, _MISSING) is not _MISSING:
+                yield key
+        yield from getattr(self, "_extra", ())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    # MutableMapping's versions go through __getitem__ and KeyError; these are the hot calls
+    def get(self, key, default=None):
+        if key in _FIELDS:
+            return getattr(self, key, default)
+        return getattr(self, "_extra", {}).get(key, default)
+
+    def __contains__(self, key) -> bool:
+        if key in _FIELDS:
+            return getattr(self, key, _MISSING) is not _MISSING
+        return key in getattr(self, "_extra", ())
+
+    def copy(self) -> "JobRecord":
+        """Shallow copy: the new record shares every value (strings included) with this one."""
+        new = JobRecord.__new__(JobRecord)
+        for key in _ORDER:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                setattr(new, key, value)
+        extra = getattr(self, "_extra", None)
+        if extra:
+            new._extra = dict(extra)
+        return new
+
+    def to_dict(self) -> Dict:
+        out = {}
+        for key in _ORDER:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                out[key] = value
+        out.update(getattr(self, "_extra", ()))
+        return out
+
+    def __eq__(self, other):
+        if isinstance(other, (JobRecord, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"JobRecord({self.to_dict()!r})"
+
@@ -0,0 +1,226 @@
+# src/job_store.py
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from .job_record import JobRecord, POSTING_FIELDS
+
+# Import config with defaults for CI/testing
+try:
+    from config import JOB_STORE_PATH
+except ImportError:
+    JOB_STORE_PATH = "outputs/job_store.sqlite"
+
+# Pipeline stages in order; a run records the last one it completed
+STAGES = ["started", "fetch", "score", "cover", "export", "done"]
+
+# Job keys that describe the posting itself (anything else is pipeline state)
+JOB_FIELDS = POSTING_FIELDS
+
+
+def resume_key(resume_text: str) -> str:
+    """Identify a resume by its content, so edits to the resume trigger rescoring."""
+    return hashlib.sha1((resume_text or "").encode("utf-8")).hexdigest()[:16]
+
+
+def content_hash(job: Dict) -> str:
+    """Hash of the fields that affect scoring and cover letters."""
+    parts = [str(job.get(k) or "") for k in ("title", "company", "location", "description")]
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """
+    Persistent record of every job the pipeline has handled, per resume.
+
+    For each (resume, job id) it stores when the posting was fetched, its content
+    hash, similarity score, cover-letter status and DOCX path. Runs are recorded
+    with the last stage they completed, so an interrupted run can be resumed and
+    a new run only has to score and write cover letters for new or changed
+    postings.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or JOB_STORE_PATH
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                resume_key TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                job_json TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                fetched_at REAL NOT NULL,
+                similarity REAL,
+                cover_status TEXT,
+                cover_letter TEXT,
+                docx_path TEXT,
+                PRIMARY KEY (resume_key, job_id)
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                resume_key TEXT NOT NULL,
+                query TEXT NOT NULL,
+                location TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL,
+                output_csv TEXT,
+                started_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS run_jobs (
+                run_id INTEGER NOT NULL,
+                job_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                PRIMARY KEY (run_id, job_id)
+            );
+            """
+        )
+        self._conn.commit()
+
+    # -----------------------------
+    # Runs
+    # -----------------------------
+    def start_run(self, resume_key: str, query: str, location: str = "") -> Tuple[int, str]:
+        """
+        Return (run_id, last completed stage). If the previous run for the same
+        resume, query and location did not finish, it is resumed instead of
+        starting a new one.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id, stage, status FROM runs WHERE resume_key = ? AND query = ? AND location = ?"
+                " ORDER BY run_id DESC LIMIT 1",
+                (resume_key, query, location or ""),
+            ).fetchone()
+            if row and row[2] == "running":
+                self._conn.execute("UPDATE runs SET updated_at = ? WHERE run_id = ?", (now, row[0]))
+                self._conn.commit()
+                return row[0], row[1]
+            cur = self._conn.execute(
+                "INSERT INTO runs (resume_key, query, location, stage, status, started_at, updated_at)"
+                " VALUES (?, ?, ?, 'started', 'running', ?, ?)",
+                (resume_key, query, location or "", now, now),
+            )
+            self._conn.commit()
+            return cur.lastrowid, "started"
+
+    def set_stage(self, run_id: int, stage: str, output_csv: Optional[str] = None):
+        assert stage in STAGES, f"Unknown pipeline stage: {stage}"
+        status = "done" if stage == "done" else "running"
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET stage = ?, status = ?, output_csv = COALESCE(?, output_csv), updated_at = ?"
+                " WHERE run_id = ?",
+                (stage, status, output_csv, time.time(), run_id),
+            )
+            self._conn.commit()
+
+    def run_output_csv(self, run_id: int) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT output_csv FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def stage_reached(current: str, stage: str) -> bool:
+        return STAGES.index(current) >= STAGES.index(stage)
+
+    # -----------------------------
+    # Jobs
+    # -----------------------------
+    def record_fetched(self, run_id: int, resume_key: str, jobs: List[Dict]) -> int:
+        """
+        Store the jobs fetched for a run. New postings are inserted; postings
+        whose content changed have their score and cover letter cleared so they
+        are processed again. Returns the number of new or changed postings.
+        """
+        now = time.time()
+        changed = 0
+        with self._lock:
+            existing = {
+                job_id: h for job_id, h in self._conn.execute(
+                    "SELECT job_id, content_hash FROM jobs WHERE resume_key = ?", (resume_key,)
+                )
+            }
+            for pos, job in enumerate(jobs):
+                job_id = str(job.get("id"))
+                h = content_hash(job)
+                job_json = json.dumps({k: job.get(k) for k in JOB_FIELDS if k in job})
+                if job_id not in existing:
+                    changed += 1
+                    self._conn.execute(
+                        "INSERT INTO jobs (resume_key, job_id, content_hash, job_json, first_seen, fetched_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (resume_key, job_id, h, job_json, now, now),
+                    )
+                elif existing[job_id] != h:
+                    changed += 1
+                    self._conn.execute(
+                        "UPDATE jobs SET content_hash = ?, job_json = ?, fetched_at = ?, similarity = NULL,"
+                        " cover_status = NULL, cover_letter = NULL, docx_path = NULL"
+                        " WHERE resume_key = ? AND job_id = ?",
+                        (h, job_json, now, resume_key, job_id),
+                    )
+                else:
+                    self._conn.execute(
+                        "UPDATE jobs SET fetched_at = ? WHERE resume_key = ? AND job_id = ?",
+                        (now, resume_key, job_id),
+                    )
+                existing[job_id] = h
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO run_jobs (run_id, job_id, position) VALUES (?, ?, ?)",
+                    (run_id, job_id, pos),
+                )
+            self._conn.commit()
+        return changed
+
+    def run_jobs(self, run_id: int, resume_key: str) -> List[JobRecord]:
+        """Jobs of a run, in fetch order, with their stored pipeline state merged in."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT j.job_json, j.similarity, j.cover_status, j.cover_letter, j.docx_path"
+                " FROM run_jobs r JOIN jobs j ON j.job_id = r.job_id AND j.resume_key = ?"
+                " WHERE r.run_id = ? ORDER BY r.position",
+                (resume_key, run_id),
+            ).fetchall()
+        jobs = []
+        for job_json, similarity, cover_status, cover_letter, docx_path in rows:
+            job = JobRecord(json.loads(job_json))
+            job["similarity"] = similarity
+            job["cover_status"] = cover_status
+            if cover_letter is not None:
+                job["cover_letter"] = cover_letter
+            if docx_path is not None:
+                job["docx_path"] = docx_path
+            jobs.append(job)
+        return jobs
+
+    def save_scores(self, resume_key: str, scores: Dict[str, float]):
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE jobs SET similarity = ? WHERE resume_key = ? AND job_id = ?",
+                [(float(s), resume_key, str(job_id)) for job_id, s in scores.items()],
+            )
+            self._conn.commit()
+
+    def save_cover(self, resume_key: str, job_id: str, status: str, cover_letter: Optional[str] = None, docx_path: Optional[str] = None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET cover_status = ?, cover_letter = ?, docx_path = ? WHERE resume_key = ? AND job_id = ?",
+                (status, cover_letter, docx_path, resume_key, str(job_id)),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,142 @@
+# src/keyword_matcher.py
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Import config with defaults for CI/testing
+try:
+    from config import KEYWORD_MATCHER_BACKEND
+except ImportError:
+    KEYWORD_MATCHER_BACKEND = "auto"  # "auto" (pyahocorasick if installed), "python" or "pyahocorasick"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive multi-keyword matcher (Aho–Corasick).
+
+    All keywords are compiled into one automaton, so a text is scanned once
+    whatever the vocabulary size. Matches must sit on word boundaries: "Git"
+    matches "Git, Linux" but not "digital", and "ai" does not match
+    "maintained". Keywords may contain spaces and punctuation ("power bi",
+    "ci/cd", "c++").
+
+    The automaton is built in pure Python; with backend "auto" the C
+    implementation from pyahocorasick is used when it is installed.
+    """
+
+    def __init__(self, keywords: Iterable[str], backend: Optional[str] = None):
+        self.keywords: List[str] = []
+        index: Dict[str, int] = {}
+        for kw in keywords:
+            key = (kw or "").strip().lower()
+            if key and key not in index:
+                index[key] = len(self.keywords)
+                self.keywords.append(kw.strip())
+        self._keys = list(index)
+        self.backend = self._pick_backend(backend or KEYWORD_MATCHER_BACKEND)
+        if self.backend == "pyahocorasick":
+            self._build_c()
+        else:
+            self._build_python()
+
+    @staticmethod
+    def _pick_backend(backend: str) -> str:
+        if backend == "python":
+            return backend
+        try:
+            import ahocorasick  # noqa: F401
+            return "pyahocorasick"
+        except ImportError:
+            if backend == "pyahocorasick":
+                raise
+            return "python"
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    # -----------------------------
+    # Automaton construction
+    # -----------------------------
+    def _build_python(self):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for idx, key in enumerate(self._keys):
+            node = 0
+            for ch in key:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            out[node].append(idx)
+
+        # failure links, breadth first; each node also inherits the outputs of its failure node
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                if out[fail[child]]:
+                    out[child] = out[child] + out[fail[child]]
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def _build_c(self):
+        import ahocorasick
+        automaton = ahocorasick.Automaton()
+        for idx, key in enumerate(self._keys):
+            automaton.add_word(key, idx)
+        if len(automaton):
+            automaton.make_automaton()
+        self._automaton = automaton
+
+    def _raw_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(end offset, keyword index) for every occurrence, boundaries not checked."""
+        if self.backend == "pyahocorasick":
+            if len(self._automaton):
+                for end, idx in self._automaton.iter(text):
+                    yield end + 1, idx
+            return
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for idx in out[node]:
+                    yield i + 1, idx
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """(start, end, keyword) for every word-bounded occurrence in `text`."""
+        text = (text or "").lower()
+        n = len(text)
+        for end, idx in self._raw_matches(text):
+            start = end - len(self._keys[idx])
+            if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                continue
+            if end < n and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+                continue
+            yield start, end, self.keywords[idx]
+
+    def find_all(self, text: str) -> List[str]:
+        """Distinct keywords found in `text`, in order of first occurrence."""
+        return list(dict.fromkeys(kw for _, _, kw in self.iter_matches(text)))
+
+    def counts(self, text: str) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        for _, _, kw in self.iter_matches(text):
+            found[kw] = found.get(kw, 0) + 1
+        return found
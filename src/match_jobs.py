@@ -1,30 +1,345 @@
 # src/match_jobs.py
-from sentence_transformers import SentenceTransformer, util
-from typing import List, Dict
-import torch
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+import os
+import threading
+import time
+import numpy as np
+from .profiling import record_latency
+
+# Import config with defaults for CI/testing
+try:
+    from config import EMBED_BATCH_SIZE
+except ImportError:
+    EMBED_BATCH_SIZE = 64
+
+try:
+    from config import EMBEDDING_MODEL_NAME
+except ImportError:
+    EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+try:
+    from config import EMBED_CACHE_ENABLED
+except ImportError:
+    EMBED_CACHE_ENABLED = True
+
+try:
+    from config import JOB_INDEX_PATH
+except ImportError:
+    JOB_INDEX_PATH = "outputs/.cache/job_index.npz"
 
 _model = None
+_model_lock = threading.Lock()
+_cache = None
+_index = None
+_index_lock = threading.Lock()
+
+def set_model(model):
+    """Use `model` (anything with a SentenceTransformer-style encode()) instead of loading one."""
+    global _model
+    _model = model
 
 def get_model():
     global _model
-    if _model is None:
-        _model = SentenceTransformer("all-MiniLM-L6-v2")
+    with _model_lock:
+        if _model is None:
+            from sentence_transformers import SentenceTransformer
+            _model = SentenceTransformer(EMBEDDING_MODEL_NAME)
     return _model
 
-def compute_similarity(resume_text: str, jobs: List[Dict], top_k:int=20) -> List[Dict]:
+def preload_model() -> threading.Thread:
+    """
+    Start loading the embedding model (and torch) in a background thread so it
+    is ready by the time compute_similarity runs. get_model() waits for it.
+    """
+    def load():
+        try:
+            get_model()
+        except Exception as e:
+            print(f"  (Embedding model preload failed: {e})")
+    thread = threading.Thread(target=load, name="embedding-model-preload", daemon=True)
+    thread.start()
+    return thread
+
+def get_embedding_cache():
+    """Process-wide on-disk embedding cache, or None if disabled/unavailable."""
+    global _cache
+    if _cache is None and EMBED_CACHE_ENABLED:
+        try:
+            from .embedding_cache import EmbeddingCache
+            _cache = EmbeddingCache(EMBEDDING_MODEL_NAME)
+        except Exception as e:
+            print(f"  Warning: embedding cache unavailable: {e}")
+            return None
+    return _cache
+
+def encode_texts(texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+    """Encode texts in batches into an (n, dim) float32 matrix of unit-length rows."""
     model = get_model()
-    # encode resume once
-    resume_emb = model.encode(resume_text, convert_to_tensor=True)
+    batch_size = batch_size or EMBED_BATCH_SIZE
+    chunks = []
+    for i in range(0, len(texts), batch_size):
+        batch = texts[i:i + batch_size]
+        start = time.perf_counter()
+        embs = model.encode(
+            batch,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        per_item = (time.perf_counter() - start) / len(batch)
+        for _ in batch:
+            record_latency("embed", per_item)
+        chunks.append(np.asarray(embs, dtype=np.float32).reshape(len(batch), -1))
+    if not chunks:
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.concatenate(chunks)
+
+def encode_texts_cached(texts: List[str], batch_size: Optional[int] = None, use_cache: bool = True) -> np.ndarray:
+    """Like encode_texts, but only texts missing from the embedding cache are encoded."""
+    cache = get_embedding_cache() if use_cache else None
+    if cache is None:
+        return encode_texts(texts, batch_size=batch_size)
+    keys = [cache.key(t) for t in texts]
+    found = cache.get_many(keys)
+    # encode each distinct missing text once
+    missing = {}
+    for k, t in zip(keys, texts):
+        if k not in found and k not in missing:
+            missing[k] = t
+    if missing:
+        new_embs = encode_texts(list(missing.values()), batch_size=batch_size)
+        new_items = dict(zip(missing.keys(), new_embs))
+        cache.put_many(new_items)
+        found.update(new_items)
+    print(f"  Embeddings: {len(texts) - len(missing)} cached, {len(missing)} encoded")
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.stack([found[k] for k in keys]).astype(np.float32, copy=False)
+
+def encode_resumes(resume_texts: List[str], batch_size: Optional[int] = None, use_cache: bool = True) -> np.ndarray:
+    """Like encode_texts, but resume embeddings are kept in the parsed-resume cache."""
+    from .parse_resume import get_resume_cache
+    cache = get_resume_cache() if use_cache else None
+    if cache is None:
+        return encode_texts(resume_texts, batch_size=batch_size)
+    found = [cache.get_embedding(EMBEDDING_MODEL_NAME, t) for t in resume_texts]
+    missing = [i for i, v in enumerate(found) if v is None]
+    if missing:
+        new_embs = encode_texts([resume_texts[i] for i in missing], batch_size=batch_size)
+        for i, emb in zip(missing, new_embs):
+            cache.put_embedding(EMBEDDING_MODEL_NAME, resume_texts[i], emb)
+            found[i] = emb
+    return np.stack(found).astype(np.float32, copy=False)
+
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the top_k highest scores, best first, using a partial sort."""
+    n = scores.shape[0]
+    if top_k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if top_k < n:
+        idx = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+def similarity_matrix(resume_texts: List[str], jobs: List[Dict], batch_size: Optional[int] = None, use_cache: bool = True, add_to_index: bool = False) -> np.ndarray:
+    """
+    (len(resume_texts), len(jobs)) cosine similarities. Each job description
+    is encoded once (cache misses only) however many resumes are scored.
+    """
+    if not resume_texts or not jobs:
+        return np.zeros((len(resume_texts), len(jobs)), dtype=np.float32)
+    resume_embs = encode_resumes(resume_texts, batch_size=batch_size, use_cache=use_cache)
+    job_embs = encode_texts_cached([job.get("description") or "" for job in jobs], batch_size=batch_size, use_cache=use_cache)
+    if add_to_index:
+        _add_to_index(jobs, job_embs)
+    # rows are normalized, so every cosine similarity comes from one matrix product
+    return resume_embs @ job_embs.T
+
+def compute_similarity(resume_text: str, jobs: List[Dict], top_k:int=20, batch_size: Optional[int] = None, use_cache: bool = True, add_to_index: bool = False) -> List[Dict]:
+    """The top_k jobs for the resume, best first, with "similarity" set on them (see rank_jobs)."""
+    if not jobs:
+        return []
+    scores = similarity_matrix([resume_text], jobs, batch_size=batch_size, use_cache=use_cache, add_to_index=add_to_index)[0]
+    return rank_jobs(jobs, scores, top_k)
+
+def stream_similarity(resume_text: str, batches: Iterable[List[Dict]], batch_size: Optional[int] = None, use_cache: bool = True, add_to_index: bool = False) -> Iterator[Dict]:
+    """
+    Score a stream of job micro-batches (see streaming.micro_batches) against
+    one resume, yielding each job with "similarity" set on it as soon as its
+    batch is encoded. The resume is encoded once; jobs keep their arrival
+    order. Cosine similarities are absolute, so scores from different batches
+    can be compared directly.
+    """
+    resume_emb = None
+    for batch in batches:
+        if not batch:
+            continue
+        if resume_emb is None:
+            resume_emb = encode_resumes([resume_text], batch_size=batch_size, use_cache=use_cache)[0]
+        job_embs = encode_texts_cached([job.get("description") or "" for job in batch], batch_size=batch_size, use_cache=use_cache)
+        if add_to_index:
+            _add_to_index(batch, job_embs)
+        for job, score in zip(batch, job_embs @ resume_emb):
+            job["similarity"] = float(score)
+            yield job
+
+def rank_jobs(jobs: List[Dict], scores: np.ndarray, top_k: int, copy: bool = False) -> List[Dict]:
+    """
+    The top_k jobs by score, best first, with "similarity" set. Jobs are
+    enriched in place; pass copy=True when the same job objects are ranked
+    for several resumes, so each ranking gets its own (shallow) copies.
+    """
     enriched = []
-    for job in jobs:
-        desc = job.get("description") or ""
-        emb = model.encode(desc, convert_to_tensor=True)
-        sim = util.cos_sim(resume_emb, emb).item()
-        job_copy = job.copy()
-        job_copy["similarity"] = float(sim)
-        enriched.append(job_copy)
-    enriched = sorted(enriched, key=lambda x: x["similarity"], reverse=True)
-    return enriched[:top_k]
+    for i in top_k_indices(scores, top_k):
+        job = jobs[i].copy() if copy else jobs[i]
+        job["similarity"] = float(scores[i])
+        enriched.append(job)
+    return enriched
+
+# -----------------------------
+# Hybrid scoring
+# -----------------------------
+def _job_text(job: Dict) -> str:
+    return f"{job.get('title') or ''} {job.get('description') or ''}"
+
+def hybrid_score_matrix(resumes: List[Dict], jobs: List[Dict], weights: Optional[Dict[str, float]] = None, shortlist: Optional[int] = None, batch_size: Optional[int] = None, use_cache: bool = True, add_to_index: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Score parsed resumes (raw_text, skills) against jobs with a cheap-first
+    cascade. A BM25 pass over the job texts and the skill overlap rank every
+    job; only each resume's top `shortlist` jobs (HYBRID_SHORTLIST) are then
+    embedded and scored by the model. The weighted sum of the three scores
+    (SCORE_WEIGHTS) is "score". Jobs pruned for every resume are never
+    embedded; their "embedding" entries are NaN and count as 0 in "score".
+    With add_to_index only the embedded (shortlisted) jobs reach the job
+    index, so search_jobs() does not see the pruned ones.
+
+    Returns (len(resumes), len(jobs)) matrices: score, lexical, skills, embedding.
+    """
+    from .scoring import BM25Index, HYBRID_SHORTLIST, normalized_weights, shortlist_columns, skill_overlap
+    from .parse_resume import extract_skills_many
+
+    w = normalized_weights(weights)
+    shortlist = HYBRID_SHORTLIST if shortlist is None else shortlist
+    n_res, n_jobs = len(resumes), len(jobs)
+    embedding = np.full((n_res, n_jobs), np.nan, dtype=np.float32)
+    if not n_res or not n_jobs:
+        zeros = np.zeros((n_res, n_jobs), dtype=np.float32)
+        return {"score": zeros, "lexical": zeros, "skills": zeros, "embedding": embedding}
+
+    # lexical: BM25, scaled per resume so the best job scores 1
+    texts = [_job_text(job) for job in jobs]
+    bm25 = BM25Index(texts)
+    lexical = np.stack([bm25.scores(r.get("raw_text", "")) for r in resumes])
+    lexical /= np.maximum(lexical.max(axis=1, keepdims=True), 1e-9)
+    job_skills = extract_skills_many(texts)
+    skills = np.stack([skill_overlap(r.get("skills") or [], job_skills) for r in resumes])
+    score = w["lexical"] * lexical + w["skills"] * skills
+
+    if w["embedding"] > 0:
+        cols = shortlist_columns(score, shortlist)
+        if len(cols) < n_jobs:
+            print(f"  Cascade: embedding {len(cols)} of {n_jobs} jobs after the lexical pass"
+                  + (" (only those are added to the job index)" if add_to_index else ""))
+        shortlisted = [jobs[i] for i in cols]
+        embedding[:, cols] = similarity_matrix([r.get("raw_text", "") for r in resumes], shortlisted,
+                                               batch_size=batch_size, use_cache=use_cache, add_to_index=add_to_index)
+        score = score + w["embedding"] * np.nan_to_num(embedding, nan=0.0)
+    return {"score": score, "lexical": lexical, "skills": skills, "embedding": embedding}
+
+def compute_hybrid_similarity(resume_text: str, jobs: List[Dict], top_k: int = 20, resume_skills: Optional[List[str]] = None, weights: Optional[Dict[str, float]] = None, shortlist: Optional[int] = None, batch_size: Optional[int] = None, use_cache: bool = True, add_to_index: bool = False) -> List[Dict]:
+    """
+    Like compute_similarity, but "similarity" is the hybrid score (see
+    hybrid_score_matrix); the parts are added as lexical_score, skill_score
+    and embedding_score (None for jobs the cascade pruned).
+    """
+    if not jobs:
+        return []
+    m = hybrid_score_matrix([{"raw_text": resume_text, "skills": resume_skills or []}], jobs, weights=weights,
+                            shortlist=shortlist, batch_size=batch_size, use_cache=use_cache, add_to_index=add_to_index)
+    enriched = []
+    for i in top_k_indices(m["score"][0], top_k):
+        job = jobs[i]
+        job["similarity"] = float(m["score"][0, i])
+        job["lexical_score"] = float(m["lexical"][0, i])
+        job["skill_score"] = float(m["skills"][0, i])
+        emb = m["embedding"][0, i]
+        job["embedding_score"] = None if np.isnan(emb) else float(emb)
+        enriched.append(job)
+    return enriched
+
+def score_jobs(resume_summary: Dict, jobs: List[Dict], top_k: int = 20, add_to_index: bool = False) -> List[Dict]:
+    """Rank jobs for a parsed resume with the configured SCORING_MODE."""
+    from .scoring import SCORING_MODE
+    if SCORING_MODE == "hybrid":
+        return compute_hybrid_similarity(resume_summary.get("raw_text", ""), jobs, top_k=top_k,
+                                         resume_skills=resume_summary.get("skills"), add_to_index=add_to_index)
+    return compute_similarity(resume_summary.get("raw_text", ""), jobs, top_k=top_k, add_to_index=add_to_index)
+
+def score_matrix(resumes: List[Dict], jobs: List[Dict], add_to_index: bool = False) -> np.ndarray:
+    """(len(resumes), len(jobs)) scores with the configured SCORING_MODE."""
+    from .scoring import SCORING_MODE
+    if SCORING_MODE == "hybrid":
+        return hybrid_score_matrix(resumes, jobs, add_to_index=add_to_index)["score"]
+    return similarity_matrix([r.get("raw_text", "") for r in resumes], jobs, add_to_index=add_to_index)
+
+# -----------------------------
+# Job corpus index
+# -----------------------------
+def get_job_index():
+    """
+    Process-wide VectorIndex of job description embeddings, loaded from
+    JOB_INDEX_PATH if it exists (and was built with the current model).
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            from .vector_index import VectorIndex
+            if os.path.exists(JOB_INDEX_PATH):
+                try:
+                    index = VectorIndex.load(JOB_INDEX_PATH)
+                    if index.meta.get("model_name") == EMBEDDING_MODEL_NAME:
+                        _index = index
+                    else:
+                        print("  Embedding model changed; rebuilding job index")
+                except Exception as e:
+                    print(f"  Warning: could not load job index ({e}); starting a new one")
+            if _index is None:
+                _index = VectorIndex(meta={"model_name": EMBEDDING_MODEL_NAME})
+    return _index
+
+def _add_to_index(jobs: List[Dict], embs: np.ndarray):
+    keep = [i for i, job in enumerate(jobs) if job.get("id") is not None]
+    if keep:
+        get_job_index().add([str(jobs[i]["id"]) for i in keep], embs[keep])
+
+def index_jobs(jobs: List[Dict], batch_size: Optional[int] = None, use_cache: bool = True) -> int:
+    """Add (or refresh) jobs in the job index; returns the index size."""
+    if jobs:
+        embs = encode_texts_cached([job.get("description") or "" for job in jobs], batch_size=batch_size, use_cache=use_cache)
+        _add_to_index(jobs, embs)
+    return len(get_job_index())
+
+def remove_from_index(job_ids: List[str]) -> int:
+    return get_job_index().remove([str(i) for i in job_ids])
+
+def save_job_index():
+    """Persist the job index if it changed since it was loaded or last saved."""
+    index = _index
+    if index is not None and index.dirty:
+        index.save(JOB_INDEX_PATH)
+
+def search_jobs(resume_texts: List[str], top_k: int = 20, nprobe: Optional[int] = None) -> List[List[Tuple[str, float]]]:
+    """
+    Best-matching indexed jobs for each resume, as (job id, similarity) pairs.
+    Only the index's nearest clusters are scanned (see VectorIndex.search), so
+    this stays fast on a large historical corpus. In hybrid scoring mode the
+    index holds only jobs the cascade shortlisted (see hybrid_score_matrix).
+    """
+    if not resume_texts:
+        return []
+    return get_job_index().search(encode_texts(resume_texts), top_k=top_k, nprobe=nprobe)
 
 if __name__ == "__main__":
     test_resume = "Data analyst skilled in Python, SQL, Pandas, Power BI"
@@ -1,9 +1,22 @@
 # src/parse_resume.py
 import os
-from typing import Dict, List
-from docx import Document
-import fitz  # PyMuPDF
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 from .utils import clean_text, simple_skill_extractor
+from .keyword_matcher import KeywordMatcher
+from .taxonomy import get_taxonomy
+
+# Import config with defaults for CI/testing
+try:
+    from config import RESUME_CACHE_ENABLED
+except ImportError:
+    RESUME_CACHE_ENABLED = True  # reuse parsed resumes (and their embeddings) until the file or parser changes
+
+# Bump when parsing changes in a way the source fingerprint can't see
+# (e.g. a PyMuPDF upgrade that extracts text differently)
+PARSER_VERSION = 1
 
 DEFAULT_SKILLS = [
     "Python", "SQL", "Pandas", "Excel", "Power BI", "Tableau",
@@ -17,6 +30,7 @@ DEFAULT_SKILLS = [
 # -----------------------------
 def extract_text_from_pdf(path: str) -> str:
     """Extract all text from a PDF file."""
+    import fitz  # PyMuPDF - imported here so startup doesn't pay for it
     with fitz.open(path) as doc:
         text = [page.get_text() for page in doc]
     return "\n".join(text)
@@ -24,6 +38,7 @@ def extract_text_from_pdf(path: str) -> str:
 
 def extract_text_from_docx(path: str) -> str:
     """Extract all text from a DOCX file."""
+    from docx import Document
     doc = Document(path)
     return "\n".join([p.text for p in doc.paragraphs])
 
@@ -31,58 +46,78 @@ def extract_text_from_docx(path: str) -> str:
 # -----------------------------
 # Job Role Detection
 # -----------------------------
+# Keywords that point to each role; a keyword may belong to several roles
+JOB_ROLE_KEYWORDS = {
+    "software engineer": [
+        "software engineer", "software developer", "backend developer", 
+        "frontend developer", "full stack", "java", "javascript", "react", 
+        "node.js", "spring", "django", "flask"
+    ],
+    "data scientist": [
+        "data scientist", "machine learning", "deep learning", "ai", 
+        "artificial intelligence", "neural network", "tensorflow", "pytorch", 
+        "keras", "nlp", "computer vision", "model"
+    ],
+    "data analyst": [
+        "data analyst", "business analyst", "data analysis", "analytics", 
+        "excel", "power bi", "tableau", "sql", "reporting", "dashboard", 
+        "visualization", "pandas"
+    ],
+    "data engineer": [
+        "data engineer", "etl", "data pipeline", "airflow", "spark", 
+        "hadoop", "kafka", "data warehouse", "bigquery", "snowflake"
+    ],
+    "ml engineer": [
+        "ml engineer", "machine learning engineer", "mlops", "model deployment", 
+        "scikit-learn", "model training", "feature engineering"
+    ],
+    "web developer": [
+        "web developer", "frontend", "backend", "html", "css", "javascript", 
+        "react", "angular", "vue", "web development"
+    ],
+    "devops engineer": [
+        "devops", "ci/cd", "docker", "kubernetes", "jenkins", "aws", 
+        "azure", "cloud", "infrastructure", "deployment"
+    ]
+}
+
+_role_matcher = None
+_keyword_roles: Dict[str, List[str]] = {}
+
+def _get_role_matcher() -> KeywordMatcher:
+    global _role_matcher, _keyword_roles
+    if _role_matcher is None:
+        keyword_roles: Dict[str, List[str]] = {}
+        for role, keywords in JOB_ROLE_KEYWORDS.items():
+            for keyword in keywords:
+                keyword_roles.setdefault(keyword.lower(), []).append(role)
+        _keyword_roles = keyword_roles
+        _role_matcher = KeywordMatcher(keyword_roles)
+    return _role_matcher
+
+def _role_keyword_hits(text: str) -> Dict[str, int]:
+    """{role: number of distinct role keywords in text}, from the taxonomy if it has roles."""
+    taxonomy = get_taxonomy()
+    if taxonomy is not None and taxonomy.has_roles:
+        return taxonomy.term_hits(text, "role")
+    matcher = _get_role_matcher()
+    hits: Dict[str, int] = {}
+    for keyword in matcher.find_all(text):
+        for role in _keyword_roles[keyword.lower()]:
+            hits[role] = hits.get(role, 0) + 1
+    return hits
+
 def detect_job_role(text: str, skills: List[str]) -> str:
-    """Detect the most likely job role based on resume content and skills"""
-    text_lower = text.lower()
-    
-    # Define job role patterns with keywords
-    job_roles = {
-        "software engineer": [
-            "software engineer", "software developer", "backend developer", 
-            "frontend developer", "full stack", "java", "javascript", "react", 
-            "node.js", "spring", "django", "flask"
-        ],
-        "data scientist": [
-            "data scientist", "machine learning", "deep learning", "ai", 
-            "artificial intelligence", "neural network", "tensorflow", "pytorch", 
-            "keras", "nlp", "computer vision", "model"
-        ],
-        "data analyst": [
-            "data analyst", "business analyst", "data analysis", "analytics", 
-            "excel", "power bi", "tableau", "sql", "reporting", "dashboard", 
-            "visualization", "pandas"
-        ],
-        "data engineer": [
-            "data engineer", "etl", "data pipeline", "airflow", "spark", 
-            "hadoop", "kafka", "data warehouse", "bigquery", "snowflake"
-        ],
-        "ml engineer": [
-            "ml engineer", "machine learning engineer", "mlops", "model deployment", 
-            "scikit-learn", "model training", "feature engineering"
-        ],
-        "web developer": [
-            "web developer", "frontend", "backend", "html", "css", "javascript", 
-            "react", "angular", "vue", "web development"
-        ],
-        "devops engineer": [
-            "devops", "ci/cd", "docker", "kubernetes", "jenkins", "aws", 
-            "azure", "cloud", "infrastructure", "deployment"
-        ]
-    }
-    
-    # Score each role based on keyword matches
-    role_scores = {}
-    for role, keywords in job_roles.items():
-        score = 0
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                score += 1
-            # Check if keyword is in skills list
-            if skills:
-                for skill in skills:
-                    if keyword.lower() in skill.lower():
-                        score += 2  # Skills match counts more
-        role_scores[role] = score
+    """Detect the most likely job role based on resume (or job description) content and skills"""
+    # Score each role based on keyword matches: +1 for every keyword in the
+    # text, +2 for every skill that mentions a keyword (skills count more).
+    # The text is scanned once for all keywords.
+    role_scores = {role: 0 for role in JOB_ROLE_KEYWORDS}
+    for role, n in _role_keyword_hits(text).items():
+        role_scores[role] = role_scores.get(role, 0) + n
+    for skill in skills or []:
+        for role, n in _role_keyword_hits(skill).items():
+            role_scores[role] = role_scores.get(role, 0) + 2 * n
     
     # Get the role with highest score
     if role_scores:
@@ -102,11 +137,77 @@ def detect_job_role(text: str, skills: List[str]) -> str:
     return "data analyst"  # Final fallback
 
 
+# -----------------------------
+# Skills
+# -----------------------------
+def extract_skills(text: str) -> List[str]:
+    """
+    Canonical skills mentioned in a resume or job description. Uses the skills
+    taxonomy (aliases resolved, e.g. "sklearn" -> "Scikit-learn") when one is
+    available, otherwise DEFAULT_SKILLS.
+    """
+    return extract_skills_many([text])[0]
+
+
+def extract_skills_many(texts: List[str]) -> List[List[str]]:
+    """extract_skills for many texts, looked up in the taxonomy in one batch."""
+    taxonomy = get_taxonomy()
+    if taxonomy is not None and taxonomy.has_skills:
+        return [sorted(hits) for hits in taxonomy.term_hits_many(texts, "skill")]
+    return [simple_skill_extractor(t, DEFAULT_SKILLS) for t in texts]
+
+
+# -----------------------------
+# Parsed-resume cache
+# -----------------------------
+_resume_cache = None
+_resume_cache_lock = threading.Lock()
+_parser_version = None
+
+def parser_version() -> str:
+    """
+    PARSER_VERSION plus a hash of the parsing code (this module, utils,
+    keyword_matcher and taxonomy) and the taxonomy sources, so any edit to the parser or
+    the skills taxonomy invalidates cached results automatically.
+    """
+    global _parser_version
+    if _parser_version is None:
+        h = hashlib.sha1(str(PARSER_VERSION).encode("utf-8"))
+        here = os.path.dirname(os.path.abspath(__file__))
+        for name in ("parse_resume.py", "utils.py", "keyword_matcher.py", "taxonomy.py"):
+            try:
+                with open(os.path.join(here, name), "rb") as f:
+                    h.update(f.read())
+            except OSError:
+                pass
+        taxonomy = get_taxonomy()
+        if taxonomy is not None:
+            h.update(taxonomy.signature.encode("ascii"))
+        _parser_version = f"{PARSER_VERSION}-{h.hexdigest()[:12]}"
+    return _parser_version
+
+def get_resume_cache():
+    """Process-wide parsed-resume cache, or None if disabled/unavailable."""
+    global _resume_cache
+    with _resume_cache_lock:
+        if _resume_cache is None and RESUME_CACHE_ENABLED:
+            try:
+                from .resume_cache import ResumeCache
+                _resume_cache = ResumeCache()
+            except Exception as e:
+                print(f"  Warning: resume cache unavailable: {e}")
+                return None
+        return _resume_cache
+
+
 # -----------------------------
 # Resume Parser
 # -----------------------------
-def parse_resume(path: str) -> Dict:
-    """Parse a resume and extract key info like email, phone, and skills."""
+def parse_resume(path: str, use_cache: bool = True) -> Dict:
+    """
+    Parse a resume and extract key info like email, phone, and skills.
+    Unchanged resumes are served from the parsed-resume cache.
+    """
 
     # ✅ Handle relative paths safely
     if not os.path.isabs(path):
@@ -117,6 +218,22 @@ def parse_resume(path: str) -> Dict:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Resume file not found at: {path}")
 
+    cache = get_resume_cache() if use_cache else None
+    if cache is None:
+        return _parse_resume_file(path)
+    from .resume_cache import resume_cache_key
+    with open(path, "rb") as f:
+        key = resume_cache_key(f.read(), parser_version())
+    parsed = cache.get(key)
+    if parsed is not None:
+        parsed["file_path"] = path
+        return parsed
+    parsed = _parse_resume_file(path)
+    cache.put(key, parsed)
+    return parsed
+
+
+def _parse_resume_file(path: str) -> Dict:
     # -----------------------------
     # Extract text from resume
     # -----------------------------
@@ -171,7 +288,7 @@ def parse_resume(path: str) -> Dict:
     # -----------------------------
     # Skills extraction
     # -----------------------------
-    skills = simple_skill_extractor(text, DEFAULT_SKILLS)
+    skills = extract_skills(text)
 
     # -----------------------------
     # Naive section extraction
@@ -215,6 +332,35 @@ def parse_resume(path: str) -> Dict:
     }
 
 
+def _parse_or_error(path: str):
+    try:
+        return parse_resume(path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def parse_resumes(paths: List[str], workers: Optional[int] = None) -> List[Optional[Dict]]:
+    """
+    Parse several resumes in parallel worker processes (text extraction and the
+    regex passes are CPU-bound). Results are in input order; a resume that
+    fails to parse gives None and a warning instead of stopping the batch.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        outcomes = [_parse_or_error(p) for p in paths]
+    else:
+        # compile the taxonomy here if it is missing or stale, so the workers only open it
+        get_taxonomy()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_parse_or_error, paths))
+    results = []
+    for path, (parsed, error) in zip(paths, outcomes):
+        if error:
+            print(f"  Warning: could not parse {path}: {error}")
+        results.append(parsed)
+    return results
+
+
 # -----------------------------
 # Script Entry Point
 # -----------------------------
@@ -0,0 +1,276 @@
+# src/profiling.py
+import os
+import csv
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Import config with defaults for CI/testing
+try:
+    from config import PROFILE_REPORTS, PROFILE_MODE, REPORTS_DIR
+except ImportError:
+    PROFILE_REPORTS = True   # write a JSON + CSV timing report for every run
+    PROFILE_MODE = ""        # "", "cprofile" or "pyinstrument"
+    REPORTS_DIR = "outputs/reports"
+
+_RSS_SAMPLE_INTERVAL = 0.05  # seconds
+
+
+# -----------------------------
+# Memory helpers
+# -----------------------------
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None if it can't be read."""
+    try:
+        import psutil
+        return int(psutil.Process().memory_info().rss)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    return peak_rss_bytes()
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak RSS of this process so far (ru_maxrss)."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes
+        return int(peak if os.uname().sysname == "Darwin" else peak * 1024)
+    except (ImportError, AttributeError):
+        return None
+
+def _cpu_seconds() -> float:
+    """CPU time of this process plus finished child processes (e.g. cover workers)."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+# -----------------------------
+# Latency histograms
+# -----------------------------
+class LatencyHistogram:
+    """Collects per-item latencies and summarizes them with percentiles and log2 buckets."""
+
+    def __init__(self):
+        self.values: List[float] = []
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.values.append(seconds)
+
+    def summary(self) -> Dict:
+        with self._lock:
+            values = sorted(self.values)
+        if not values:
+            return {"count": 0}
+
+        def pct(p: float) -> float:
+            return values[min(len(values) - 1, int(math.ceil(p / 100 * len(values))) - 1)]
+
+        # bucket upper bounds in ms: 1, 2, 4, ... so a histogram stays small
+        buckets: Dict[str, int] = {}
+        for v in values:
+            ms = v * 1000
+            bound = 1 if ms <= 1 else 2 ** math.ceil(math.log2(ms))
+            key = f"<={bound}ms"
+            buckets[key] = buckets.get(key, 0) + 1
+        return {
+            "count": len(values),
+            "total_s": sum(values),
+            "mean_s": sum(values) / len(values),
+            "p50_s": pct(50),
+            "p90_s": pct(90),
+            "p99_s": pct(99),
+            "max_s": values[-1],
+            "buckets": buckets,
+        }
+
+
+# -----------------------------
+# Run profiler
+# -----------------------------
+class RunProfiler:
+    """
+    Records wall time, CPU time and peak RSS per pipeline stage, plus per-item
+    latency histograms (fetch, embed, generate, ...), and writes them as a JSON
+    and CSV run report. Stages can be timed with `with profiler.stage(name):`
+    or with begin(name) / end() around straight-line code.
+
+    With mode "cprofile" or "pyinstrument" the whole run is also profiled and
+    the profile is dumped next to the report.
+    """
+
+    def __init__(self, run_name: str = "run", mode: Optional[str] = None, reports_dir: Optional[str] = None):
+        self.run_name = run_name
+        self.mode = (PROFILE_MODE if mode is None else mode) or ""
+        self.reports_dir = reports_dir or REPORTS_DIR
+        self.started_at = datetime.now()
+        self.stages: List[Dict] = []
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.meta: Dict = {}
+        self._current = None
+        self._profiler = None
+        self._t0 = time.perf_counter()
+
+    # ---- stages ----
+    def begin(self, name: str):
+        """Start timing `name`, ending the previous stage if one is open."""
+        if self._current:
+            self.end()
+        sampler = _RSSSampler()
+        sampler.start()
+        self._current = {
+            "name": name,
+            "wall": time.perf_counter(),
+            "cpu": _cpu_seconds(),
+            "sampler": sampler,
+        }
+
+    def end(self):
+        cur, self._current = self._current, None
+        if not cur:
+            return
+        peak = cur["sampler"].stop()
+        self.stages.append({
+            "stage": cur["name"],
+            "wall_s": time.perf_counter() - cur["wall"],
+            "cpu_s": _cpu_seconds() - cur["cpu"],
+            "peak_rss_mb": round(peak / (1024 * 1024), 1) if peak else None,
+        })
+
+    @contextmanager
+    def stage(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end()
+
+    # ---- latencies ----
+    def record(self, metric: str, seconds: float):
+        hist = self.histograms.get(metric)
+        if hist is None:
+            hist = self.histograms.setdefault(metric, LatencyHistogram())
+        hist.add(seconds)
+
+    # ---- optional profilers ----
+    def start_profiling(self):
+        if self.mode == "cprofile":
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.mode == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("  pyinstrument not installed; skipping profile")
+                return
+            self._profiler = Profiler()
+            self._profiler.start()
+
+    def _stop_profiling(self, base: str) -> Optional[str]:
+        if self._profiler is None:
+            return None
+        if self.mode == "cprofile":
+            self._profiler.disable()
+            path = base + ".prof"
+            self._profiler.dump_stats(path)
+        else:
+            self._profiler.stop()
+            path = base + "_profile.html"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self._profiler.output_html())
+        self._profiler = None
+        return path
+
+    # ---- report ----
+    def report(self) -> Dict:
+        return {
+            "run": self.run_name,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "total_wall_s": time.perf_counter() - self._t0,
+            "peak_rss_mb": round((peak_rss_bytes() or 0) / (1024 * 1024), 1),
+            "meta": self.meta,
+            "stages": self.stages,
+            "latencies": {name: h.summary() for name, h in self.histograms.items()},
+        }
+
+    def finish(self) -> Optional[str]:
+        """Close any open stage, write the JSON/CSV report and profile dump; return the JSON path."""
+        self.end()
+        if not PROFILE_REPORTS and self._profiler is None:
+            return None
+        os.makedirs(self.reports_dir, exist_ok=True)
+        base = os.path.join(self.reports_dir, f"{self.run_name}_{self.started_at.strftime('%Y%m%d_%H%M%S')}")
+        profile_path = self._stop_profiling(base)
+        if profile_path:
+            self.meta["profile"] = profile_path
+        report = self.report()
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        with open(base + ".csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["kind", "name", "count", "wall_s", "cpu_s", "peak_rss_mb", "p50_s", "p90_s", "p99_s", "max_s"])
+            for s in self.stages:
+                writer.writerow(["stage", s["stage"], 1, f"{s['wall_s']:.4f}", f"{s['cpu_s']:.4f}", s["peak_rss_mb"], "", "", "", ""])
+            for name, summ in report["latencies"].items():
+                if not summ["count"]:
+                    continue
+                writer.writerow(["latency", name, summ["count"], f"{summ['total_s']:.4f}", "", "",
+                                 f"{summ['p50_s']:.4f}", f"{summ['p90_s']:.4f}", f"{summ['p99_s']:.4f}", f"{summ['max_s']:.4f}"])
+        return base + ".json"
+
+    def print_summary(self):
+        print("  Stage timings:")
+        for s in self.stages:
+            rss = f"{s['peak_rss_mb']:.0f} MB" if s["peak_rss_mb"] is not None else "n/a"
+            print(f"    {s['stage']:<24} wall {s['wall_s']:7.2f}s  cpu {s['cpu_s']:7.2f}s  peak RSS {rss}")
+
+
+class _RSSSampler:
+    """Background thread that tracks the peak RSS while a stage runs."""
+
+    def __init__(self):
+        self.peak = current_rss_bytes() or 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(_RSS_SAMPLE_INTERVAL):
+            rss = current_rss_bytes() or 0
+            if rss > self.peak:
+                self.peak = rss
+
+    def stop(self) -> int:
+        self._stop.set()
+        self._thread.join()
+        rss = current_rss_bytes() or 0
+        return max(self.peak, rss)
+
+
+# -----------------------------
+# Active profiler
+# -----------------------------
+# Modules record per-item latencies through record_latency() so the profiler
+# doesn't have to be passed through every call; it's a no-op outside a run.
+_active: Optional[RunProfiler] = None
+
+def set_active_profiler(profiler: Optional[RunProfiler]):
+    global _active
+    _active = profiler
+
+def record_latency(metric: str, seconds: float):
+    if _active is not None:
+        _active.record(metric, seconds)
@@ -0,0 +1,126 @@
+# src/resume_cache.py
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+import time
+from typing import Dict, Optional
+import numpy as np
+from .embedding_cache import embedding_key
+
+# Import config with defaults for CI/testing
+try:
+    from config import RESUME_CACHE_PATH, RESUME_CACHE_MAX_ENTRIES
+except ImportError:
+    RESUME_CACHE_PATH = "outputs/.cache/resumes.sqlite"
+    RESUME_CACHE_MAX_ENTRIES = 1000
+
+
+def resume_cache_key(content: bytes, parser_version: str) -> str:
+    """Key of a parsed resume: the file's bytes plus the parser that read them."""
+    h = hashlib.sha1(parser_version.encode("utf-8"))
+    h.update(b"\0")
+    h.update(content)
+    return h.hexdigest()
+
+
+class ResumeCache:
+    """
+    Persistent cache of parsed resumes and resume embeddings (SQLite).
+
+    Parsed dicts are keyed by resume_cache_key(file bytes, parser version), so
+    editing the resume or changing the parser misses the cache. Embeddings are
+    keyed by (model name, parsed text) and therefore follow the parsed text.
+    Beyond max_entries rows per table the least recently used are evicted.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None):
+        self.path = path or RESUME_CACHE_PATH
+        self.max_entries = max_entries if max_entries is not None else RESUME_CACHE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # resumes may be parsed by several worker processes at once
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS resumes (
+                key TEXT PRIMARY KEY, parsed_json TEXT NOT NULL, last_used REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS resume_embeddings (
+                key TEXT PRIMARY KEY, dim INTEGER NOT NULL, vec BLOB NOT NULL, last_used REAL NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    # -----------------------------
+    # Parsed resumes
+    # -----------------------------
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT parsed_json FROM resumes WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE resumes SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, parsed: Dict):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resumes (key, parsed_json, last_used) VALUES (?, ?, ?)",
+                (key, json.dumps(parsed), time.time()),
+            )
+            self._evict("resumes")
+            self._conn.commit()
+
+    # -----------------------------
+    # Resume embeddings
+    # -----------------------------
+    def get_embedding(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        key = embedding_key(model_name, text)
+        with self._lock:
+            row = self._conn.execute("SELECT dim, vec FROM resume_embeddings WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE resume_embeddings SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return np.frombuffer(row[1], dtype=np.float32, count=row[0])
+
+    def put_embedding(self, model_name: str, text: str, vec: np.ndarray):
+        v = np.ascontiguousarray(vec, dtype=np.float32).ravel()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resume_embeddings (key, dim, vec, last_used) VALUES (?, ?, ?, ?)",
+                (embedding_key(model_name, text), int(v.shape[0]), v.tobytes(), time.time()),
+            )
+            self._evict("resume_embeddings")
+            self._conn.commit()
+
+    def _evict(self, table: str):
+        if not self.max_entries or self.max_entries <= 0:
+            return
+        (count,) = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                f"DELETE FROM {table} WHERE key IN (SELECT key FROM {table} ORDER BY last_used ASC LIMIT ?)", (excess,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM resumes")
+            self._conn.execute("DELETE FROM resume_embeddings")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,107 @@
+# src/scoring.py
+import re
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+# Import config with defaults for CI/testing
+try:
+    from config import SCORING_MODE, SCORE_WEIGHTS, HYBRID_SHORTLIST
+except ImportError:
+    SCORING_MODE = "hybrid"  # "hybrid" (lexical + skills + embedding) or "embedding"
+    SCORE_WEIGHTS = {"embedding": 0.6, "lexical": 0.25, "skills": 0.15}
+    HYBRID_SHORTLIST = 200   # jobs per resume kept by the lexical pass for embedding (0 = all)
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in is it its of on or our that the their this
+to was we were will with you your us all any can who what when where which while into over
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall((text or "").lower()) if t not in _STOPWORDS]
+
+
+# -----------------------------
+# Lexical scoring
+# -----------------------------
+class BM25Index:
+    """
+    Inverted index over a fixed set of documents with Okapi BM25 scoring.
+
+    Each posting stores its final BM25 term weight, so scoring a query is a
+    single weighted bincount over the postings of the query's terms. Query
+    terms are counted once, which suits long queries such as a whole resume.
+    """
+
+    def __init__(self, texts: Sequence[str], k1: float = 1.5, b: float = 0.75):
+        self.n_docs = len(texts)
+        # map tokens to ids in Python, then build postings with array operations
+        self._vocab: Dict[str, int] = {}
+        term_ids, doc_ids = [], []
+        for d, text in enumerate(texts):
+            ids = [self._vocab.setdefault(t, len(self._vocab)) for t in tokenize(text)]
+            term_ids.extend(ids)
+            doc_ids.extend([d] * len(ids))
+        terms = np.array(term_ids, dtype=np.int64)
+        docs = np.array(doc_ids, dtype=np.int64)
+        lengths = np.bincount(docs, minlength=self.n_docs).astype(np.float32)
+        avgdl = float(lengths.mean()) if self.n_docs and lengths.mean() > 0 else 1.0
+        norm = k1 * (1 - b + b * lengths / avgdl)
+
+        # one posting per (term, doc) pair, sorted by term
+        pairs, tf = np.unique(terms * max(self.n_docs, 1) + docs, return_counts=True)
+        p_terms, p_docs = pairs // max(self.n_docs, 1), pairs % max(self.n_docs, 1)
+        df = np.bincount(p_terms, minlength=len(self._vocab))
+        idf = np.log(1 + (self.n_docs - df + 0.5) / (df + 0.5))
+        tf = tf.astype(np.float32)
+        self._docs = p_docs.astype(np.int32)
+        self._weights = (idf[p_terms] * tf * (k1 + 1) / (tf + norm[p_docs])).astype(np.float32)
+        self._starts = np.concatenate(([0], np.cumsum(df)))
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document for `query`."""
+        ids = [self._vocab[t] for t in set(tokenize(query)) if t in self._vocab]
+        if not ids:
+            return np.zeros(self.n_docs, dtype=np.float32)
+        spans = [slice(self._starts[i], self._starts[i + 1]) for i in ids]
+        docs = np.concatenate([self._docs[s] for s in spans])
+        weights = np.concatenate([self._weights[s] for s in spans])
+        return np.bincount(docs, weights=weights, minlength=self.n_docs).astype(np.float32)
+
+
+# -----------------------------
+# Skill overlap
+# -----------------------------
+def skill_overlap(resume_skills: Sequence[str], job_skills: Sequence[Sequence[str]]) -> np.ndarray:
+    """Share of each job's recognized skills that the resume has (0 if the job lists none)."""
+    have = {s.lower() for s in resume_skills or []}
+    out = np.zeros(len(job_skills), dtype=np.float32)
+    for j, skills in enumerate(job_skills):
+        if skills:
+            out[j] = sum(1 for s in skills if s.lower() in have) / len(skills)
+    return out
+
+
+# -----------------------------
+# Weights and cascade
+# -----------------------------
+def normalized_weights(weights: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """SCORE_WEIGHTS (or `weights`) for embedding / lexical / skills, scaled to sum to 1."""
+    w = dict(SCORE_WEIGHTS)
+    w.update(weights or {})
+    w = {k: max(0.0, float(w.get(k, 0.0))) for k in ("embedding", "lexical", "skills")}
+    total = sum(w.values()) or 1.0
+    return {k: v / total for k, v in w.items()}
+
+def shortlist_columns(cheap: np.ndarray, shortlist: Optional[int]) -> np.ndarray:
+    """
+    Job columns that go on to the embedding pass: the union over resumes of
+    each resume's top `shortlist` jobs by cheap score (all jobs if shortlist
+    is 0/None or covers every job).
+    """
+    n_jobs = cheap.shape[1]
+    if not shortlist or shortlist >= n_jobs:
+        return np.arange(n_jobs)
+    keep = np.argpartition(-cheap, shortlist - 1, axis=1)[:, :shortlist]
+    return np.unique(keep)
@@ -0,0 +1,108 @@
+# src/streaming.py
+import queue
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional
+
+# Import config with defaults for CI/testing
+try:
+    from config import STREAM_QUEUE_SIZE, STREAM_BATCH_SIZE, STREAM_MAX_WAIT
+except ImportError:
+    STREAM_QUEUE_SIZE = 64   # items a stage may run ahead of the next one
+    STREAM_BATCH_SIZE = 32   # jobs per embedding micro-batch
+    STREAM_MAX_WAIT = 0.5    # seconds to wait for a micro-batch to fill before scoring a partial one
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def put_until_stopped(q: "queue.Queue", item, stop: threading.Event) -> bool:
+    """q.put(item) that gives up (returns False) once `stop` is set, so producers never block forever."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _start_producer(iterable: Iterable, maxsize: int, name: str):
+    q: "queue.Queue" = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def run():
+        try:
+            for item in iterable:
+                if not put_until_stopped(q, item, stop):
+                    return
+            put_until_stopped(q, _DONE, stop)
+        except BaseException as e:
+            put_until_stopped(q, _Failure(e), stop)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return q, stop
+
+
+def _check(item):
+    if isinstance(item, _Failure):
+        raise item.error
+    return item
+
+
+def bounded(iterable: Iterable, maxsize: Optional[int] = None, name: str = "stream") -> Iterator:
+    """
+    Iterate `iterable` in a background thread, at most `maxsize` items
+    (STREAM_QUEUE_SIZE) ahead of the consumer. The producer blocks while the
+    queue is full, so memory stays bounded however long the stream is, and is
+    stopped when the consumer closes this generator. Exceptions raised by the
+    producer are re-raised in the consumer.
+    """
+    q, stop = _start_producer(iterable, maxsize or STREAM_QUEUE_SIZE, name)
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            yield _check(item)
+    finally:
+        stop.set()
+
+
+def micro_batches(iterable: Iterable, size: Optional[int] = None, max_wait: Optional[float] = None,
+                  maxsize: Optional[int] = None, name: str = "micro-batches") -> Iterator[List]:
+    """
+    Group a stream into lists of up to `size` items (STREAM_BATCH_SIZE). A
+    batch is handed on as soon as it is full, or `max_wait` seconds
+    (STREAM_MAX_WAIT) after its first item arrived, so a slow producer does
+    not hold back the items it has already delivered. Like bounded(), the
+    producer runs in a background thread behind a bounded queue.
+    """
+    size = max(1, size or STREAM_BATCH_SIZE)
+    max_wait = STREAM_MAX_WAIT if max_wait is None else max_wait
+    q, stop = _start_producer(iterable, maxsize or STREAM_QUEUE_SIZE, name)
+    try:
+        done = False
+        while not done:
+            item = q.get()
+            if item is _DONE:
+                return
+            batch = [_check(item)]
+            deadline = time.monotonic() + max_wait
+            while len(batch) < size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = q.get(timeout=remaining) if remaining > 0 else q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(_check(item))
+            yield batch
+    finally:
+        stop.set()
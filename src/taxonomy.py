@@ -0,0 +1,342 @@
+# src/taxonomy.py
+import os
+import re
+import csv
+import json
+import mmap
+import zlib
+import uuid
+import struct
+import hashlib
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+# Import config with defaults for CI/testing
+try:
+    from config import TAXONOMY_SOURCES, TAXONOMY_PATH
+except ImportError:
+    # CSV (name,aliases,category; aliases separated by "|") or JSON files;
+    # a JSON entry with "keywords" describes a role instead of a skill
+    TAXONOMY_SOURCES = ["taxonomy/skills.csv", "taxonomy/roles.json"]
+    TAXONOMY_PATH = "outputs/.cache/taxonomy.bin"  # relative to the project root, like the sources
+
+SKILL, ROLE = 0, 1
+KINDS = {"skill": SKILL, "role": ROLE}
+
+_MAGIC = b"SKTX"
+_VERSION = 1
+# magic, version, entries, terms, blob bytes, max words per term, source signature
+_HEADER = struct.Struct("<4sIIIII40s")
+
+# A token is a run of letters/digits that may contain + # . / - inside or
+# end in + or # ("c++", "c#", "node.js", "ci/cd", "scikit-learn")
+_TOKEN = re.compile(r"[a-z0-9](?:[a-z0-9+#./-]*[a-z0-9+#])?")
+# Separators inside a token that also join separate words ("Python/SQL", "Excel-based")
+_JOINER = re.compile(r"[/-]")
+
+
+def normalize_term(term: str) -> str:
+    """Lowercase a term and split it into tokens the way text is tokenized."""
+    return " ".join(_TOKEN.findall((term or "").lower()))
+
+_term_hash = zlib.crc32
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+# -----------------------------
+# Sources
+# -----------------------------
+def read_sources(paths: Sequence[str]) -> List[Tuple[str, int, List[str]]]:
+    """(canonical name, kind, terms) for every entry in the CSV / JSON sources."""
+    entries = []
+    for path in paths:
+        if path.lower().endswith(".json"):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                data = [dict(v, name=k) if isinstance(v, dict) else {"name": k, "aliases": v} for k, v in data.items()]
+            for item in data:
+                kind = KINDS[item.get("type") or ("role" if "keywords" in item else "skill")]
+                terms = [item["name"]] + list(item.get("aliases") or []) + list(item.get("keywords") or [])
+                entries.append((item["name"], kind, terms))
+        else:
+            with open(path, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    name = (row.get("name") or "").strip()
+                    if not name:
+                        continue
+                    kind = KINDS[(row.get("type") or "skill").strip() or "skill"]
+                    aliases = [a.strip() for a in (row.get("aliases") or "").split("|") if a.strip()]
+                    entries.append((name, kind, [name] + aliases))
+    return entries
+
+def source_signature(paths: Sequence[str]) -> str:
+    """Changes whenever a source file is added, removed or modified."""
+    h = hashlib.sha1()
+    for path in paths:
+        try:
+            st = os.stat(path)
+            h.update(f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}\n".encode("utf-8"))
+        except OSError:
+            h.update(f"{path}|missing\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+# -----------------------------
+# Compiled format
+# -----------------------------
+def build_taxonomy(entries: Iterable[Tuple[str, int, List[str]]], path: str, signature: str = ""):
+    """
+    Write entries to the compiled format: a header, per-entry and per-term
+    uint32 tables (terms sorted by hash) and one UTF-8 string blob, so the
+    file can be memory-mapped and searched without being parsed.
+    """
+    blob = bytearray()
+
+    def add_string(s: str) -> Tuple[int, int]:
+        b = s.encode("utf-8")
+        blob.extend(b)
+        return len(blob) - len(b), len(b)
+
+    entry_rows, term_rows, max_words = [], [], 1
+    for entry_id, (name, kind, terms) in enumerate(entries):
+        off, ln = add_string(name)
+        entry_rows.append((off, ln, kind))
+        for term in dict.fromkeys(normalize_term(t) for t in terms):
+            if not term:
+                continue
+            max_words = max(max_words, term.count(" ") + 1)
+            tb = term.encode("utf-8")
+            off, ln = add_string(term)
+            term_rows.append((_term_hash(tb), off, ln, entry_id))
+    term_rows.sort()
+
+    entries_arr = np.array(entry_rows, dtype=np.uint32).reshape(-1, 3)
+    terms_arr = np.array(term_rows, dtype=np.uint32).reshape(-1, 4)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # a temp file of our own: parse_resumes workers may build the same taxonomy at once
+    tmp = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(entries_arr), len(terms_arr), len(blob), max_words,
+                                 signature.encode("ascii")[:40].ljust(40, b"\0")))
+            for arr in (entries_arr, terms_arr):
+                f.write(b"\0" * (_align(f.tell()) - f.tell()))
+                f.write(np.ascontiguousarray(arr.T).tobytes())  # column-major: one array per field
+            f.write(bytes(blob))
+        os.replace(tmp, path)
+    except OSError:
+        # replacing fails on Windows while another process has the file mapped;
+        # that is fine if it is a build of the same sources
+        if not signature or not _has_signature(path, signature):
+            raise
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _has_signature(path: str, signature: str) -> bool:
+    try:
+        taxonomy = Taxonomy(path)
+    except (ValueError, struct.error, OSError):
+        return False
+    try:
+        return taxonomy.signature == signature
+    finally:
+        taxonomy.close()
+
+
+class Taxonomy:
+    """
+    A compiled skill / role taxonomy, memory-mapped read-only.
+
+    Every entry (canonical skill or role) owns a set of terms: its name,
+    aliases ("sklearn" -> "Scikit-learn") and, for roles, keywords. Looking up
+    a text tokenizes it once, hashes every n-gram of up to the longest term's
+    word count and resolves all of them with one vectorized search over the
+    hash-sorted term table, so the cost depends on the text length, not on
+    the size of the taxonomy. Opening a taxonomy costs a few microseconds
+    whatever its size; pages are read lazily by the OS.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_entries, n_terms, blob_len, self.max_words, sig = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a compiled taxonomy (version {_VERSION})")
+        self.signature = sig.rstrip(b"\0").decode("ascii")
+        offset = _align(_HEADER.size)
+        entries = np.frombuffer(self._mm, dtype=np.uint32, count=3 * n_entries, offset=offset).reshape(3, n_entries)
+        offset = _align(offset + entries.nbytes)
+        terms = np.frombuffer(self._mm, dtype=np.uint32, count=4 * n_terms, offset=offset).reshape(4, n_terms)
+        offset += terms.nbytes
+        self._entry_off, self._entry_len, self._entry_kind = entries
+        self._term_hash, self._term_off, self._term_len, self._term_entry = terms
+        self._blob = offset
+
+    def __len__(self) -> int:
+        return len(self._entry_off)
+
+    @property
+    def n_terms(self) -> int:
+        return len(self._term_hash)
+
+    @property
+    def has_skills(self) -> bool:
+        return bool(np.any(self._entry_kind == SKILL))
+
+    @property
+    def has_roles(self) -> bool:
+        return bool(np.any(self._entry_kind == ROLE))
+
+    def _string(self, off: int, ln: int) -> bytes:
+        start = self._blob + int(off)
+        return self._mm[start:start + int(ln)]
+
+    def entry_name(self, entry_id: int) -> str:
+        return self._string(self._entry_off[entry_id], self._entry_len[entry_id]).decode("utf-8")
+
+    def _lookup(self, grams: List[str]) -> List[Tuple[int, int]]:
+        """(gram index, term index) for every gram that is a term."""
+        if not grams or not self.n_terms:
+            return []
+        encoded = [g.encode("utf-8") for g in grams]
+        hashes = np.fromiter(map(_term_hash, encoded), dtype=np.uint32, count=len(encoded))
+        lo = np.searchsorted(self._term_hash, hashes, side="left")
+        hi = np.searchsorted(self._term_hash, hashes, side="right")
+        hits = []
+        for g in np.flatnonzero(hi > lo):
+            for t in range(lo[g], hi[g]):
+                # different terms can share a crc32; compare the bytes
+                if self._string(self._term_off[t], self._term_len[t]) == encoded[g]:
+                    hits.append((int(g), int(t)))
+        return hits
+
+    def _ngrams(self, text: str) -> List[str]:
+        tokens = _TOKEN.findall((text or "").lower())
+        sequences = [tokens]
+        if any(_JOINER.search(t) for t in tokens):
+            # whole tokens match terms like "ci/cd"; their parts match "Python/SQL" or "Excel-based"
+            sequences.append([p for t in tokens for p in _TOKEN.findall(_JOINER.sub(" ", t))])
+        grams: List[str] = []
+        for seq in sequences:
+            grams.extend(seq)
+            for n in range(2, self.max_words + 1):
+                grams.extend(map(" ".join, zip(*(seq[k:] for k in range(n)))))
+        return grams
+
+    def term_hits(self, text: str, kind: Optional[str] = None) -> Dict[str, int]:
+        """
+        {canonical name: number of distinct terms of that entry found in text};
+        `kind` is "skill" or "role" (default both).
+        """
+        return self.term_hits_many([text], kind)[0]
+
+    def term_hits_many(self, texts: Sequence[str], kind: Optional[str] = None) -> List[Dict[str, int]]:
+        """term_hits for many texts (e.g. job descriptions) with one lookup for all of them."""
+        want = KINDS[kind] if kind else None
+        # look up each distinct n-gram once, then intersect it with every text's n-grams
+        doc_grams = [set(self._ngrams(text)) for text in texts]
+        vocab = list(set().union(*doc_grams))
+        matched: Dict[str, List[int]] = {}
+        for g, t in self._lookup(vocab):
+            entry = int(self._term_entry[t])
+            if want is None or self._entry_kind[entry] == want:
+                matched.setdefault(vocab[g], []).append(entry)
+        names = {e: self.entry_name(e) for entries in matched.values() for e in entries}
+        results: List[Dict[str, int]] = []
+        for grams in doc_grams:
+            found: Dict[str, int] = {}
+            for gram in grams.intersection(matched):
+                for entry in matched[gram]:
+                    found[names[entry]] = found.get(names[entry], 0) + 1
+            results.append(found)
+        return results
+
+    def find(self, text: str, kind: Optional[str] = None) -> List[str]:
+        """Canonical names of the entries mentioned in `text`."""
+        return list(self.term_hits(text, kind))
+
+    def canonical(self, term: str, kind: Optional[str] = None) -> Optional[str]:
+        """Canonical name for an exact term or alias, e.g. "sklearn" -> "Scikit-learn"."""
+        want = KINDS[kind] if kind else None
+        for _, t in self._lookup([normalize_term(term)]):
+            entry = int(self._term_entry[t])
+            if want is None or self._entry_kind[entry] == want:
+                return self.entry_name(entry)
+        return None
+
+    def names(self, kind: Optional[str] = None) -> List[str]:
+        want = KINDS[kind] if kind else None
+        return [self.entry_name(i) for i in range(len(self)) if want is None or self._entry_kind[i] == want]
+
+    def close(self):
+        # the numpy views must go before the map they point into can be closed
+        self._entry_off = self._entry_len = self._entry_kind = None
+        self._term_hash = self._term_off = self._term_len = self._term_entry = None
+        self._mm.close()
+
+
+# -----------------------------
+# Process-wide taxonomy
+# -----------------------------
+_taxonomy: Optional[Taxonomy] = None
+_taxonomy_loaded = False
+_taxonomy_lock = threading.Lock()
+
+def _resolve(path: str) -> str:
+    # relative paths are relative to the project root, like resume paths
+    if os.path.isabs(path):
+        return path
+    return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", path))
+
+def load_taxonomy(sources: Optional[Sequence[str]] = None, path: Optional[str] = None) -> Optional[Taxonomy]:
+    """
+    Open the compiled taxonomy, (re)building it first if the sources changed
+    since it was compiled. Returns None if none of the sources exist.
+    """
+    sources = [_resolve(p) for p in (TAXONOMY_SOURCES if sources is None else sources)]
+    sources = [p for p in sources if os.path.exists(p)]
+    if not sources:
+        return None
+    path = _resolve(path or TAXONOMY_PATH)
+    signature = source_signature(sources)
+    if os.path.exists(path):
+        try:
+            taxonomy = Taxonomy(path)
+            if taxonomy.signature == signature:
+                return taxonomy
+            taxonomy.close()
+        except (ValueError, struct.error, OSError):
+            pass
+    print(f"  Building skills taxonomy from {len(sources)} source file(s)...")
+    build_taxonomy(read_sources(sources), path, signature)
+    return Taxonomy(path)
+
+def get_taxonomy() -> Optional[Taxonomy]:
+    """Process-wide taxonomy (see load_taxonomy), or None if unavailable."""
+    global _taxonomy, _taxonomy_loaded
+    with _taxonomy_lock:
+        if not _taxonomy_loaded:
+            _taxonomy_loaded = True
+            try:
+                _taxonomy = load_taxonomy()
+            except Exception as e:
+                print(f"  Warning: skills taxonomy unavailable: {e}")
+        return _taxonomy
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python -m src.taxonomy [source ...] : compile and report
+    t = load_taxonomy(sys.argv[1:] or None)
+    if t is None:
+        print("No taxonomy sources found")
+    else:
+        print(f"{t.path}: {len(t)} entries ({len(t.names('skill'))} skills, {len(t.names('role'))} roles), {t.n_terms} terms")
@@ -1,6 +1,8 @@
 # src/utils.py
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
+from .keyword_matcher import KeywordMatcher
 
 def clean_text(t: str) -> str:
     if not t:
@@ -11,10 +13,10 @@ def clean_text(t: str) -> str:
     t = re.sub(r'[ \t]+', ' ', t)
     return t.strip()
 
+@lru_cache(maxsize=16)
+def _skill_matcher(skills_vocab: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(skills_vocab)
+
 def simple_skill_extractor(text: str, skills_vocab: List[str]) -> List[str]:
-    text_low = text.lower()
-    found = []
-    for skill in skills_vocab:
-        if skill.lower() in text_low:
-            found.append(skill)
-    return sorted(set(found))
+    """Skills from `skills_vocab` mentioned in `text` (a resume or a job description), as whole words."""
+    return sorted(set(_skill_matcher(tuple(skills_vocab)).find_all(text or "")))
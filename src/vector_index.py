@@ -0,0 +1,264 @@
+# src/vector_index.py
+import os
+import json
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .match_jobs import top_k_indices
+
+# Import config with defaults for CI/testing
+try:
+    from config import JOB_INDEX_NPROBE, JOB_INDEX_MIN_TRAIN
+except ImportError:
+    JOB_INDEX_NPROBE = 8        # clusters searched per query: higher = better recall, slower
+    JOB_INDEX_MIN_TRAIN = 2048  # below this many vectors every query is an exact scan
+
+_KMEANS_ITERS = 10
+_KMEANS_SAMPLE_PER_LIST = 64  # training vectors per cluster
+_RETRAIN_GROWTH = 4           # retrain once the index is this many times larger than when trained
+_CHUNK = 8192                 # rows per block when assigning vectors to clusters
+_INDEX_VERSION = 1
+
+
+def _normalize(x: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    return x / np.where(norms == 0, 1, norms)
+
+def _nearest_centroid(x: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    out = np.empty(len(x), dtype=np.int32)
+    for i in range(0, len(x), _CHUNK):
+        out[i:i + _CHUNK] = np.argmax(x[i:i + _CHUNK] @ centroids.T, axis=1)
+    return out
+
+def _spherical_kmeans(x: np.ndarray, k: int, seed: int = 0) -> np.ndarray:
+    """Cluster unit vectors by cosine similarity; returns (k, dim) unit centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = x[rng.choice(len(x), k, replace=False)].copy()
+    for _ in range(_KMEANS_ITERS):
+        assign = _nearest_centroid(x, centroids)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=k)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        filled = counts > 0
+        sums = np.zeros_like(centroids)
+        sums[filled] = np.add.reduceat(x[order], starts[filled], axis=0)
+        # reseed empty clusters with random vectors so every list gets used
+        sums[~filled] = x[rng.choice(len(x), int((~filled).sum()), replace=False)]
+        centroids = _normalize(sums).astype(np.float32)
+    return centroids
+
+
+class VectorIndex:
+    """
+    Inverted-file (IVF) index over unit-length embeddings, in pure NumPy.
+
+    Vectors are grouped into about sqrt(n) clusters by spherical k-means; a
+    query scores the centroids, then only the vectors in the `nprobe` closest
+    clusters, so nprobe trades recall for latency (nprobe >= number of
+    clusters is an exact search). Small indexes are never clustered and are
+    always searched exactly.
+
+    Vectors are added and removed by string id (adding an existing id replaces
+    its vector). The clustering is trained automatically once the index holds
+    min_train vectors and retrained as it grows; save() / load() persist it
+    to a single .npz file. nprobe is not part of the file: a loaded index
+    uses the value passed to load() or JOB_INDEX_NPROBE.
+    """
+
+    def __init__(self, dim: Optional[int] = None, nprobe: Optional[int] = None, min_train: Optional[int] = None, meta: Optional[Dict] = None):
+        self.dim = dim
+        self.nprobe = nprobe or JOB_INDEX_NPROBE
+        self.min_train = min_train if min_train is not None else JOB_INDEX_MIN_TRAIN
+        self.meta: Dict = dict(meta or {})
+        self._lock = threading.RLock()
+        self._vectors = np.zeros((0, dim or 0), dtype=np.float32)
+        self._ids: List[Optional[str]] = []        # row -> id, None once deleted
+        self._rows: Dict[str, int] = {}            # id -> row
+        self._assign = np.zeros(0, dtype=np.int32)  # row -> cluster, -1 once deleted
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_on = 0
+        self._lists: Optional[List[np.ndarray]] = None  # cluster -> rows, rebuilt lazily
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._rows
+
+    @property
+    def nlist(self) -> int:
+        return 0 if self._centroids is None else len(self._centroids)
+
+    # -----------------------------
+    # Updates
+    # -----------------------------
+    def add(self, ids: Sequence[str], vectors: np.ndarray):
+        """Insert or replace vectors (rows are normalized here)."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1)
+        if not len(ids):
+            return
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}")
+            # last occurrence of a repeated id wins
+            latest = {str(i): n for n, i in enumerate(ids)}
+            self.remove(list(latest))
+            keep = np.fromiter(latest.values(), dtype=np.int64, count=len(latest))
+            vectors = _normalize(vectors[keep])
+
+            start = len(self._ids)
+            self._reserve(start + len(vectors))
+            self._vectors[start:start + len(vectors)] = vectors
+            for n, job_id in enumerate(latest):
+                self._ids.append(job_id)
+                self._rows[job_id] = start + n
+            new_assign = _nearest_centroid(vectors, self._centroids) if self._centroids is not None else np.zeros(len(vectors), dtype=np.int32)
+            self._assign = np.concatenate([self._assign, new_assign])
+            self._lists = None
+            self.dirty = True
+
+            if len(self._rows) >= self.min_train and (
+                self._centroids is None or len(self._rows) > _RETRAIN_GROWTH * self._trained_on
+            ):
+                self.train()
+
+    def remove(self, ids: Sequence[str]) -> int:
+        """Delete ids (unknown ids are ignored); returns how many were removed."""
+        removed = 0
+        with self._lock:
+            for job_id in ids:
+                row = self._rows.pop(str(job_id), None)
+                if row is None:
+                    continue
+                self._ids[row] = None
+                self._assign[row] = -1
+                removed += 1
+            if removed:
+                self._lists = None
+                self.dirty = True
+                dead = len(self._ids) - len(self._rows)
+                if dead > max(1024, len(self._ids) // 4):
+                    self._compact()
+        return removed
+
+    def _reserve(self, rows: int):
+        if rows <= len(self._vectors):
+            return
+        grown = np.zeros((max(rows, 2 * len(self._vectors), 1024), self.dim), dtype=np.float32)
+        grown[:len(self._ids)] = self._vectors[:len(self._ids)]
+        self._vectors = grown
+
+    def _compact(self):
+        alive = np.flatnonzero(self._assign >= 0)
+        self._vectors = self._vectors[alive].copy()
+        self._assign = self._assign[alive]
+        self._ids = [self._ids[r] for r in alive]
+        self._rows = {job_id: n for n, job_id in enumerate(self._ids)}
+        self._lists = None
+
+    def train(self, seed: int = 0):
+        """(Re)cluster the stored vectors into about sqrt(n) lists."""
+        with self._lock:
+            self._compact()
+            n = len(self._ids)
+            if n == 0:
+                return
+            k = max(1, int(np.sqrt(n)))
+            vectors = self._vectors[:n]
+            rng = np.random.default_rng(seed)
+            sample_size = min(n, k * _KMEANS_SAMPLE_PER_LIST)
+            sample = vectors[rng.choice(n, sample_size, replace=False)] if sample_size < n else vectors
+            self._centroids = _spherical_kmeans(sample, k, seed=seed)
+            self._assign = _nearest_centroid(vectors, self._centroids)
+            self._trained_on = n
+            self._lists = None
+            self.dirty = True
+
+    def _inverted_lists(self) -> List[np.ndarray]:
+        if self._lists is None:
+            rows = np.flatnonzero(self._assign >= 0)
+            assign = self._assign[rows]
+            order = np.argsort(assign, kind="stable")
+            counts = np.bincount(assign, minlength=self.nlist)
+            self._lists = np.split(rows[order], np.cumsum(counts)[:-1])
+        return self._lists
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def search(self, queries: np.ndarray, top_k: int = 20, nprobe: Optional[int] = None) -> List[List[Tuple[str, float]]]:
+        """
+        For each query vector, the top_k (id, cosine similarity) pairs, best
+        first. `nprobe` overrides the index default for this call.
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        with self._lock:
+            if not self._rows or top_k <= 0:
+                return [[] for _ in queries]
+            queries = _normalize(queries.reshape(len(queries), self.dim))
+            nprobe = nprobe or self.nprobe
+            if self._centroids is None or nprobe >= self.nlist:
+                rows = np.flatnonzero(self._assign >= 0)
+                all_scores = self._vectors[rows] @ queries.T
+                results = []
+                for q in range(len(queries)):
+                    best = top_k_indices(all_scores[:, q], top_k)
+                    results.append([(self._ids[rows[i]], float(all_scores[i, q])) for i in best])
+                return results
+
+            lists = self._inverted_lists()
+            probes = np.argsort(-(queries @ self._centroids.T), axis=1)[:, :nprobe]
+            results = []
+            for q, query in enumerate(queries):
+                rows = np.concatenate([lists[c] for c in probes[q]])
+                scores = self._vectors[rows] @ query
+                best = top_k_indices(scores, top_k)
+                results.append([(self._ids[rows[i]], float(scores[i])) for i in best])
+            return results
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def save(self, path: str):
+        """Write the index to `path` (.npz), replacing any previous file atomically."""
+        with self._lock:
+            self._compact()
+            n = len(self._ids)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            # nprobe is not saved: it is a query-time setting (JOB_INDEX_NPROBE or the caller's)
+            meta = dict(self.meta, version=_INDEX_VERSION, trained_on=self._trained_on)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                np.savez(
+                    f,
+                    vectors=self._vectors[:n],
+                    ids=np.array(self._ids, dtype=str),
+                    assign=self._assign,
+                    centroids=self._centroids if self._centroids is not None else np.zeros((0, self.dim or 0), dtype=np.float32),
+                    meta=np.array(json.dumps(meta)),
+                )
+            os.replace(tmp, path)
+            self.dirty = False
+
+    @classmethod
+    def load(cls, path: str, nprobe: Optional[int] = None, min_train: Optional[int] = None) -> "VectorIndex":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.pop("version", None) != _INDEX_VERSION:
+                raise ValueError(f"Unsupported index format in {path}")
+            vectors = data["vectors"].astype(np.float32, copy=False)
+            meta.pop("nprobe", None)  # written by earlier versions; the configured value applies
+            index = cls(dim=vectors.shape[1], nprobe=nprobe, min_train=min_train)
+            index._vectors = vectors
+            index._ids = [str(i) for i in data["ids"]]
+            index._assign = data["assign"].astype(np.int32, copy=False)
+            centroids = data["centroids"]
+        index._rows = {job_id: n for n, job_id in enumerate(index._ids)}
+        index._centroids = centroids if len(centroids) else None
+        index._trained_on = meta.pop("trained_on", 0)
+        index.meta = meta
+        return index
@@ -0,0 +1,167 @@
+# src/watchlist.py
+import re
+import math
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+# Import config with defaults for CI/testing
+try:
+    from config import WATCHLIST_FUZZY_THRESHOLD
+except ImportError:
+    WATCHLIST_FUZZY_THRESHOLD = 0.6  # token overlap (Jaccard) for a fuzzy match; 0 disables fuzzy matching
+
+# Legal-form words dropped from the end of company names before matching. Words
+# such as "group" or "holdings" stay: they tell "Capital Group" from "Capital One".
+_SUFFIXES = frozenset("""
+inc incorporated corp corporation co company ltd limited llc llp lp plc gmbh ag sa sas bv nv
+pty pvt private
+""".split())
+_WORD = re.compile(r"[^\W_]+")
+
+
+def company_tokens(name) -> Tuple[str, ...]:
+    """
+    Normalized words of a company name: casefolded, punctuation removed, a
+    leading "the" and trailing legal suffixes dropped, e.g. "Acme, Inc." ->
+    ("acme",) and "Johnson & Johnson Co." -> ("johnson", "and", "johnson").
+    A name made only of such words (e.g. "The Company") keeps them.
+    """
+    words = _WORD.findall(str(name or "").casefold().replace("&", " and "))
+    end = len(words)
+    while end and words[end - 1] in _SUFFIXES:
+        end -= 1
+    start = 1 if words and words[0] == "the" else 0
+    return tuple(words[start:end]) or tuple(words)
+
+
+def normalize_company(name) -> str:
+    return " ".join(company_tokens(name))
+
+
+class WatchlistMatcher:
+    """
+    Matches job companies against a watchlist through a precomputed index.
+
+    Names are compared after normalization (see company_tokens). In order of
+    preference a company matches a watchlist entry when:
+    - exact: the normalized names are equal ("ACME Corp." / "Acme Inc");
+    - prefix: the company is the watchlist name plus trailing words, on word
+      boundaries ("Google Cloud" / "Google", "Amazon Web Services" / "Amazon").
+      Not the other way round: a generic company name such as "Bank" or
+      "General" must not match "Bank of America" or "General Motors";
+    - fuzzy: their word sets overlap by at least `fuzzy_threshold` (Jaccard),
+      e.g. reordered or partly abbreviated names ("Bank of America Merrill
+      Lynch" / "Merrill Lynch Bank of America").
+    Each lookup costs a few dict probes per word of the company name,
+    independent of the watchlist size.
+    """
+
+    def __init__(self, names: Iterable[str], fuzzy_threshold: Optional[float] = None):
+        self.names: List[str] = []
+        self._exact: Dict[Tuple[str, ...], int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._token_sets: List[frozenset] = []
+        self._memo: Dict[str, Optional[str]] = {}
+        self.fuzzy_threshold = WATCHLIST_FUZZY_THRESHOLD if fuzzy_threshold is None else fuzzy_threshold
+        for name in names:
+            tokens = company_tokens(name)
+            if not tokens or tokens in self._exact:
+                continue
+            idx = len(self.names)
+            self.names.append(str(name).strip())
+            self._exact[tokens] = idx
+            distinct = frozenset(tokens)
+            self._token_sets.append(distinct)
+            for t in distinct:
+                self._postings.setdefault(t, []).append(idx)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def match(self, company) -> Optional[str]:
+        """The watchlist name `company` matches, or None (remembered per company)."""
+        key = str(company)
+        if key not in self._memo:
+            self._memo[key] = self._match(company)
+        return self._memo[key]
+
+    def _match(self, company) -> Optional[str]:
+        tokens = company_tokens(company)
+        if not tokens or not self.names:
+            return None
+        idx = self._exact.get(tokens)
+        if idx is None:
+            # the company extends a watchlist name: longest such name first
+            for k in range(len(tokens) - 1, 0, -1):
+                idx = self._exact.get(tokens[:k])
+                if idx is not None:
+                    break
+        if idx is None and self.fuzzy_threshold > 0:
+            idx = self._fuzzy(tokens)
+        return None if idx is None else self.names[idx]
+
+    def _fuzzy(self, tokens: Sequence[str]) -> Optional[int]:
+        distinct = set(tokens)
+        # prefix filter: a name with Jaccard >= threshold shares at least
+        # ceil(threshold * n) of the company's n words, so it must contain one
+        # of its (n - that + 1) rarest words; only those postings are scanned
+        rarest = sorted(distinct, key=lambda t: len(self._postings.get(t, ())))
+        probe = len(rarest) - math.ceil(self.fuzzy_threshold * len(rarest)) + 1
+        candidates = {i for t in rarest[:max(1, probe)] for i in self._postings.get(t, ())}
+        best, best_score = None, 0.0
+        for idx in sorted(candidates):
+            n = len(distinct & self._token_sets[idx])
+            score = n / (len(distinct) + len(self._token_sets[idx]) - n)
+            if score > best_score:
+                best, best_score = idx, score
+        return best if best_score >= self.fuzzy_threshold else None
+
+    # -----------------------------
+    # Columns of companies
+    # -----------------------------
+    def match_column(self, companies) -> np.ndarray:
+        """
+        Watchlist name matched by each company in `companies` (a list or a
+        pandas Series), None where there is none. Each distinct company is
+        looked up once and the results are broadcast back to every row.
+        """
+        codes, uniques = _factorize(companies)
+        found = np.empty(len(uniques) + 1, dtype=object)   # the last slot serves missing values
+        found[:-1] = [self.match(c) for c in uniques]
+        return found[codes]
+
+    def mask(self, companies) -> np.ndarray:
+        """Boolean array: does each company match the watchlist."""
+        codes, uniques = _factorize(companies)
+        hits = np.zeros(len(uniques) + 1, dtype=bool)
+        hits[:-1] = [self.match(c) is not None for c in uniques]
+        return hits[codes]
+
+    def filter(self, df, column: str = "company"):
+        """Rows of DataFrame `df` whose `column` matches the watchlist."""
+        if df is None or len(df) == 0 or column not in df:
+            return df.iloc[0:0] if df is not None else df
+        return df[self.mask(df[column])]
+
+
+def _factorize(values) -> Tuple[np.ndarray, Sequence]:
+    """(codes, uniques) with code -1 for missing values, like pandas.factorize."""
+    if hasattr(values, "iloc"):
+        import pandas as pd
+        codes, uniques = pd.factorize(values)
+        return codes, list(uniques)
+    index: Dict = {}
+    codes = np.fromiter(
+        (-1 if v is None else index.setdefault(v, len(index)) for v in values), dtype=np.int64
+    )
+    return codes, list(index)
+
+
+@lru_cache(maxsize=8)
+def _cached_matcher(names: Tuple[str, ...], fuzzy_threshold: Optional[float]) -> WatchlistMatcher:
+    return WatchlistMatcher(names, fuzzy_threshold)
+
+def get_watchlist_matcher(names: Iterable[str], fuzzy_threshold: Optional[float] = None) -> WatchlistMatcher:
+    """WatchlistMatcher for `names`, built once per distinct watchlist."""
+    return _cached_matcher(tuple(names), fuzzy_threshold)